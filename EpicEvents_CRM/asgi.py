@@ -9,8 +9,29 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+
+from EpicEvents_CRM.streaming import aiterate
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'EpicEvents_CRM.settings')
 
-application = get_asgi_application()
+
+class AsyncViewsASGIHandler(ASGIHandler):
+    # Resolve the requests with the URLconf of the async views
+    def create_request(self, scope, body_file):
+        request, error_response = super().create_request(scope, body_file)
+        if request is not None:
+            request.urlconf = settings.ASGI_URLCONF
+        return request, error_response
+
+    async def send_response(self, response, send):
+        # Sync streaming responses, e.g. the exports, are sent as they are read
+        if response.streaming and not response.is_async:
+            response.streaming_content = aiterate(response.streaming_content)
+        await super().send_response(response, send)
+
+
+django.setup(set_prefix=False)
+application = AsyncViewsASGIHandler()
@@ -0,0 +1,31 @@
+"""
+URLconf of the ASGI entry point: the URLconf of the WSGI entry point, with
+the async list and detail views.
+"""
+
+from django.urls import path
+
+import clients.views
+import contracts.views
+import events.views
+from EpicEvents_CRM import urls
+
+async_views = {
+    "client-list": clients.views.AsyncClientListCreateAPIView,
+    "client-detail": clients.views.AsyncClientDetailAPIView,
+    "contract-list": contracts.views.AsyncContractListCreateAPIView,
+    "contract-detail": contracts.views.AsyncContractDetailAPIView,
+    "event-list": events.views.AsyncEventListCreateAPIView,
+    "event-detail": events.views.AsyncEventDetailAPIView,
+}
+
+urlpatterns = [
+    (
+        path(
+            str(pattern.pattern), async_views[pattern.name].as_view(), name=pattern.name
+        )
+        if getattr(pattern, "name", None) in async_views
+        else pattern
+    )
+    for pattern in urls.urlpatterns
+]
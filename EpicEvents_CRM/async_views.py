@@ -0,0 +1,154 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.response import Response
+
+from authentication.models import User, UserRole
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.documents import DocumentDetailMixin
+from EpicEvents_CRM.mixins import check_mixin_order
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from EpicEvents_CRM.streaming import StreamingListMixin
+
+
+class AsyncAPIViewMixin:
+    """
+    Serve a DRF view as an async view, for the ASGI entry point.
+
+    Authenticators without ``aauthenticate()`` and sync handlers run in a
+    thread. Permission checks must not query the database.
+    """
+
+    # The sync handlers are run in a thread by dispatch()
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            if asyncio.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        await self.aperform_authentication(request)
+        # With the user set, perform_authentication() does not authenticate
+        # again, and the mixins extending initial() apply
+        self.initial(request, *args, **kwargs)
+
+    async def aperform_authentication(self, request):
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth_tuple = await authenticator.aauthenticate(request)
+                else:
+                    user_auth_tuple = await sync_to_async(authenticator.authenticate)(
+                        request
+                    )
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                break
+        else:
+            request._not_authenticated()
+
+        user = request.user
+        if isinstance(user, User) and not User.role.is_cached(user):
+            user.role = await UserRole.objects.aget_for_id(user.role_id)
+
+
+class AsyncListModelMixin:
+    """
+    ``alist()``, the async ``list()``. The paginator must implement
+    ``apaginate_queryset()``.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The list mixins' alist() end with this one
+        check_mixin_order(cls, StreamingListMixin, ListCacheMixin, AsyncListModelMixin)
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if self.paginator is not None:
+            page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(
+            [instance async for instance in queryset], many=True
+        )
+        return Response(serializer.data)
+
+
+class AsyncRetrieveModelMixin:
+    """
+    ``aretrieve()``, the async counterpart of ``retrieve()``, which the
+    detail mixins also implement.
+    """
+
+    # Whether the serializer reads rows itself, and must then run in a thread
+    serializer_reads_rows = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The detail mixins' aretrieve() end with this one
+        check_mixin_order(
+            cls, ConditionalDetailMixin, DocumentDetailMixin, AsyncRetrieveModelMixin
+        )
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        if self.serializer_reads_rows:
+            data = await sync_to_async(lambda: serializer.data)()
+        else:
+            data = serializer.data
+        return Response(data)
+
+    async def aget_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            obj = await queryset.aget(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class AsyncListMixin(AsyncAPIViewMixin):
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+class AsyncRetrieveMixin(AsyncAPIViewMixin):
+    async def get(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
@@ -0,0 +1,33 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Set of strings with false positives, at a rate of about
+    ``false_positive_rate`` once it holds ``capacity`` strings.
+    """
+
+    def __init__(self, capacity, false_positive_rate):
+        self.size = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: the positions h1 + i * h2 of a single digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
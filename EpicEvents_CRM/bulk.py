@@ -0,0 +1,264 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models.constants import LOOKUP_SEP
+from django.utils import timezone
+from django_filters.filterset import filterset_factory
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.validators import UniqueValidator
+
+from EpicEvents_CRM.response_cache import bump_generations
+
+
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField resolving its values from the objects loaded by
+    ``preload()``, and the other values as usual.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.preloaded = {}
+
+    def preload(self, values, select_related=()):
+        queryset = self.get_queryset()
+        pks = {self.to_pk(queryset.model, value) for value in values} - {None}
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        self.preloaded = queryset.in_bulk(pks) if pks else {}
+
+    def to_internal_value(self, data):
+        pk = self.to_pk(self.get_queryset().model, data)
+        if pk in self.preloaded:
+            return self.preloaded[pk]
+        return super().to_internal_value(data)
+
+    def to_pk(self, model, value):
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return model._meta.pk.to_python(value)
+        except DjangoValidationError:
+            return None
+
+
+class BulkCreateMixin:
+    """
+    Create every item of a JSON array posted to a list endpoint, in batches
+    of ``bulk_batch_size`` rows, or none if any is invalid.
+
+    Views check and complete each item in ``prepare_create()``, and do the
+    work of the signals in ``perform_bulk_create()``.
+    """
+
+    bulk_batch_size = 1000
+    bulk_max_items = 10_000
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.bulk_max_items,
+        )
+        self.validate_bulk(serializer)
+        model = serializer.child.Meta.model
+        instances = []
+        for validated_data in serializer.validated_data:
+            self.prepare_create(validated_data)
+            instances.append(model(**validated_data))
+        with transaction.atomic():
+            self.perform_bulk_create(instances)
+        serializer.instance = instances
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_create(self, serializer):
+        self.prepare_create(serializer.validated_data)
+        serializer.save()
+
+    def prepare_create(self, validated_data):
+        pass
+
+    def perform_bulk_create(self, instances):
+        model = type(instances[0])
+        model._default_manager.bulk_create(instances, batch_size=self.bulk_batch_size)
+        bump_generations(model)
+
+    def validate_bulk(self, serializer):
+        child = serializer.child
+        items = serializer.initial_data
+        if len(items) > self.bulk_max_items:
+            # Rejected by the validation without reading the items
+            items = []
+        items = [item for item in items if isinstance(item, dict)]
+        select_related = getattr(child.Meta, "select_related", [])
+
+        unique_fields = {}
+        for field_name, field in child.fields.items():
+            if field.read_only:
+                continue
+            if isinstance(field, PreloadedPrimaryKeyRelatedField):
+                prefix = field.source + LOOKUP_SEP
+                field.preload(
+                    [item.get(field_name) for item in items],
+                    [
+                        lookup[len(prefix) :]
+                        for lookup in select_related
+                        if lookup.startswith(prefix)
+                    ],
+                )
+            unique_validators = [
+                validator
+                for validator in field.validators
+                if isinstance(validator, UniqueValidator)
+            ]
+            if unique_validators:
+                # Checked for all the items at once below
+                field.validators = [
+                    validator
+                    for validator in field.validators
+                    if validator not in unique_validators
+                ]
+                unique_fields[field_name] = unique_validators[0]
+
+        serializer.is_valid(raise_exception=True)
+        self.validate_bulk_unique(serializer, unique_fields)
+
+    def validate_bulk_unique(self, serializer, unique_fields):
+        # Values already stored, or repeated within the items
+        errors = [{} for _ in serializer.validated_data]
+        for field_name, validator in unique_fields.items():
+            source = serializer.child.fields[field_name].source
+            values = [
+                validated_data.get(source)
+                for validated_data in serializer.validated_data
+            ]
+            keys = [getattr(value, "pk", value) for value in values]
+            taken = set(
+                validator.queryset.filter(
+                    **{f"{source}__in": {key for key in keys if key is not None}}
+                ).values_list(source, flat=True)
+            )
+            for index, key in enumerate(keys):
+                if key is None:
+                    continue
+                if key in taken:
+                    errors[index][field_name] = [validator.message]
+                taken.add(key)
+        if any(errors):
+            raise ValidationError(errors)
+
+
+class BulkUpdateSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=10_000,
+    )
+    filter = serializers.DictField(required=False, allow_empty=False)
+    patch = serializers.DictField(allow_empty=False)
+
+    def validate(self, attrs):
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Give either ids or a filter.")
+        return attrs
+
+
+class BulkUpdateMixin:
+    """
+    Patch the ``bulk_update_fields`` of the items given by ``ids`` or by a
+    ``filter`` on the ``bulk_filter_fields``, with one UPDATE.
+
+    Only the items owned by the user in ``bulk_owner_field`` are updated.
+    Views do the work of the signals in ``perform_bulk_update()``.
+    """
+
+    bulk_owner_field = "sales_contact"
+    bulk_filter_fields = ()
+    bulk_update_fields = ()
+
+    def patch(self, request, *args, **kwargs):
+        request_serializer = BulkUpdateSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        data = request_serializer.validated_data
+        values = self.get_bulk_values(data["patch"])
+
+        queryset = self.get_queryset()
+        with transaction.atomic():
+            if "ids" in data:
+                ids = list(dict.fromkeys(data["ids"]))
+                owners = dict(
+                    queryset.filter(pk__in=ids)
+                    .select_for_update()
+                    .values_list("pk", self.bulk_owner_field)
+                )
+                updated, forbidden, not_found = [], [], []
+                for pk in ids:
+                    if pk not in owners:
+                        not_found.append(pk)
+                    elif owners[pk] == request.user.pk:
+                        updated.append(pk)
+                    else:
+                        forbidden.append(pk)
+            else:
+                queryset = self.filter_bulk_queryset(
+                    queryset.filter(**{self.bulk_owner_field: request.user}),
+                    data["filter"],
+                )
+                updated = list(
+                    queryset.select_for_update().values_list("pk", flat=True)
+                )
+                forbidden = not_found = []
+            if updated:
+                self.perform_bulk_update(updated, values)
+
+        return Response(
+            {"updated": updated, "forbidden": forbidden, "not_found": not_found}
+        )
+
+    def get_bulk_values(self, patch):
+        unknown_fields = set(patch) - set(self.bulk_update_fields)
+        if unknown_fields:
+            raise ValidationError(
+                {
+                    "patch": [
+                        f"Cannot be updated in bulk: {field_name}."
+                        for field_name in sorted(unknown_fields)
+                    ]
+                }
+            )
+        serializer = self.get_serializer(data=patch, partial=True)
+        if not serializer.is_valid():
+            raise ValidationError({"patch": serializer.errors})
+        return serializer.validated_data
+
+    def filter_bulk_queryset(self, queryset, filter_data):
+        unknown_fields = set(filter_data) - set(self.bulk_filter_fields)
+        if unknown_fields:
+            raise ValidationError(
+                {
+                    "filter": [
+                        f"Unknown filter: {field_name}."
+                        for field_name in sorted(unknown_fields)
+                    ]
+                }
+            )
+        filterset_class = filterset_factory(
+            queryset.model, fields=list(self.bulk_filter_fields)
+        )
+        filterset = filterset_class(data=filter_data, queryset=queryset)
+        if not filterset.is_valid():
+            raise ValidationError({"filter": filterset.errors})
+        return filterset.qs
+
+    def perform_bulk_update(self, ids, values):
+        model = self.get_queryset().model
+        model._default_manager.filter(pk__in=ids).update(
+            **values, date_updated=timezone.now()
+        )
+        bump_generations(model)
@@ -0,0 +1,83 @@
+from django.db.models.functions import Coalesce
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+# Stamped on every save of the object or of a related row it shows
+LAST_MODIFIED = Coalesce("date_updated", "date_created")
+
+
+class ConditionalDetailMixin:
+    """
+    ETag and Last-Modified validators for the detail views, read from the
+    object's ``date_updated`` without loading the object.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().retrieve, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        etag, last_modified = await aread_validators(self.get_validators_queryset())
+        response = self.get_precondition_response(request, etag, last_modified)
+        if response is None:
+            response = await super().aretrieve(request, *args, **kwargs)
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def update(self, request, *args, **kwargs):
+        return self.conditional_response(request, super().update, *args, **kwargs)
+
+    def conditional_response(self, request, handler, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        response = self.get_precondition_response(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD"):
+            # The object changed, return its new validators
+            etag, last_modified = self.get_validators()
+        self.set_validators(response, etag, last_modified)
+        return response
+
+    def get_precondition_response(self, request, etag, last_modified):
+        # Kept for the handler, e.g. to serve a document built for this version
+        self.etag = etag
+        # Unknown objects are left to the handler, which returns a 404
+        if etag is None:
+            return None
+        return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+    def set_validators(self, response, etag, last_modified):
+        if etag is not None and response.status_code == 200:
+            response.headers["ETag"] = etag
+            response.headers["Last-Modified"] = http_date(last_modified)
+
+    def get_validators(self):
+        return read_validators(self.get_validators_queryset())
+
+    def get_validators_queryset(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return self.get_queryset().filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+
+
+def read_validators(queryset):
+    """
+    Return the ETag and Last-Modified timestamp of the object in
+    ``queryset``, or (None, None) when it is empty.
+    """
+    return format_validators(queryset.values_list(LAST_MODIFIED, flat=True).first())
+
+
+async def aread_validators(queryset):
+    return format_validators(
+        await queryset.values_list(LAST_MODIFIED, flat=True).afirst()
+    )
+
+
+def format_validators(last_modified):
+    if last_modified is None:
+        return None, None
+    timestamp = last_modified.timestamp()
+    return quote_etag(f"{timestamp:.6f}"), int(timestamp)
@@ -0,0 +1,142 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, transaction
+from django.http import HttpRequest, HttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.mixins import check_mixin_order
+from EpicEvents_CRM.replicas import get_read_database
+
+
+class DetailDocument(models.Model):
+    """
+    Rendered JSON of an object's detail, served by DocumentDetailMixin for
+    the ETag it was built for. Subclasses add a one-to-one primary key.
+    """
+
+    class Meta:
+        abstract = True
+
+    etag = models.CharField(max_length=64)
+    # Scheme and host of the links in the document
+    base_url = models.CharField(max_length=200)
+    content = models.TextField()
+
+
+class DocumentDetailMixin:
+    """
+    Serve the JSON GET requests of a detail view from ``document_model``,
+    storing the missing or outdated documents.
+    """
+
+    document_model = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Serves the document of the ETag ConditionalDetailMixin read
+        if not issubclass(cls, ConditionalDetailMixin):
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must extend ConditionalDetailMixin."
+            )
+        check_mixin_order(cls, ConditionalDetailMixin, DocumentDetailMixin)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.serves_document(request):
+            return super().retrieve(request, *args, **kwargs)
+
+        pk, base_url = self.get_document_key(request)
+        content = self.get_document_queryset(pk, base_url).first()
+        if content is not None:
+            return HttpResponse(content, content_type="application/json")
+
+        response = super().retrieve(request, *args, **kwargs)
+        if response.status_code == 200:
+            self.store_document(pk, self.etag, base_url, render_document(response.data))
+        return response
+
+    async def aretrieve(self, request, *args, **kwargs):
+        if not self.serves_document(request):
+            return await super().aretrieve(request, *args, **kwargs)
+
+        pk, base_url = self.get_document_key(request)
+        content = await self.get_document_queryset(pk, base_url).afirst()
+        if content is not None:
+            return HttpResponse(content, content_type="application/json")
+
+        response = await super().aretrieve(request, *args, **kwargs)
+        if response.status_code == 200:
+            await self.astore_document(
+                pk, self.etag, base_url, render_document(response.data)
+            )
+        return response
+
+    def serves_document(self, request):
+        return (
+            settings.DETAIL_DOCUMENTS
+            and getattr(self, "etag", None) is not None
+            and not request.query_params
+            and request.accepted_renderer.format == "json"
+        )
+
+    def get_document_key(self, request):
+        pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return pk, request.build_absolute_uri("/")
+
+    def get_document_queryset(self, pk, base_url):
+        return self.document_model.objects.filter(
+            pk=pk, etag=self.etag, base_url=base_url
+        ).values_list("content", flat=True)
+
+    def store_document(self, pk, etag, base_url, content):
+        if get_read_database() is not None:
+            return
+        self.document_model.objects.bulk_create(
+            [self.document_model(pk=pk, etag=etag, base_url=base_url, content=content)],
+            **self.get_upsert_options(),
+        )
+
+    async def astore_document(self, pk, etag, base_url, content):
+        if get_read_database() is not None:
+            return
+        await self.document_model.objects.abulk_create(
+            [self.document_model(pk=pk, etag=etag, base_url=base_url, content=content)],
+            **self.get_upsert_options(),
+        )
+
+    def get_upsert_options(self):
+        # Insert or replace the document in a single query
+        return {
+            "update_conflicts": True,
+            "unique_fields": [self.document_model._meta.pk.name],
+            "update_fields": ["etag", "base_url", "content"],
+        }
+
+
+def delete_documents(queryset):
+    """Delete the documents in ``queryset``, now and once the transaction commits."""
+    queryset.delete()
+    # Documents built meanwhile from the rows before the commit
+    transaction.on_commit(queryset.delete)
+
+
+def render_document(data):
+    return JSONRenderer().render(data).decode()
+
+
+class DocumentRequest(HttpRequest):
+    # GET request with the scheme and host of base_url, for the document's links
+    def __init__(self, base_url, path):
+        super().__init__()
+        self._scheme, host = base_url.rstrip("/").split("://")
+        self.method = "GET"
+        self.path = self.path_info = path
+        self.META["HTTP_HOST"] = host
+
+    def _get_scheme(self):
+        return self._scheme
+
+
+def build_document_request(base_url, path):
+    return Request(DocumentRequest(base_url, path))
@@ -0,0 +1,139 @@
+import csv
+import re
+
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from EpicEvents_CRM.mixins import check_mixin_order
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from EpicEvents_CRM.streaming import StreamingListMixin
+
+re_accepts_gzip = re.compile(r"\bgzip\b")
+# Cells spreadsheets read as formulas, apart from signed numbers
+re_formula = re.compile(r"[=+\-@\t\r]")
+re_number = re.compile(r"[+-]?\d+(\.\d+)?")
+
+
+class _Echo:
+    # File-like object handing back what the csv writer writes
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        fields = list(rows[0]) if rows else []
+        return "".join(self.render_rows(fields, rows))
+
+    def render_rows(self, fields, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([escape_cell(row[field]) for field in fields])
+
+
+def escape_cell(value):
+    # A leading quote keeps user-entered text such as "=HYPERLINK(...)" from
+    # running as a formula when the file is opened in a spreadsheet
+    if value is None:
+        return ""
+    if (
+        isinstance(value, str)
+        and re_formula.match(value)
+        and not re_number.fullmatch(value)
+    ):
+        return f"'{value}"
+    return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = data if isinstance(data, list) else [data]
+        return "".join(self.render_rows(list(rows[0]) if rows else [], rows))
+
+    def render_rows(self, fields, rows):
+        # Same output as DRF's JSONRenderer, one row per line
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for row in rows:
+            yield encoder.encode(row) + "\n"
+
+
+class ExportMixin:
+    """
+    Stream the whole list as a CSV or NDJSON file, e.g. with ``?format=csv``
+    or an ``Accept: application/x-ndjson`` header.
+
+    Rows are read from a ``WITH HOLD`` cursor, outside a transaction.
+    """
+
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+    export_chunk_size = 2000
+    export_filename = "export"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Replaces the list, which is neither streamed as JSON nor cached
+        check_mixin_order(cls, ExportMixin, StreamingListMixin, ListCacheMixin)
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # A transaction would stay open until the download ends
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            self.join_lines(
+                renderer.render_rows(
+                    list(serializer.fields), self.read_rows(queryset, serializer)
+                )
+            ),
+            content_type=f"{renderer.media_type}; charset={renderer.charset}",
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{renderer.format}"'
+        )
+        if re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            response.streaming_content = compress_sequence(response.streaming_content)
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+        return response
+
+    def read_rows(self, queryset, serializer):
+        # Outside a transaction, the cursor is declared WITH HOLD: the rows
+        # are read when it is declared, and kept until they are all sent
+        for instance in queryset.iterator(chunk_size=self.export_chunk_size):
+            yield serializer.to_representation(instance)
+
+    def join_lines(self, lines):
+        # Fewer and larger writes than one per row
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= self.export_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        yield "".join(chunk)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if isinstance(response, Response) and response.exception:
+            # Errors are rendered as JSON, whatever the export format
+            request.accepted_renderer = JSONRenderer()
+            request.accepted_media_type = JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
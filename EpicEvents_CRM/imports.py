@@ -0,0 +1,278 @@
+import csv
+import json
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError
+from django.db import connection, models, transaction
+
+STAGING_TABLE = "import_staging"
+
+
+class ImportKey(models.Model):
+    """
+    Key of an imported row in the system it was imported from. Subclasses
+    add a one-to-one primary key.
+    """
+
+    class Meta:
+        abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "key"], name="%(app_label)s_%(class)s_unique"
+            )
+        ]
+
+    # Name of the system the row was imported from
+    source = models.CharField(max_length=50)
+    key = models.CharField(max_length=100)
+
+
+@dataclass
+class Reference:
+    """
+    A foreign key of the imported model, given in the file by a value of
+    ``lookup_field`` of ``lookup_model``, e.g. a status by its code.
+    """
+
+    name: str
+    lookup_model: type
+    lookup_field: str
+    # Field of lookup_model holding the primary key of the referred row
+    value_field: str = "id"
+    required: bool = True
+    default: str = None
+    # Whether the lookup is an ImportKey of the same source
+    by_source: bool = False
+
+
+def read_records(path, file_format):
+    # Line numbers and records of a CSV or NDJSON file
+    with open(path, newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_number, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        yield line_number, json.loads(line)
+                    except ValueError:
+                        yield line_number, None
+
+
+class Importer:
+    """
+    Load rows of ``model`` from a file, in batches, through Postgres COPY.
+
+    Neither ``Model.save()`` nor the signals run: ``extra_columns`` and
+    ``after_merge()`` do their work instead.
+    """
+
+    model = None
+    key_model = None
+    # Fields read from the file, validated by the model fields
+    fields = []
+    references = []
+    # Staging column telling whether a row was already imported
+    natural_key = "key"
+    # Other inserted columns, as SQL expressions on the staging table "s"
+    extra_columns = {}
+
+    def __init__(self, source):
+        self.source = source
+
+    def clean_record(self, record):
+        """
+        Return the staging values of a record and the errors found, by field.
+        """
+        values = {}
+        errors = {}
+        if self.key_model is not None:
+            key = str(record.get("key") or "").strip()
+            max_length = self.key_model._meta.get_field("key").max_length
+            if not key:
+                errors["key"] = ["This field is required."]
+            elif len(key) > max_length:
+                errors["key"] = [
+                    f"Ensure this field has at most {max_length} characters."
+                ]
+            values["key"] = key
+        for field_name in self.fields:
+            field = self.model._meta.get_field(field_name)
+            value = record.get(field_name)
+            if value is None or value == "":
+                # Missing values of nullable fields are null, as in the API
+                if field.null:
+                    values[field.column] = None
+                    continue
+                value = ""
+            try:
+                values[field.column] = field.clean(value, None)
+            except ValidationError as error:
+                errors[field_name] = error.messages
+        for reference in self.references:
+            value = str(record.get(reference.name) or "").strip() or reference.default
+            if value is None and reference.required:
+                errors[reference.name] = ["This field is required."]
+            values[f"{reference.name}_value"] = value
+        return values, errors
+
+    # Staging table
+
+    def get_staging_columns(self):
+        columns = {"line": "integer", "id": "bigint"}
+        if self.key_model is not None:
+            columns["key"] = "text"
+        for field_name in self.fields:
+            field = self.model._meta.get_field(field_name)
+            columns[field.column] = field.db_type(connection)
+        for reference in self.references:
+            field = self.model._meta.get_field(reference.name)
+            columns[f"{reference.name}_value"] = "text"
+            columns[field.column] = field.db_type(connection)
+        return columns
+
+    def copy_to_staging(self, cursor, rows):
+        columns = self.get_staging_columns()
+        cursor.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ("
+            + ", ".join(f"{name} {db_type}" for name, db_type in columns.items())
+            + ") ON COMMIT DROP"
+        )
+        copied_columns = list(rows[0])
+        with cursor.cursor.copy(
+            f"COPY {STAGING_TABLE} ({', '.join(copied_columns)}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row([row[name] for name in copied_columns])
+
+    # Merge
+
+    def merge(self, cursor):
+        """
+        Merge the staging table into the model's table, and return the errors
+        by line, and the number of rows imported and skipped.
+        """
+        errors = self.resolve_references(cursor)
+        skipped = self.delete_imported(cursor)
+        # Primary keys in the order of the file
+        cursor.execute(
+            f"UPDATE {STAGING_TABLE} s SET id = n.id FROM ("
+            f"SELECT line, nextval(pg_get_serial_sequence(%s, %s)) AS id "
+            f"FROM (SELECT line FROM {STAGING_TABLE} ORDER BY line) o) n "
+            f"WHERE n.line = s.line",
+            [self.model._meta.db_table, self.model._meta.pk.column],
+        )
+
+        columns = [self.model._meta.pk.column]
+        expressions = ["s.id"]
+        for field_name in self.fields:
+            column = self.model._meta.get_field(field_name).column
+            columns.append(column)
+            expressions.append(f"s.{column}")
+        for reference in self.references:
+            column = self.model._meta.get_field(reference.name).column
+            columns.append(column)
+            expressions.append(f"s.{column}")
+        for column, expression in self.extra_columns.items():
+            columns.append(column)
+            expressions.append(expression)
+        cursor.execute(
+            f"INSERT INTO {self.model._meta.db_table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(expressions)} FROM {STAGING_TABLE} s"
+        )
+        imported = cursor.rowcount
+        if self.key_model is not None:
+            object_column = self.key_model._meta.pk.column
+            cursor.execute(
+                f"INSERT INTO {self.key_model._meta.db_table} "
+                f"({object_column}, source, key) "
+                f"SELECT id, %s, key FROM {STAGING_TABLE}",
+                [self.source],
+            )
+        self.after_merge(cursor)
+        return errors, imported, skipped
+
+    def resolve_references(self, cursor):
+        errors = {}
+        for reference in self.references:
+            column = self.model._meta.get_field(reference.name).column
+            lookup_table = reference.lookup_model._meta.db_table
+            lookup_column = reference.lookup_model._meta.get_field(
+                reference.lookup_field
+            ).column
+            value_column = reference.lookup_model._meta.get_field(
+                reference.value_field
+            ).column
+            condition = f"r.{lookup_column} = s.{reference.name}_value"
+            params = []
+            if reference.by_source:
+                condition += " AND r.source = %s"
+                params.append(self.source)
+            cursor.execute(
+                f"UPDATE {STAGING_TABLE} s SET {column} = r.{value_column} "
+                f"FROM {lookup_table} r WHERE {condition}",
+                params,
+            )
+            cursor.execute(
+                f"SELECT line, {reference.name}_value FROM {STAGING_TABLE} "
+                f"WHERE {reference.name}_value IS NOT NULL AND {column} IS NULL"
+            )
+            for line, value in cursor.fetchall():
+                errors.setdefault(line, {})[reference.name] = [
+                    f"Unknown {reference.name.replace('_', ' ')}: {value}."
+                ]
+        if errors:
+            cursor.execute(
+                f"DELETE FROM {STAGING_TABLE} WHERE line = ANY(%s)", [list(errors)]
+            )
+        return errors
+
+    def delete_imported(self, cursor):
+        # Rows repeated within the batch, then rows imported before
+        cursor.execute(
+            f"DELETE FROM {STAGING_TABLE} WHERE line NOT IN ("
+            f"SELECT min(line) FROM {STAGING_TABLE} GROUP BY {self.natural_key})"
+        )
+        skipped = cursor.rowcount
+        if self.key_model is not None:
+            cursor.execute(
+                f"DELETE FROM {STAGING_TABLE} s USING "
+                f"{self.key_model._meta.db_table} k "
+                f"WHERE k.source = %s AND k.key = s.key",
+                [self.source],
+            )
+        else:
+            cursor.execute(
+                f"DELETE FROM {STAGING_TABLE} s USING {self.model._meta.db_table} t "
+                f"WHERE t.{self.natural_key} = s.{self.natural_key}"
+            )
+        return skipped + cursor.rowcount
+
+    def after_merge(self, cursor):
+        pass
+
+    def import_batch(self, batch):
+        """
+        Import a batch of ``(line, record)`` and return the errors by line,
+        and the number of rows imported and skipped.
+        """
+        errors = {}
+        rows = []
+        for line, record in batch:
+            if not isinstance(record, dict):
+                errors[line] = {"record": ["Not a JSON object."]}
+                continue
+            values, record_errors = self.clean_record(record)
+            if record_errors:
+                errors[line] = record_errors
+            else:
+                rows.append({"line": line, **values})
+        if not rows:
+            return errors, 0, 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.copy_to_staging(cursor, rows)
+            merge_errors, imported, skipped = self.merge(cursor)
+        return {**errors, **merge_errors}, imported, skipped
@@ -0,0 +1,125 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+
+class LookupManager(models.Manager):
+    """
+    Manager for the small role and status tables, loaded once per process
+    and reloaded when another worker changed them.
+    """
+
+    check_interval = 1
+
+    def __init__(self, code_field):
+        super().__init__()
+        self.code_field = code_field
+        # Mutated in place, as Django hands out shallow copies of the manager
+        self._cache = {}
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        if not cls._meta.abstract:
+            post_save.connect(self._invalidate, sender=cls, weak=False)
+            post_delete.connect(self._invalidate, sender=cls, weak=False)
+
+    @property
+    def _generation_key(self):
+        return f"lookups:{self.model._meta.label_lower}"
+
+    def _shared_generation(self):
+        return caches[settings.LOOKUP_CACHE_ALIAS].get(self._generation_key, 0)
+
+    def _get_current_snapshot(self):
+        snapshot = self._cache.get("snapshot")
+        if snapshot is None:
+            return None
+        now = time.monotonic()
+        if now - self._cache["checked_at"] < self.check_interval:
+            return snapshot
+        if snapshot[0] != self._shared_generation():
+            return None
+        self._cache["checked_at"] = now
+        return snapshot
+
+    def _load(self):
+        snapshot = self._get_current_snapshot()
+        if snapshot is None:
+            snapshot = self._store(self._shared_generation(), list(self.all()))
+        return snapshot
+
+    async def _aload(self):
+        # Same as _load(), reading the rows through the async ORM
+        snapshot = self._get_current_snapshot()
+        if snapshot is None:
+            generation = self._shared_generation()
+            snapshot = self._store(generation, [row async for row in self.all()])
+        return snapshot
+
+    def _store(self, generation, rows):
+        snapshot = (
+            generation,
+            {getattr(row, self.code_field): row for row in rows},
+            {row.pk: row for row in rows},
+        )
+        self._cache["snapshot"] = snapshot
+        self._cache["checked_at"] = time.monotonic()
+        return snapshot
+
+    def get_by_code(self, code):
+        generation, by_code, by_id = self._load()
+        try:
+            return by_code[code]
+        except KeyError:
+            raise self.model.DoesNotExist(
+                f"{self.model.__name__} matching {self.code_field}={code!r} "
+                f"does not exist."
+            )
+
+    async def aget_by_code(self, code):
+        generation, by_code, by_id = await self._aload()
+        try:
+            return by_code[code]
+        except KeyError:
+            raise self.model.DoesNotExist(
+                f"{self.model.__name__} matching {self.code_field}={code!r} "
+                f"does not exist."
+            )
+
+    def get_for_id(self, pk):
+        generation, by_code, by_id = self._load()
+        try:
+            return by_id[pk]
+        except KeyError:
+            raise self.model.DoesNotExist(
+                f"{self.model.__name__} matching pk={pk!r} does not exist."
+            )
+
+    async def aget_for_id(self, pk):
+        generation, by_code, by_id = await self._aload()
+        try:
+            return by_id[pk]
+        except KeyError:
+            raise self.model.DoesNotExist(
+                f"{self.model.__name__} matching pk={pk!r} does not exist."
+            )
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _bump_generation(self):
+        cache = caches[settings.LOOKUP_CACHE_ALIAS]
+        cache.add(self._generation_key, 0, timeout=None)
+        try:
+            cache.incr(self._generation_key)
+        except ValueError:
+            # The key was evicted between add() and incr()
+            cache.set(self._generation_key, 1, timeout=None)
+
+    def _invalidate(self, sender, using=None, **kwargs):
+        self.clear_cache()
+        # Other workers must only reload once the change is visible to them
+        transaction.on_commit(self._bump_generation, using=using)
@@ -0,0 +1,12 @@
+from django.core.exceptions import ImproperlyConfigured
+
+
+def check_mixin_order(cls, *mixins):
+    # The view mixins overriding the same handlers only work in this order
+    found = [base for base in cls.__mro__ if base in mixins]
+    expected = [mixin for mixin in mixins if mixin in found]
+    if found != expected:
+        raise ImproperlyConfigured(
+            f"{cls.__name__} must list "
+            f"{', '.join(mixin.__name__ for mixin in expected)} in this order."
+        )
@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from django.db import models
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class Row(models.Func):
+    # Row value, e.g. ("date_created", "id"), compared column by column
+    template = "(%(expressions)s)"
+    output_field = models.Field()
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination on the (date_created, id) keyset, so that any page
+    costs the same as the first one.
+    """
+
+    ordering = ("date_created", "id")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        # Same as paginate_queryset(), reading the page through the async ORM
+        queryset = self.get_page_queryset(queryset, request)
+        if queryset is None:
+            return None
+        return self.set_page([instance async for instance in queryset])
+
+    def get_page_queryset(self, queryset, request):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.reverse = self.cursor is not None and self.cursor.reverse
+        self.position = self.cursor and self.decode_position(self.cursor.position)
+
+        if self.reverse:
+            queryset = queryset.order_by(*[f"-{field}" for field in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if self.position is not None:
+            lookup = "keyset__lt" if self.reverse else "keyset__gt"
+            queryset = queryset.alias(keyset=Row(*self.ordering)).filter(
+                **{lookup: Row(*[models.Value(value) for value in self.position])}
+            )
+
+        # Fetch one extra row to know whether there is a following page
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, results):
+        self.page = results[: self.page_size]
+        has_following = len(results) > self.page_size
+        has_preceding = self.position is not None
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = has_preceding, has_following
+        else:
+            self.has_next, self.has_previous = has_following, has_preceding
+
+        self.display_page_controls = self.template is not None and (
+            self.has_next or self.has_previous
+        )
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = self.encode_position(self.page[-1]) if self.page else None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self.encode_position(self.page[0]) if self.page else None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def encode_position(self, instance):
+        return f"{instance.date_created.isoformat()}|{instance.pk}"
+
+    def decode_position(self, position):
+        if position is None:
+            return None
+        try:
+            date_created, pk = position.split("|")
+            return datetime.fromisoformat(date_created), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base, creation
+from django.utils.asyncio import async_unsafe
+from psycopg import IsolationLevel
+from psycopg_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    # The pooled connections to a database would prevent dropping it, and
+    # outlive the renaming of the test database
+
+    def create_test_db(self, *args, **kwargs):
+        self.connection.close_pool()
+        return super().create_test_db(*args, **kwargs)
+
+    def destroy_test_db(self, *args, **kwargs):
+        self.connection.close_pool()
+        return super().destroy_test_db(*args, **kwargs)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend taking its connections from a psycopg pool, with the
+    options in ``OPTIONS["pool"]``. ``CONN_MAX_AGE`` must be 0.
+    """
+
+    creation_class = DatabaseCreation
+    pool_stats_interval = 60
+
+    # Pools of the process, by alias
+    _connection_pools = {}
+    _pools_lock = threading.Lock()
+    _stats_logged_at = {}
+    # Pool of the current connection
+    _connection_pool = None
+
+    @property
+    def pool(self):
+        # The connections to the default 'postgres' db are not pooled
+        if self.alias == NO_DB_ALIAS:
+            return None
+        pool = self._connection_pools.get(self.alias)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._connection_pools.get(self.alias)
+                if pool is None:
+                    pool = self.create_pool()
+                    self._connection_pools[self.alias] = pool
+        return pool
+
+    def create_pool(self):
+        if self.settings_dict["CONN_MAX_AGE"] != 0:
+            raise ImproperlyConfigured(
+                "Pooled connections require CONN_MAX_AGE = 0, as they are "
+                "given back to the pool at the end of each request."
+            )
+        pool = ConnectionPool(
+            kwargs=self.get_connection_params(),
+            name=self.alias,
+            check=ConnectionPool.check_connection,
+            open=False,
+            **self.settings_dict["OPTIONS"].get("pool", {}),
+        )
+        pool.open()
+        self._stats_logged_at[self.alias] = time.monotonic()
+        return pool
+
+    def close_pool(self):
+        self.close()
+        pool = self._connection_pools.pop(self.alias, None)
+        if pool is not None:
+            pool.close()
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        if self.pool is None:
+            return super().get_new_connection(conn_params)
+
+        self._connection_pool = self.pool
+        connection = self._connection_pool.getconn()
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = IsolationLevel(
+            options.get("isolation_level", IsolationLevel.READ_COMMITTED)
+        )
+        if "isolation_level" in options:
+            connection.isolation_level = self.isolation_level
+        self.log_pool_stats()
+        return connection
+
+    def _close(self):
+        # Connections of a closed pool are closed
+        pool, self._connection_pool = self._connection_pool, None
+        if self.connection is None or pool is None or pool.closed:
+            return super()._close()
+        with self.wrap_database_errors:
+            # Rolled back by the pool if a transaction is open
+            pool.putconn(self.connection)
+
+    def get_pool_stats(self):
+        return self.pool.get_stats()
+
+    def log_pool_stats(self):
+        now = time.monotonic()
+        if now - self._stats_logged_at[self.alias] < self.pool_stats_interval:
+            return
+        self._stats_logged_at[self.alias] = now
+        # Counters since the previous report
+        stats = self.pool.pop_stats()
+        requests = stats.get("requests_num", 0)
+        logger.info(
+            "Connection pool %s: %d connections, %d idle, %d requests waiting; "
+            "%d requests, %.1f ms average wait, %d timeouts, %d connections lost",
+            self.alias,
+            stats["pool_size"],
+            stats["pool_available"],
+            stats["requests_waiting"],
+            requests,
+            stats.get("requests_wait_ms", 0) / requests if requests else 0,
+            stats.get("requests_errors", 0),
+            stats.get("connections_lost", 0) + stats.get("returns_bad", 0),
+        )
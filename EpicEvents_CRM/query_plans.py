@@ -0,0 +1,172 @@
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import permissions
+from rest_framework.exceptions import ValidationError
+
+
+class QueryPlanMixin:
+    """
+    Build the view's queryset from the ``select_related`` and
+    ``prefetch_related`` of its serializer's Meta, loading only the rendered
+    columns. GET requests may ask for some fields only, with ``?fields=``.
+    """
+
+    fields_query_param = "fields"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The plan applies to the queryset of the bases after it, e.g. the
+        # role scopes, which do not call super()
+        for base in cls.__mro__[1 : cls.__mro__.index(QueryPlanMixin)]:
+            if "get_queryset" in vars(base):
+                raise ImproperlyConfigured(
+                    f"{cls.__name__} must list QueryPlanMixin before "
+                    f"{base.__name__}."
+                )
+
+    def get_queryset(self):
+        # Only reads may leave columns out, as saving a partly loaded object
+        # would only save the loaded fields
+        return apply_query_plan(
+            super().get_queryset(),
+            self.get_serializer_class(),
+            self.get_requested_fields(),
+            only=self.request.method in permissions.SAFE_METHODS,
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_requested_fields()
+        if fields is not None:
+            child = getattr(serializer, "child", serializer)
+            for field_name in set(child.fields) - set(fields):
+                child.fields.pop(field_name)
+        return serializer
+
+    def get_requested_fields(self):
+        if self.request.method not in permissions.SAFE_METHODS:
+            return None
+        value = self.request.query_params.get(self.fields_query_param)
+        if not value:
+            return None
+        fields = [field_name.strip() for field_name in value.split(",")]
+        unknown_fields = set(fields) - set(self.get_serializer_class()().fields)
+        if unknown_fields:
+            raise ValidationError(
+                {
+                    self.fields_query_param: [
+                        f"Unknown field: {field_name}."
+                        for field_name in sorted(unknown_fields)
+                    ]
+                }
+            )
+        return fields
+
+
+def apply_query_plan(queryset, serializer_class, fields=None, only=True):
+    """
+    Join and prefetch the relations of ``fields`` (all the serializer's fields
+    by default) and, with ``only``, load no other column of the table.
+    """
+    if queryset is None:
+        return queryset
+    meta = serializer_class.Meta
+    select_related = getattr(meta, "select_related", [])
+    prefetch_related = getattr(meta, "prefetch_related", [])
+    roots = get_field_roots(serializer_class, fields)
+
+    if fields is not None:
+        # Only the relations of the requested fields
+        select_related = [
+            lookup for lookup in select_related if lookup.split(LOOKUP_SEP)[0] in roots
+        ]
+        prefetch_related = [
+            lookup
+            for lookup in prefetch_related
+            if lookup.split(LOOKUP_SEP)[0] in roots
+        ]
+    if only:
+        columns = get_columns(queryset.model, roots)
+        if columns is not None:
+            sources = get_field_sources(serializer_class, fields)
+            queryset = queryset.only(
+                *columns,
+                *get_related_columns(queryset.model, select_related, sources),
+            )
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def get_field_roots(serializer_class, fields=None):
+    # The model attribute each field is read from, e.g. "client" for a field
+    # with source "client.company_name". Method fields are expected to read
+    # the attribute of the same name, if any.
+    return {
+        source.split(".")[0] for source in get_field_sources(serializer_class, fields)
+    }
+
+
+def get_field_sources(serializer_class, fields=None):
+    serializer_fields = serializer_class().fields
+    sources = set()
+    for field_name in serializer_fields if fields is None else fields:
+        source = serializer_fields[field_name].source
+        sources.add(field_name if source == "*" else source)
+    return sources
+
+
+def get_columns(model, roots):
+    """
+    Return the fields to load for ``roots``, or None when a root is not a
+    field (e.g. a model method), whose columns are unknown.
+    """
+    columns = {model._meta.pk.name}
+    # The ordering, used by the keyset pagination
+    columns.update(field_name.lstrip("-") for field_name in model._meta.ordering)
+    for root in roots:
+        try:
+            field = model._meta.get_field(root)
+        except FieldDoesNotExist:
+            if hasattr(model, root):
+                return None
+            # A method field reading other objects, e.g. from a query
+            continue
+        if field.concrete:
+            columns.add(field.name)
+    return sorted(columns)
+
+
+def get_related_columns(model, select_related, sources=()):
+    """
+    Return the fields to load from the joined rows: the ``str_fields`` of
+    their model and the dotted ``sources``. Rows without ``str_fields`` are
+    loaded whole.
+    """
+    columns = set()
+    projected = set()
+    for lookup in select_related:
+        names = lookup.split(LOOKUP_SEP)
+        related_model = model
+        for index, name in enumerate(names):
+            related_model = related_model._meta.get_field(name).related_model
+            str_fields = getattr(related_model, "str_fields", None)
+            if str_fields is None:
+                break
+            path = LOOKUP_SEP.join(names[: index + 1])
+            projected.add(path)
+            columns.update(
+                f"{path}{LOOKUP_SEP}{field_name}"
+                for field_name in [related_model._meta.pk.name, *str_fields]
+            )
+            # The foreign key of the next join
+            if index + 1 < len(names):
+                columns.add(f"{path}{LOOKUP_SEP}{names[index + 1]}")
+    for source in sources:
+        path, _, field_name = source.replace(".", LOOKUP_SEP).rpartition(LOOKUP_SEP)
+        if path in projected:
+            columns.add(f"{path}{LOOKUP_SEP}{field_name}")
+    return sorted(columns)
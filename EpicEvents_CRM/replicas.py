@@ -0,0 +1,87 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.permissions import SAFE_METHODS
+
+# Replica reading the rows of the current request, if any
+_read_database = ContextVar("read_database", default=None)
+
+
+def get_read_database():
+    return _read_database.get()
+
+
+def pin_key(user):
+    return f"replicas:pinned:{user.pk}"
+
+
+def pin_to_primary(user):
+    # In the shared cache, as the user's next request may go to any worker
+    caches[settings.REPLICA_PIN_CACHE_ALIAS].set(
+        pin_key(user), True, timeout=settings.REPLICA_PIN_SECONDS
+    )
+
+
+def is_pinned_to_primary(user):
+    return caches[settings.REPLICA_PIN_CACHE_ALIAS].get(pin_key(user), False)
+
+
+def _reset_read_database(**kwargs):
+    # Once the response is sent, streamed responses included
+    _read_database.set(None)
+
+
+request_finished.connect(_reset_read_database)
+
+
+class ReplicaRouter:
+    """
+    Send the reads of the requests routed by ``ReplicaReadMixin`` to their
+    replica, and every other query to the primary database.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_database.get()
+
+    def db_for_write(self, model, **hints):
+        # Even for rows read from a replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replicas hold the same rows as the primary
+        return True
+
+
+class ReplicaReadMixin:
+    """
+    Route the reads of the safe requests to a random replica in
+    ``settings.REPLICA_DATABASES``, unless the user was pinned to the
+    primary by a recent write.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        _read_database.set(self.get_read_database(request))
+
+    def get_read_database(self, request):
+        if (
+            not settings.REPLICA_DATABASES
+            or request.method not in SAFE_METHODS
+            or (request.user.is_authenticated and is_pinned_to_primary(request.user))
+        ):
+            return None
+        return random.choice(settings.REPLICA_DATABASES)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if (
+            settings.REPLICA_DATABASES
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            pin_to_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
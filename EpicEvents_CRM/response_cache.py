@@ -0,0 +1,149 @@
+import hashlib
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+from EpicEvents_CRM.replicas import get_read_database
+
+# Fields saved without changing any rendered value, e.g. on login
+UNRENDERED_FIELDS = {"last_login", "password", "token_version"}
+
+# Generations bumped as soon as a row changes, seen by this process only
+_local_generations = defaultdict(int)
+
+
+def generation_key(model):
+    return f"responses:{model._meta.label_lower}"
+
+
+def bump_generations(*models, using=None):
+    """
+    Invalidate the cached responses depending on ``models``, e.g. after a
+    ``QuerySet.update()``.
+    """
+    for model in models:
+        _local_generations[model._meta.label_lower] += 1
+    # Other workers must only refresh once the change is visible to them
+    transaction.on_commit(lambda: _bump_shared_generations(models), using=using)
+
+
+def _bump_shared_generations(models):
+    cache = caches[settings.LOOKUP_CACHE_ALIAS]
+    for model in models:
+        key = generation_key(model)
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # The key was evicted between add() and incr()
+            cache.set(key, 1, timeout=None)
+
+
+def _invalidate(sender, using=None, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= UNRENDERED_FIELDS:
+        return
+    bump_generations(sender, using=using)
+
+
+class ListCacheMixin:
+    """
+    Cache the responses of a list view, per endpoint, scope and query
+    parameters, until a model in ``cache_dependencies`` changes.
+    """
+
+    cache_dependencies = ()
+    cache_shared_roles = ()
+    # Shared by the views, e.g. the sync and async views of a route
+    cache_counters = defaultdict(Counter)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for model in cls.cache_dependencies:
+            dispatch_uid = generation_key(model)
+            post_save.connect(_invalidate, sender=model, dispatch_uid=dispatch_uid)
+            post_delete.connect(_invalidate, sender=model, dispatch_uid=dispatch_uid)
+
+    def list(self, request, *args, **kwargs):
+        if settings.RESPONSE_CACHE_ALIAS is None:
+            return super().list(request, *args, **kwargs)
+
+        key = self.get_cache_key(request)
+        response = self.get_cached_response(key)
+        if response is None:
+            response = self.cache_response(key, super().list(request, *args, **kwargs))
+        return response
+
+    async def alist(self, request, *args, **kwargs):
+        if settings.RESPONSE_CACHE_ALIAS is None:
+            return await super().alist(request, *args, **kwargs)
+
+        key = self.get_cache_key(request)
+        response = self.get_cached_response(key)
+        if response is None:
+            response = self.cache_response(
+                key, await super().alist(request, *args, **kwargs)
+            )
+        return response
+
+    def get_cached_response(self, key):
+        data = caches[settings.RESPONSE_CACHE_ALIAS].get(key)
+        counters = self.cache_counters[self.get_route_name()]
+        if data is None:
+            counters["misses"] += 1
+            return None
+        counters["hits"] += 1
+        return Response(data, headers={"X-Cache": "HIT"})
+
+    def get_route_name(self):
+        match = self.request.resolver_match
+        return match.url_name if match is not None else type(self).__name__
+
+    def cache_response(self, key, response):
+        if response.status_code == 200:
+            caches[settings.RESPONSE_CACHE_ALIAS].set(
+                key, response.data, timeout=self.get_cache_timeout()
+            )
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    def get_cache_timeout(self):
+        if get_read_database() is not None:
+            return settings.REPLICA_PIN_SECONDS
+        return DEFAULT_TIMEOUT
+
+    def get_cache_scope(self):
+        user = self.request.user
+        for role in self.cache_shared_roles:
+            if user.has_role(role):
+                return f"role:{role}"
+        return f"user:{user.pk}"
+
+    def get_cache_key(self, request):
+        shared_generations = caches[settings.LOOKUP_CACHE_ALIAS].get_many(
+            [generation_key(model) for model in self.cache_dependencies]
+        )
+        generations = [
+            (
+                shared_generations.get(generation_key(model), 0),
+                _local_generations[model._meta.label_lower],
+            )
+            for model in self.cache_dependencies
+        ]
+        # The same parameters in any order give the same key
+        parameters = sorted(
+            (name, value)
+            for name, values in request.query_params.lists()
+            for value in values
+            if value != ""
+        )
+        digest = hashlib.sha256(
+            repr(
+                (request.get_host(), self.get_cache_scope(), parameters, generations)
+            ).encode()
+        ).hexdigest()
+        return f"responses:{request.path}:{digest}"
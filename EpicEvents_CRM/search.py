@@ -0,0 +1,125 @@
+import datetime
+import operator
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from functools import reduce
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework import filters
+
+
+class TrigramSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter served by the pg_trgm indexes of the searched text fields,
+    searching each related table in its own subquery.
+    """
+
+    text_fields = (models.CharField, models.TextField)
+    number_fields = (models.DecimalField, models.IntegerField, models.FloatField)
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        for search_term in search_terms:
+            conditions = self.get_conditions(queryset.model, search_fields, search_term)
+            if not conditions:
+                return queryset.none()
+            queryset = queryset.filter(reduce(operator.or_, conditions))
+        return queryset
+
+    def get_conditions(self, model, search_fields, search_term):
+        conditions = []
+        text_fields_by_path = defaultdict(list)
+        for search_field in search_fields:
+            path, field = self.resolve_field(model, search_field)
+            if isinstance(field, self.text_fields):
+                text_fields_by_path[path].append(field.name)
+            else:
+                condition = self.get_typed_condition(search_field, field, search_term)
+                if condition is not None:
+                    conditions.append(condition)
+
+        for path, field_names in text_fields_by_path.items():
+            conditions.append(self.get_text_condition(path, field_names, search_term))
+        return conditions
+
+    def resolve_field(self, model, search_field):
+        # Return the relations leading to the field, and the field itself
+        path = []
+        *relation_names, field_name = search_field.split(LOOKUP_SEP)
+        for relation_name in relation_names:
+            model = model._meta.get_field(relation_name).related_model
+            path.append((relation_name, model))
+        return tuple(path), model._meta.get_field(field_name)
+
+    def get_text_condition(self, path, field_names, search_term):
+        condition = reduce(
+            operator.or_,
+            (
+                models.Q(**{f"{field_name}__icontains": search_term})
+                for field_name in field_names
+            ),
+        )
+        # Wrap the condition in one subquery per relation, innermost first
+        for relation_name, related_model in reversed(path):
+            related = related_model._base_manager.filter(condition).values("pk")
+            condition = models.Q(**{f"{relation_name}__in": related})
+        return condition
+
+    def get_typed_condition(self, search_field, field, search_term):
+        if isinstance(field, self.number_fields):
+            value = self.parse_number(field, search_term)
+            if value is not None:
+                return models.Q(**{search_field: value})
+        elif isinstance(field, models.DateTimeField):
+            try:
+                day = parse_date(search_term)
+                value = None if day else parse_datetime(search_term)
+            except ValueError:
+                return None
+            if day is not None:
+                start = timezone.make_aware(
+                    datetime.datetime.combine(day, datetime.time.min)
+                )
+                return models.Q(
+                    **{
+                        f"{search_field}__gte": start,
+                        f"{search_field}__lt": start + datetime.timedelta(days=1),
+                    }
+                )
+            if value is not None:
+                if timezone.is_naive(value):
+                    value = timezone.make_aware(value)
+                return models.Q(**{search_field: value})
+        elif isinstance(field, models.DateField):
+            try:
+                value = parse_date(search_term)
+            except ValueError:
+                return None
+            if value is not None:
+                return models.Q(**{search_field: value})
+        return None
+
+    def parse_number(self, field, search_term):
+        try:
+            value = Decimal(search_term)
+        except InvalidOperation:
+            return None
+        if not value.is_finite():
+            return None
+        if isinstance(field, models.IntegerField):
+            if value != value.to_integral_value():
+                return None
+            return int(value)
+        if isinstance(field, models.DecimalField):
+            # No stored value has more integer digits than the field allows
+            if value and value.adjusted() >= field.max_digits - field.decimal_places:
+                return None
+        return value
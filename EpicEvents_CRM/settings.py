@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.1/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 
 from dotenv import load_dotenv
 from datetime import timedelta
@@ -43,6 +44,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework_simplejwt",
     "django_filters",
@@ -64,6 +66,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "EpicEvents_CRM.urls"
 
+# URLconf of the ASGI entry point, serving the async views
+ASGI_URLCONF = "EpicEvents_CRM.asgi_urls"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -86,17 +91,105 @@ WSGI_APPLICATION = "EpicEvents_CRM.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
+# Connections are taken from a pool in each process, unless DB_POOL=0
+DB_POOL = os.environ.get("DB_POOL", "1") == "1"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "EpicEvents_CRM.postgresql_pool"
+        if DB_POOL
+        else "django.db.backends.postgresql",
         "NAME": "epiceventsdb",
         "USER": "epic_db_admin",
         "PASSWORD": os.environ.get("DB_PASSWORD"),
         "HOST": "127.0.0.1",
         "PORT": "5432",
+        "OPTIONS": {
+            # Keyword arguments of psycopg's ConnectionPool, per process
+            "pool": {
+                "min_size": 2,
+                "max_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+                "max_lifetime": 1800,
+                "timeout": 10,
+            },
+            # Statements run 5 times on a pooled connection, e.g. the scoped
+            # list queries, are prepared on the server
+            "server_side_binding": True,
+            "prepare_threshold": 5,
+        }
+        if DB_POOL
+        else {},
+    }
+}
+
+# Read replicas of the default database, as "host:port/name" separated by
+# commas, e.g. "127.0.0.1:5433/epiceventsdb". A second database of the same
+# instance can stand in for a replica.
+REPLICA_DATABASES = []
+DB_REPLICAS = list(filter(None, os.environ.get("DB_REPLICAS", "").split(",")))
+for index, replica in enumerate(DB_REPLICAS):
+    address, name = replica.rsplit("/", 1)
+    host, port = address.rsplit(":", 1)
+    alias = f"replica_{index + 1}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port,
+        "NAME": name,
+        # The tests read their rows from the default test database
+        "TEST": {"MIRROR": "default"},
     }
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ["EpicEvents_CRM.replicas.ReplicaRouter"]
+
+# Seconds a user's reads stay on the default database after a change, so
+# that they see their own writes. Should exceed the replication lag.
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 5))
+# Cache alias of the users pinned to the default database, shared by every
+# worker and not culling keys before they expire
+REPLICA_PIN_CACHE_ALIAS = "shared"
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Shared by every worker of the host, used to invalidate per-process caches.
+    # Also holds a few keys per user, and must never be culled: a dropped
+    # generation number starts again and may match a worker's outdated copy
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get(
+            "SHARED_CACHE_LOCATION",
+            os.path.join(tempfile.gettempdir(), "epic_events_crm", "shared"),
+        ),
+        "OPTIONS": {"MAX_ENTRIES": 1_000_000},
+    },
+    # List responses, evicting the least recently used one when full
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "responses",
+        "OPTIONS": {"MAX_ENTRIES": 1000, "CULL_FREQUENCY": 1000},
+    },
 }
 
+# Cache alias holding the generation numbers of the lookups and responses
+LOOKUP_CACHE_ALIAS = "shared"
+
+# Cache alias of the users' token versions, checked on each token refresh,
+# None to read them from the database
+TOKEN_STATE_CACHE_ALIAS = "shared"
+
+# Cache alias of the list responses, None to disable the response cache
+RESPONSE_CACHE_ALIAS = "responses"
+
+# Serve the client, contract and event details from their rendered documents
+DETAIL_DOCUMENTS = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -145,12 +238,21 @@ LOGIN_REDIRECT_URL = "client-list"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "authentication.authentication.JWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     )
 }
 
-SIMPLE_JWT = {"ACCESS_TOKEN_LIFETIME": timedelta(days=1)}
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
+    # Issue tokens claiming the user's role and token version
+    "TOKEN_OBTAIN_SERIALIZER": "authentication.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "authentication.serializers.TokenRefreshSerializer",
+    # Revoke refresh tokens in authentication.RevokedToken
+    "TOKEN_BLACKLIST_SERIALIZER": "authentication.serializers.TokenRevokeSerializer",
+}
+
+os.makedirs(BASE_DIR / "logs", exist_ok=True)
 
 LOGGING = {
     "version": 1,
@@ -159,7 +261,13 @@ LOGGING = {
         "file": {
             "level": "ERROR",
             "class": "logging.FileHandler",
-            "filename": "logs/monitoring.log",
+            "filename": BASE_DIR / "logs" / "monitoring.log",
+        },
+        "metrics": {
+            "level": "INFO",
+            "class": "logging.FileHandler",
+            "filename": BASE_DIR / "logs" / "metrics.log",
+            "delay": True,
         },
     },
     "loggers": {
@@ -168,5 +276,9 @@ LOGGING = {
             "level": "ERROR",
             "propagate": True,
         },
+        "EpicEvents_CRM.postgresql_pool": {
+            "handlers": ["metrics"],
+            "level": "INFO",
+        },
     },
 }
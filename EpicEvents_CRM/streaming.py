@@ -0,0 +1,71 @@
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from EpicEvents_CRM.mixins import check_mixin_order
+from EpicEvents_CRM.response_cache import ListCacheMixin
+
+
+async def aiterate(iterator):
+    """
+    Iterate over a sync iterator from the event loop, reading each item in
+    a thread.
+    """
+    iterator = iter(iterator)
+    done = object()
+    while True:
+        # In the thread of the request, which holds the cursor's connection
+        item = await sync_to_async(next)(iterator, done)
+        if item is done:
+            return
+        yield item
+
+
+class StreamingListMixin:
+    """
+    Stream the whole list as a JSON array, from a server-side cursor, when
+    requested with ``?stream=true``.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 2000
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Streamed responses are not cached
+        check_mixin_order(cls, StreamingListMixin, ListCacheMixin)
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get(self.stream_query_param) not in ("1", "true"):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        return StreamingHttpResponse(
+            self.stream_json_array(queryset, serializer),
+            content_type="application/json",
+        )
+
+    async def alist(self, request, *args, **kwargs):
+        if request.query_params.get(self.stream_query_param) not in ("1", "true"):
+            return await super().alist(request, *args, **kwargs)
+        response = await sync_to_async(self.list)(request, *args, **kwargs)
+        # The rows are read as the response is sent, by the sync ORM
+        response.streaming_content = aiterate(response.streaming_content)
+        return response
+
+    def stream_json_array(self, queryset, serializer):
+        # Same output as DRF's JSONRenderer
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        rows = queryset.iterator(chunk_size=self.stream_chunk_size)
+        separator = "["
+        chunk = []
+        for instance in rows:
+            chunk.append(separator)
+            chunk.append(encoder.encode(serializer.to_representation(instance)))
+            separator = ","
+            if len(chunk) >= 2 * self.stream_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+        chunk.append("[]" if separator == "[" else "]")
+        yield "".join(chunk)
@@ -0,0 +1,79 @@
+from django.utils import timezone
+
+
+class FieldTrackerMixin:
+    """
+    Remember the values of ``tracked_fields`` as last read or saved, so that
+    ``has_changed()`` tells whether a save changes them.
+    """
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._remember_tracked_fields()
+
+    def has_changed(self, field_name):
+        loaded_values = getattr(self, "_loaded_values", {})
+        if field_name not in loaded_values:
+            return True
+        return getattr(self, field_name) != loaded_values[field_name]
+
+    def get_loaded_values(self, field_name):
+        # The current value, and the loaded one if it changed
+        values = {getattr(self, field_name)}
+        values.add(getattr(self, "_loaded_values", {}).get(field_name))
+        values.discard(None)
+        return values
+
+    def _remember_tracked_fields(self):
+        # Deferred fields are not in __dict__ and are left out
+        self._loaded_values = {
+            field_name: self.__dict__[field_name]
+            for field_name in self.tracked_fields
+            if field_name in self.__dict__
+        }
+
+
+class DateUpdatedMixin(FieldTrackerMixin):
+    """
+    FieldTrackerMixin stamping ``date_updated`` on each save of an existing
+    row, unless the caller set it or only ``unrendered_fields`` are saved.
+    """
+
+    unrendered_fields = ()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if not (
+            self._state.adding
+            or ("date_updated" in self.__dict__ and self.has_changed("date_updated"))
+            or (
+                update_fields is not None
+                and set(update_fields) <= set(self.unrendered_fields)
+            )
+        ):
+            self.date_updated = timezone.now()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "date_updated"}
+        super().save(*args, **kwargs)
+
+    def _remember_tracked_fields(self):
+        super()._remember_tracked_fields()
+        # Tells whether the caller set date_updated
+        if "date_updated" in self.__dict__:
+            self._loaded_values["date_updated"] = self.date_updated
+
+
+def touch(queryset):
+    """
+    Stamp ``date_updated`` on the rows of ``queryset``, which show a related
+    row that changed.
+    """
+    return queryset.update(date_updated=timezone.now())
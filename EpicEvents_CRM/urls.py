@@ -1,7 +1,11 @@
 from django.contrib import admin
 from django.urls import path, include
 
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import (
+    TokenBlacklistView,
+    TokenObtainPairView,
+    TokenRefreshView,
+)
 
 import clients.views
 import contracts.views
@@ -12,6 +16,7 @@ urlpatterns = [
     path("api-auth/", include("rest_framework.urls")),
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("api/token/revoke/", TokenBlacklistView.as_view(), name="token_revoke"),
     path(
         "api/clients/",
         clients.views.ClientListCreateAPIView.as_view(),
@@ -22,6 +27,16 @@ urlpatterns = [
         clients.views.ClientStatusListAPIView.as_view(),
         name="client-status-list",
     ),
+    path(
+        "api/clients/export/",
+        clients.views.ClientExportAPIView.as_view(),
+        name="client-export",
+    ),
+    path(
+        "api/clients/bulk/",
+        clients.views.ClientBulkUpdateAPIView.as_view(),
+        name="client-bulk-update",
+    ),
     path(
         "api/clients/<int:pk>/",
         clients.views.ClientDetailAPIView.as_view(),
@@ -37,6 +52,16 @@ urlpatterns = [
         contracts.views.ContractStatusListAPIView.as_view(),
         name="contract-status-list",
     ),
+    path(
+        "api/contracts/export/",
+        contracts.views.ContractExportAPIView.as_view(),
+        name="contract-export",
+    ),
+    path(
+        "api/contracts/bulk/",
+        contracts.views.ContractBulkUpdateAPIView.as_view(),
+        name="contract-bulk-update",
+    ),
     path(
         "api/contracts/<int:pk>/",
         contracts.views.ContractDetailAPIView.as_view(),
@@ -52,6 +77,16 @@ urlpatterns = [
         events.views.EventStatusListAPIView.as_view(),
         name="event-status-list",
     ),
+    path(
+        "api/events/export/",
+        events.views.EventExportAPIView.as_view(),
+        name="event-export",
+    ),
+    path(
+        "api/events/bulk/",
+        events.views.EventBulkUpdateAPIView.as_view(),
+        name="event-bulk-update",
+    ),
     path(
         "api/events/<int:pk>/",
         events.views.EventDetailAPIView.as_view(),
@@ -0,0 +1,93 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import authentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from authentication.models import UserRole
+
+# Claims added to the tokens issued by /api/token/
+ROLE_CLAIM = "role"
+TOKEN_VERSION_CLAIM = "token_version"
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """
+    JWTAuthentication building the user from the token's user id, role and
+    token version claims, without reading the user row.
+    """
+
+    def get_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        try:
+            user = self.user_model.objects.get_cached(
+                user_id, validated_token.get(TOKEN_VERSION_CLAIM, 0)
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        self.check_user(user, validated_token)
+        if ROLE_CLAIM not in validated_token:
+            return self.user_from_claims(user, user.role)
+        try:
+            role = UserRole.objects.get_by_code(validated_token[ROLE_CLAIM])
+        except UserRole.DoesNotExist:
+            raise InvalidToken(_("Token contained an unknown role"))
+        return self.user_from_claims(user, role)
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        try:
+            user = await self.user_model.objects.aget_cached(
+                user_id, validated_token.get(TOKEN_VERSION_CLAIM, 0)
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        self.check_user(user, validated_token)
+        if ROLE_CLAIM not in validated_token:
+            return self.user_from_claims(user, user.role)
+        # The lookups must not be loaded synchronously on the event loop
+        try:
+            role = await UserRole.objects.aget_by_code(validated_token[ROLE_CLAIM])
+        except UserRole.DoesNotExist:
+            raise InvalidToken(_("Token contained an unknown role"))
+        return self.user_from_claims(user, role)
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    def check_user(self, user, validated_token):
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if user.token_version != validated_token.get(TOKEN_VERSION_CLAIM, 0):
+            raise AuthenticationFailed(
+                _("Token has been revoked"), code="token_revoked"
+            )
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+    def user_from_claims(self, user, role):
+        # Not the cached user, shared by the requests
+        return self.user_model.from_token_claims(user.pk, role, user.token_version)
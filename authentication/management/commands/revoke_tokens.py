@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+
+
+class Command(BaseCommand):
+    help = "Revoke the access and refresh tokens issued to users so far."
+
+    def add_arguments(self, parser):
+        parser.add_argument("usernames", nargs="+")
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(username__in=options["usernames"])
+        missing = set(options["usernames"]) - {user.username for user in users}
+        if missing:
+            raise CommandError(f"Unknown users: {', '.join(sorted(missing))}.")
+        for user in users:
+            user.revoke_tokens()
+        self.stdout.write(
+            self.style.SUCCESS(f"Revoked the tokens of {len(users)} users.")
+        )
@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth.models import UserManager
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from EpicEvents_CRM.bloom import BloomFilter
+
+# Fields of the token state checked on each token refresh
+TOKEN_STATE_FIELDS = {"token_version", "is_active"}
+
+
+class CachedUserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # update() sends no signal, so the users it changes are invalidated
+        # here, as their save() does
+        pks = None
+        alias = settings.TOKEN_STATE_CACHE_ALIAS
+        if alias is not None and not TOKEN_STATE_FIELDS.isdisjoint(kwargs):
+            pks = list(self.values_list("pk", flat=True))
+        rows = super().update(**kwargs)
+        self.model._default_manager._invalidate_updated(pks, self.db)
+        return rows
+
+
+class CachedUserManager(UserManager):
+    """
+    UserManager keeping the users read by the authentication in each
+    process, and their token states in ``TOKEN_STATE_CACHE_ALIAS``.
+    """
+
+    cache_size = 1000
+    cache_timeout = 60
+    generation_key = "users:generation"
+    # Bounds how long a change made without the ORM, e.g. in SQL, is missed
+    token_state_timeout = 24 * 60 * 60
+
+    def __init__(self):
+        super().__init__()
+        # Mutated in place, as Django hands out shallow copies of the manager
+        self._cache = {"generation": None, "users": OrderedDict()}
+        self._lock = threading.Lock()
+
+    def contribute_to_class(self, cls, name):
+        super().contribute_to_class(cls, name)
+        if not cls._meta.abstract:
+            post_save.connect(self._invalidate, sender=cls, weak=False)
+            post_delete.connect(self._invalidate, sender=cls, weak=False)
+
+    def get_queryset(self):
+        return CachedUserQuerySet(self.model, using=self._db)
+
+    def _create_user(self, username, email, password, **extra_fields):
+        # UserManager sets the encoded password directly, which User.save()
+        # would take for a raw password
+        if not username:
+            raise ValueError("The given username must be set")
+        user = self.model(
+            username=self.model.normalize_username(username),
+            email=self.normalize_email(email),
+            **extra_fields,
+        )
+        user.set_password(password)
+        user.save(using=self._db)
+        return user
+
+    def _get_from_cache(self, pk, token_version):
+        generation = caches[settings.LOOKUP_CACHE_ALIAS].get(self.generation_key, 0)
+        with self._lock:
+            if self._cache["generation"] != generation:
+                self._cache["generation"] = generation
+                self._cache["users"].clear()
+            users = self._cache["users"]
+            user, expires_at = users.get(pk, (None, 0))
+            if expires_at < time.monotonic() or (
+                token_version is not None and user.token_version != token_version
+            ):
+                return None
+            users.move_to_end(pk)
+            return user
+
+    def _store(self, user):
+        with self._lock:
+            users = self._cache["users"]
+            users[user.pk] = (user, time.monotonic() + self.cache_timeout)
+            users.move_to_end(user.pk)
+            while len(users) > self.cache_size:
+                users.popitem(last=False)
+        return user
+
+    def get_cached(self, pk, token_version=None):
+        user = self._get_from_cache(pk, token_version)
+        if user is None:
+            user = self._store(self.select_related("role").get(pk=pk))
+        return user
+
+    async def aget_cached(self, pk, token_version=None):
+        # Same as get_cached(), reading the user through the async ORM
+        user = self._get_from_cache(pk, token_version)
+        if user is None:
+            user = self._store(await self.select_related("role").aget(pk=pk))
+        return user
+
+    def get_token_state(self, pk):
+        """
+        Return the token version of the user, and whether the user is active.
+        """
+        alias = settings.TOKEN_STATE_CACHE_ALIAS
+        if alias is not None:
+            state = caches[alias].get(self._token_state_key(pk))
+            if state is not None:
+                return state
+        user = self.get_cached(pk)
+        state = (user.token_version, user.is_active)
+        if alias is not None:
+            # Leaves the state set by a save committed in the meantime
+            caches[alias].add(
+                self._token_state_key(pk), state, timeout=self.token_state_timeout
+            )
+        return state
+
+    def _token_state_key(self, pk):
+        return f"users:{pk}:token_state"
+
+    def _set_token_state(self, pk, state):
+        caches[settings.TOKEN_STATE_CACHE_ALIAS].set(
+            self._token_state_key(pk), state, timeout=self.token_state_timeout
+        )
+
+    def _set_token_states(self, pks):
+        # Read once committed, replacing the states read before
+        caches[settings.TOKEN_STATE_CACHE_ALIAS].set_many(
+            {
+                self._token_state_key(pk): (token_version, is_active)
+                for pk, token_version, is_active in self.filter(pk__in=pks).values_list(
+                    "pk", "token_version", "is_active"
+                )
+            },
+            timeout=self.token_state_timeout,
+        )
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache["users"].clear()
+
+    def _bump_generation(self):
+        cache = caches[settings.LOOKUP_CACHE_ALIAS]
+        cache.add(self.generation_key, 0, timeout=None)
+        try:
+            cache.incr(self.generation_key)
+        except ValueError:
+            # The key was evicted between add() and incr()
+            cache.set(self.generation_key, 1, timeout=None)
+
+    def _invalidate(self, sender, instance, signal, using=None, **kwargs):
+        with self._lock:
+            self._cache["users"].pop(instance.pk, None)
+        # Other workers must only reload once the change is visible to them
+        transaction.on_commit(self._bump_generation, using=using)
+        if settings.TOKEN_STATE_CACHE_ALIAS is not None:
+            # Read from the database until the change is committed, or if it
+            # is rolled back
+            caches[settings.TOKEN_STATE_CACHE_ALIAS].delete(
+                self._token_state_key(instance.pk)
+            )
+            state = (instance.token_version, instance.is_active)
+            if signal is post_delete:
+                state = (instance.token_version, False)
+            transaction.on_commit(
+                partial(self._set_token_state, instance.pk, state), using=using
+            )
+
+    def _invalidate_updated(self, pks, using):
+        self.clear_cache()
+        transaction.on_commit(self._bump_generation, using=using)
+        if pks:
+            caches[settings.TOKEN_STATE_CACHE_ALIAS].delete_many(
+                [self._token_state_key(pk) for pk in pks]
+            )
+            transaction.on_commit(partial(self._set_token_states, pks), using=using)
+
+
+class RevokedTokenManager(models.Manager):
+    """
+    Manager of the revoked refresh tokens, checked through a Bloom filter
+    kept in each process.
+    """
+
+    false_positive_rate = 0.001
+    min_capacity = 10000
+    generation_key = "revoked_tokens:generation"
+
+    def __init__(self):
+        super().__init__()
+        # Mutated in place, as Django hands out shallow copies of the manager
+        self._cache = {}
+
+    def _load(self):
+        generation = caches[settings.LOOKUP_CACHE_ALIAS].get(self.generation_key, 0)
+        snapshot = self._cache.get("snapshot")
+        if snapshot is None or snapshot[0] != generation:
+            jtis = list(
+                self.filter(expires_at__gt=timezone.now()).values_list("jti", flat=True)
+            )
+            bloom_filter = BloomFilter(
+                max(self.min_capacity, 2 * len(jtis)), self.false_positive_rate
+            )
+            for jti in jtis:
+                bloom_filter.add(jti)
+            snapshot = (generation, bloom_filter)
+            self._cache["snapshot"] = snapshot
+        return snapshot[1]
+
+    def is_revoked(self, jti):
+        if jti not in self._load():
+            return False
+        return self.filter(jti=jti).exists()
+
+    def revoke(self, jti, expires_at):
+        # Expired tokens are refused anyway
+        self.filter(expires_at__lte=timezone.now()).delete()
+        self.get_or_create(jti=jti, defaults={"expires_at": expires_at})
+        self._load().add(jti)
+        # Other workers must only reload once the row is visible to them
+        transaction.on_commit(self._bump_generation)
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _bump_generation(self):
+        cache = caches[settings.LOOKUP_CACHE_ALIAS]
+        cache.add(self.generation_key, 0, timeout=None)
+        try:
+            cache.incr(self.generation_key)
+        except ValueError:
+            # The key was evicted between add() and incr()
+            cache.set(self.generation_key, 1, timeout=None)
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.5 on 2026-10-18 20:26
+
+import authentication.managers
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0007_auto_20230928_1451"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", authentication.managers.CachedUserManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="token_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,5 +1,10 @@
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, models
+
+from authentication.managers import CachedUserManager, RevokedTokenManager
+from EpicEvents_CRM.lookups import LookupManager
+from EpicEvents_CRM.response_cache import UNRENDERED_FIELDS
+from EpicEvents_CRM.tracking import DateUpdatedMixin
 
 
 class UserRole(models.Model):
@@ -14,11 +19,13 @@ class UserRole(models.Model):
     ]
     role = models.CharField(choices=ROLE_CHOICES, max_length=3, unique=True)
 
+    objects = LookupManager("role")
+
     def __str__(self):
         return dict(self.ROLE_CHOICES)[str(self.role)]
 
 
-class User(AbstractUser):
+class User(DateUpdatedMixin, AbstractUser):
     role = models.ForeignKey(UserRole, on_delete=models.PROTECT)
     first_name = models.CharField(max_length=25, blank=True)
     last_name = models.CharField(max_length=25, blank=True)
@@ -27,17 +34,104 @@ class User(AbstractUser):
     mobile_number = models.CharField(max_length=20, null=True, blank=True)
     date_created = models.DateTimeField(auto_now_add=True, editable=False)
     date_updated = models.DateTimeField(null=True)
+    # Claimed by the tokens, which are revoked by increasing it
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = CachedUserManager()
+
+    # Claimed by the tokens, or deciding whether they are valid, and the
+    # password, hashed by save() when set raw
+    tracked_fields = ["role_id", "is_active", "password"]
+    unrendered_fields = UNRENDERED_FIELDS
+
+    # Read by __str__() and the representations nesting the row
+    str_fields = ["first_name", "last_name", "role"]
 
     def save(self, *args, **kwargs):
         # Ensure only a manager is staff even if role is changed in Admin
-        is_manager = self.role == UserRole.objects.get(role=UserRole.MANAGEMENT)
+        is_manager = self.has_role(UserRole.MANAGEMENT)
         self.is_staff = is_manager
         self.is_superuser = is_manager
-        self.set_password(self.password)
+        if self.has_raw_password():
+            self.set_password(self.password)
+        if not self._state.adding and (
+            self.has_changed("role_id") or self.has_changed("is_active")
+        ):
+            self.token_version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "token_version"}
         super().save(*args, **kwargs)
 
+    def revoke_tokens(self):
+        self.token_version += 1
+        self.save(update_fields=["token_version"])
+
+    @classmethod
+    def from_token_claims(cls, pk, role, token_version):
+        """
+        The user authenticated by a token, built from its claims without
+        reading the user row.
+        """
+        user = cls.from_db(
+            DEFAULT_DB_ALIAS,
+            ["id", "role_id", "is_active", "token_version"],
+            [pk, role.pk, True, token_version],
+        )
+        user.role = role
+        user._from_token_claims = True
+        return user
+
+    def refresh_from_db(self, using=None, fields=None):
+        deferred_fields = self.get_deferred_fields()
+        if (
+            getattr(self, "_from_token_claims", False)
+            and fields is not None
+            and set(fields) <= deferred_fields
+        ):
+            cached_user = User.objects.get_cached(self.pk)
+            for field_name in deferred_fields:
+                setattr(self, field_name, getattr(cached_user, field_name))
+            return
+        super().refresh_from_db(using=using, fields=fields)
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}, {self.role}"
 
+    def has_role(self, role):
+        if User.role.is_cached(self):
+            # Loaded with the user, e.g. by the async views, which must not
+            # read the lookups synchronously
+            return self.role.role == role
+        # Compare ids so that neither the user's role nor the lookup hits the db
+        return self.role_id == UserRole.objects.get_by_code(role).pk
+
+    def set_password(self, raw_password):
+        super().set_password(raw_password)
+        self._encoded_password = self.password
+
+    def set_unusable_password(self):
+        super().set_unusable_password()
+        self._encoded_password = self.password
+
+    def has_raw_password(self):
+        # Whether the password was set directly, e.g. in the admin, rather
+        # than encoded by set_password()
+        return (
+            "password" in self.__dict__
+            and self.has_changed("password")
+            and self.password != getattr(self, "_encoded_password", None)
+        )
+
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}"
+
+
+class RevokedToken(models.Model):
+    # Claims of the refresh token
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    objects = RevokedTokenManager()
+
+    def __str__(self):
+        return self.jti
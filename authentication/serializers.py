@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from authentication.authentication import ROLE_CLAIM, TOKEN_VERSION_CLAIM
+from authentication.models import RevokedToken, User, UserRole
+
+
+class TokenObtainPairSerializer(serializers.TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        # Copied to the access tokens made from the refresh token
+        token = super().get_token(user)
+        token[ROLE_CLAIM] = UserRole.objects.get_for_id(user.role_id).role
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class TokenRefreshSerializer(serializers.TokenRefreshSerializer):
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        try:
+            token_version, is_active = User.objects.get_token_state(
+                refresh[api_settings.USER_ID_CLAIM]
+            )
+        except (KeyError, User.DoesNotExist):
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        if not is_active or token_version != refresh.get(TOKEN_VERSION_CLAIM, 0):
+            raise InvalidToken(_("Token has been revoked"))
+        if RevokedToken.objects.is_revoked(refresh[api_settings.JTI_CLAIM]):
+            raise InvalidToken(_("Token has been revoked"))
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            revoke(refresh)
+        return super().validate(attrs)
+
+
+class TokenRevokeSerializer(serializers.TokenBlacklistSerializer):
+    def validate(self, attrs):
+        revoke(self.token_class(attrs["refresh"]))
+        return {}
+
+
+def revoke(refresh):
+    RevokedToken.objects.revoke(
+        refresh[api_settings.JTI_CLAIM],
+        datetime.fromtimestamp(refresh["exp"], tz=timezone.utc),
+    )
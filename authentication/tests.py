@@ -1,6 +1,11 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, identify_hasher
+from django.urls import reverse
 from rest_framework.test import APITestCase
 
 from authentication.models import UserRole, User
+from EpicEvents_CRM.lookups import LookupManager
 
 
 class UserTestApiCase(APITestCase):
@@ -21,3 +26,110 @@ class UserTestApiCase(APITestCase):
 
                 self.assertEqual(test_user.is_staff, expected_is_staff)
                 self.assertEqual(test_user.is_superuser, expected_is_staff)
+
+
+class UserPasswordTestCase(APITestCase):
+    def setUp(self):
+        self.test_user = User.objects.create_user(
+            username="password_tester",
+            role=UserRole.objects.get(role=UserRole.SALES_TEAM),
+            password="p@55w0rd_73573r",
+        )
+
+    def test_save_does_not_rehash_password(self):
+        password = self.test_user.password
+        self.test_user.role = UserRole.objects.get(role=UserRole.MANAGEMENT)
+        self.test_user.save()
+
+        self.test_user.refresh_from_db()
+        self.assertEqual(self.test_user.password, password)
+        self.assertTrue(self.test_user.check_password("p@55w0rd_73573r"))
+
+    def test_save_hashes_raw_password(self):
+        # As set in the admin
+        self.test_user.password = "n3w_p@55w0rd"
+        self.test_user.save()
+
+        self.test_user.refresh_from_db()
+        self.assertNotEqual(self.test_user.password, "n3w_p@55w0rd")
+        self.assertTrue(self.test_user.check_password("n3w_p@55w0rd"))
+
+    def test_save_hashes_raw_password_shaped_like_hash(self):
+        for password in ["pbkdf2_sha256$1000$s@lt$h@5h", "!n3w_p@55w0rd"]:
+            with self.subTest(password=password):
+                self.test_user.password = password
+                self.test_user.save()
+
+                self.test_user.refresh_from_db()
+                self.assertNotEqual(self.test_user.password, password)
+                self.assertTrue(self.test_user.check_password(password))
+
+    def test_save_keeps_unusable_password(self):
+        self.test_user.set_unusable_password()
+        self.test_user.save()
+
+        self.test_user.refresh_from_db()
+        self.assertFalse(self.test_user.has_usable_password())
+
+    def test_login_upgrades_password_hash(self):
+        hasher = PBKDF2PasswordHasher()
+        User.objects.filter(pk=self.test_user.pk).update(
+            password=hasher.encode("p@55w0rd_73573r", hasher.salt(), iterations=1000)
+        )
+
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "password_tester", "password": "p@55w0rd_73573r"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.test_user.refresh_from_db()
+        self.assertEqual(
+            hasher.decode(self.test_user.password)["iterations"], hasher.iterations
+        )
+        self.assertIsInstance(identify_hasher(self.test_user.password), type(hasher))
+
+        # The upgraded hash still logs the user in
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "password_tester", "password": "p@55w0rd_73573r"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class UserRoleLookupTestCase(APITestCase):
+    def test_role_lookup_is_served_from_memory(self):
+        UserRole.objects.clear_cache()
+        with self.assertNumQueries(1):
+            for role_code, role_name in UserRole.ROLE_CHOICES:
+                self.assertEqual(
+                    UserRole.objects.get_by_code(role_code).role, role_code
+                )
+        with self.assertNumQueries(0):
+            UserRole.objects.get_by_code(UserRole.SALES_TEAM)
+
+    def test_role_lookup_is_invalidated_on_save_and_delete(self):
+        role = UserRole.objects.get_by_code(UserRole.SALES_TEAM)
+        role.delete()
+        with self.assertRaises(UserRole.DoesNotExist):
+            UserRole.objects.get_by_code(UserRole.SALES_TEAM)
+
+        UserRole.objects.create(role=UserRole.SALES_TEAM)
+        self.assertNotEqual(
+            UserRole.objects.get_by_code(UserRole.SALES_TEAM).pk, role.pk
+        )
+
+    def test_role_lookup_checks_other_workers_at_intervals(self):
+        role = UserRole.objects.get_by_code(UserRole.SALES_TEAM)
+        with mock.patch.object(LookupManager, "_shared_generation") as generation:
+            for _ in range(10):
+                UserRole.objects.get_by_code(UserRole.SALES_TEAM)
+        generation.assert_not_called()
+
+        # Changed by another worker, until the test transaction is rolled back
+        self.addCleanup(UserRole.objects.clear_cache)
+        UserRole.objects.filter(pk=role.pk).update(role="OLD")
+        UserRole.objects._bump_generation()
+        self.assertEqual(UserRole.objects.get_by_code(UserRole.SALES_TEAM), role)
+        with mock.patch.object(LookupManager, "check_interval", 0):
+            with self.assertRaises(UserRole.DoesNotExist):
+                UserRole.objects.get_by_code(UserRole.SALES_TEAM)
@@ -0,0 +1,156 @@
+"""
+Throughput of concurrent requests to the client list and detail, served by
+the WSGI entry point with a thread per request, and by the ASGI entry point
+with the sync and with the async views.
+
+Run with: python manage.py test benchmarks.bench_asgi -p "bench_*.py"
+Set BENCH_CONCURRENCY to change the number of concurrent requests, and
+BENCH_REQUESTS the total number of requests.
+"""
+
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import User, UserRole
+from clients.models import Client, ClientStatus
+from contracts.models import Contract, ContractStatus
+from EpicEvents_CRM.asgi import AsyncViewsASGIHandler
+
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", 32))
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", 640))
+ROWS = 1000
+
+
+def wsgi_request(application, path, authorization):
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_AUTHORIZATION": authorization,
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": io.StringIO(),
+    }
+    statuses = []
+    response = application(environ, lambda status, headers: statuses.append(status))
+    b"".join(response)
+    response.close()
+    return int(statuses[0].split()[0])
+
+
+async def asgi_request(application, path, authorization):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", authorization.encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    return messages[0]["status"]
+
+
+@override_settings(RESPONSE_CACHE_ALIAS=None)
+class ASGIBenchmark(TransactionTestCase):
+    # Restore the roles and statuses of the data migrations for later tests
+    serialized_rollback = True
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username="bench_sales",
+            password="bench_password",
+            role=UserRole.objects.get(role=UserRole.SALES_TEAM),
+        )
+        self.authorization = f"Bearer {AccessToken.for_user(user)}"
+        clients = Client.objects.bulk_create(
+            Client(
+                company_name=f"Company {index}",
+                sales_contact=user,
+                first_name="First",
+                last_name="Last",
+                email=f"contact{index}@company.com",
+                status=ClientStatus.objects.get(status=ClientStatus.EXISTING),
+            )
+            for index in range(ROWS)
+        )
+        Contract.objects.bulk_create(
+            Contract(
+                client=client,
+                sales_contact=user,
+                status=ContractStatus.objects.get(status=ContractStatus.SIGNED),
+                amount=1000,
+            )
+            for client in clients[:10]
+        )
+        self.paths = ["/api/clients/", f"/api/clients/{clients[0].pk}/"]
+
+    def run_wsgi(self, path):
+        application = WSGIHandler()
+        with ThreadPoolExecutor(CONCURRENCY) as executor:
+            statuses = list(
+                executor.map(
+                    lambda _: wsgi_request(application, path, self.authorization),
+                    range(REQUESTS),
+                )
+            )
+        self.assertEqual(set(statuses), {200})
+
+    def run_asgi(self, application, path):
+        async def worker(count):
+            return [
+                await asgi_request(application, path, self.authorization)
+                for _ in range(count)
+            ]
+
+        async def main():
+            return await asyncio.gather(
+                *[worker(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)]
+            )
+
+        statuses = {status for worker in asyncio.run(main()) for status in worker}
+        self.assertEqual(statuses, {200})
+
+    def time_run(self, run, *args):
+        # Warm up, e.g. build the detail document
+        run(*args)
+        start = time.perf_counter()
+        run(*args)
+        return REQUESTS / (time.perf_counter() - start)
+
+    def test_asgi_throughput(self):
+        print(f"\n{CONCURRENCY} concurrent requests, {REQUESTS} requests (requests/s)")
+        print(f"{'endpoint':<20}{'WSGI':>12}{'ASGI sync':>12}{'ASGI async':>12}")
+        for path in self.paths:
+            wsgi = self.time_run(self.run_wsgi, path)
+            asgi_sync = self.time_run(self.run_asgi, ASGIHandler(), path)
+            asgi_async = self.time_run(self.run_asgi, AsyncViewsASGIHandler(), path)
+            print(f"{path:<20}{wsgi:>12.0f}{asgi_sync:>12.0f}{asgi_async:>12.0f}")
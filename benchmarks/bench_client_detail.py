@@ -0,0 +1,82 @@
+"""
+Latency of the client detail for a client with few or many contracts.
+
+Run with: python manage.py test benchmarks.bench_client_detail -p "bench_*.py"
+Set BENCH_ROWS to change the number of contracts of the large client.
+"""
+
+import os
+import statistics
+import time
+
+from django.db import connection
+from django.urls import reverse
+
+from clients.models import Client
+from contracts.models import Contract
+from events.models import Event
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 10_000))
+SMALL_ROWS = 3
+REPEAT = 20
+
+
+class ClientDetailBenchmark(ProjectAPITestCase):
+    def create_client(self, contracts_count):
+        client = Client.objects.create(
+            company_name=f"Company with {contracts_count} contracts",
+            sales_contact=self.test_sales_team_member,
+            first_name="First",
+            last_name="Last",
+            email="contact@company.com",
+            status=self.test_status_existing,
+        )
+        contracts = Contract.objects.bulk_create(
+            (
+                Contract(
+                    client=client,
+                    sales_contact=client.sales_contact,
+                    status=self.test_status_signed,
+                    amount=1000,
+                )
+                for _ in range(contracts_count)
+            ),
+            batch_size=5000,
+        )
+        Event.objects.bulk_create(
+            (
+                Event(
+                    contract=contract,
+                    sales_contact=contract.sales_contact,
+                    status=self.test_status_created,
+                )
+                for contract in contracts
+            ),
+            batch_size=5000,
+        )
+        return reverse("client-detail", kwargs={"pk": client.pk})
+
+    def time_request(self, url):
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            response = self.client.get(url)
+            durations.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+        return statistics.median(durations) * 1000
+
+    def test_client_detail_latency(self):
+        urls = [(count, self.create_client(count)) for count in (SMALL_ROWS, ROWS)]
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        self.time_request(urls[0][1])
+
+        print(
+            f"\n{'contracts':>10}{'page size':>12}{'latency':>14} (median of {REPEAT})"
+        )
+        for count, url in urls:
+            for page_size in (SMALL_ROWS, 100):
+                latency = self.time_request(f"{url}?contracts_page_size={page_size}")
+                print(f"{count:>10}{page_size:>12}{latency:>11.1f} ms")
@@ -0,0 +1,52 @@
+"""
+Latency of the detail views, rendered or served from their documents.
+
+Run with: python manage.py test benchmarks.bench_detail_documents -p "bench_*.py"
+"""
+
+import statistics
+import time
+
+from django.test import override_settings
+
+from contracts.models import Contract
+from events.models import Event
+from tests.test_setup import ProjectAPITestCase
+
+CONTRACTS = 100
+REPEAT = 50
+
+
+class DetailDocumentsBenchmark(ProjectAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # A full page of contracts and events in the client detail
+        for _ in range(CONTRACTS):
+            contract = Contract.objects.create(
+                client=cls.test_client_1, status=cls.test_status_signed, amount=1000
+            )
+            Event.objects.create(contract=contract, status=cls.test_status_created)
+
+    def time_request(self, url):
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            response = self.client.get(url)
+            durations.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+        return statistics.median(durations) * 1000
+
+    def test_detail_latency(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        urls = [
+            str(self.url_client_detail),
+            str(self.url_contract_detail),
+            str(self.url_event_detail),
+        ]
+        print(f"\n{'detail':<25}{'rendered':>14}{'document':>14} (median of {REPEAT})")
+        for url in urls:
+            with override_settings(DETAIL_DOCUMENTS=False):
+                rendered = self.time_request(url)
+            document = self.time_request(url)
+            print(f"{url:<25}{rendered:>11.1f} ms{document:>11.1f} ms")
@@ -0,0 +1,53 @@
+"""
+Latency of every API endpoint, with N and then 10*N rows seeded for each role.
+
+Run with: python manage.py test benchmarks.bench_endpoints -p "bench_*.py"
+Set BENCH_ROWS to change N.
+"""
+
+import os
+import statistics
+import time
+
+from tests.test_query_budget import EndpointsMixin
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 100))
+REPEAT = 10
+
+
+class EndpointsBenchmark(EndpointsMixin, ProjectAPITestCase):
+    def time_request(self, user, method, url, data_factory):
+        self.client.force_authenticate(user=user)
+        durations = []
+        for _ in range(REPEAT):
+            data = data_factory() if data_factory else None
+            start = time.perf_counter()
+            response = getattr(self.client, method)(url, data=data)
+            durations.append(time.perf_counter() - start)
+            self.assertLess(response.status_code, 300, response.content)
+        return statistics.median(durations) * 1000
+
+    def time_all(self):
+        return [
+            self.time_request(user, method, url, data_factory)
+            for user, method, url, data_factory, _ in self.get_endpoints()
+        ]
+
+    def test_endpoint_latency(self):
+        # Warm the role and status lookups, as a long-running worker would have
+        self.time_all()
+        self.seed(ROWS)
+        small = self.time_all()
+        self.seed(9 * ROWS)
+        large = self.time_all()
+
+        print(
+            f"\n{'endpoint':<40}{f'{ROWS} rows':>14}{f'{10 * ROWS} rows':>14}"
+            f" (median of {REPEAT})"
+        )
+        for (user, method, url, _, _), small_ms, large_ms in zip(
+            self.get_endpoints(), small, large
+        ):
+            endpoint = f"{method.upper()} {url} ({user.role})"
+            print(f"{endpoint:<40}{small_ms:>11.1f} ms{large_ms:>11.1f} ms")
@@ -0,0 +1,81 @@
+"""
+Queries per request with and without the in-memory role and status lookups.
+
+Run with: python manage.py test benchmarks -p "bench_*.py"
+"""
+
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.models import User, UserRole
+from EpicEvents_CRM.lookups import LookupManager
+from tests.test_setup import ProjectAPITestCase
+
+
+def legacy_get_by_code(self, code):
+    return self.get(**{self.code_field: code})
+
+
+def legacy_has_role(self, role):
+    return self.role == UserRole.objects.get(role=role)
+
+
+class LookupsBenchmark(ProjectAPITestCase):
+    def count_queries(self, user, method, url, data=None):
+        # Authenticate with a token, as the API clients do
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data=data)
+        self.assertLess(response.status_code, 300, response.content)
+        return len(context.captured_queries)
+
+    def get_requests(self):
+        return [
+            ("sales", "get", self.url_client_list, None),
+            (
+                "sales",
+                "post",
+                self.url_client_list,
+                {
+                    "company_name": "Bench",
+                    "first_name": "Bench",
+                    "last_name": "Mark",
+                    "email": "bench@mark.com",
+                },
+            ),
+            ("sales", "get", self.url_client_detail, None),
+            ("sales", "get", self.url_contract_list, None),
+            (
+                "sales",
+                "post",
+                self.url_contract_list,
+                {"client": self.test_client_1.pk, "amount": 10},
+            ),
+            ("sales", "get", self.url_event_list, None),
+            ("support", "get", self.url_event_list, None),
+            ("support", "get", self.url_client_list, None),
+            ("support", "get", self.url_contract_detail, None),
+        ]
+
+    def test_queries_per_request(self):
+        users = {
+            "sales": self.test_sales_team_member,
+            "support": self.test_support_team_member,
+        }
+        print(f"\n{'request':<45}{'before':>8}{'after':>8}")
+        for role, method, url, data in self.get_requests():
+            with mock.patch.object(
+                LookupManager, "get_by_code", legacy_get_by_code
+            ), mock.patch.object(User, "has_role", legacy_has_role):
+                before = self.count_queries(users[role], method, url, data)
+            # Warm the lookups, as a long-running worker would have them
+            self.count_queries(users[role], method, url, data)
+            after = self.count_queries(users[role], method, url, data)
+            print(
+                f"{role + ' ' + method.upper() + ' ' + str(url):<45}{before:>8}{after:>8}"
+            )
+            self.assertLessEqual(after, before)
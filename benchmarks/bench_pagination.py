@@ -0,0 +1,68 @@
+"""
+Latency of a deep page of /api/clients/ against its first page.
+
+Run with: python manage.py test benchmarks.bench_pagination -p "bench_*.py"
+Set BENCH_ROWS to change the number of seeded clients (e.g. 1000000).
+"""
+
+import os
+import statistics
+import time
+from base64 import b64encode
+from urllib import parse
+
+from clients.models import Client
+from EpicEvents_CRM.pagination import KeysetCursorPagination
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 200_000))
+PAGE_SIZE = 100
+REPEAT = 5
+
+
+class PaginationBenchmark(ProjectAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Client.objects.bulk_create(
+            (
+                Client(
+                    company_name=f"Company {index}",
+                    sales_contact=cls.test_sales_team_member,
+                    first_name="First",
+                    last_name="Last",
+                    email=f"contact{index}@company.com",
+                    status=cls.test_status_existing,
+                )
+                for index in range(ROWS)
+            ),
+            batch_size=5000,
+        )
+
+    def get_cursor(self, page):
+        # Position of the last client of the previous page
+        instance = Client.objects.order_by("date_created", "id")[page * PAGE_SIZE - 1]
+        position = KeysetCursorPagination().encode_position(instance)
+        querystring = parse.urlencode({"p": position})
+        return b64encode(querystring.encode("ascii")).decode("ascii")
+
+    def time_request(self, url):
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            response = self.client.get(url)
+            durations.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()["results"]), PAGE_SIZE)
+        return statistics.median(durations) * 1000
+
+    def test_deep_page_latency(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        url = f"{self.url_client_list}?page_size={PAGE_SIZE}"
+        deep_page = ROWS // PAGE_SIZE // 2
+
+        first = self.time_request(url)
+        deep = self.time_request(f"{url}&cursor={self.get_cursor(deep_page)}")
+        print(f"\n{ROWS} clients, {PAGE_SIZE} per page (median of {REPEAT})")
+        print(f"page 1: {first:.1f} ms")
+        print(f"page {deep_page + 1}: {deep:.1f} ms")
@@ -0,0 +1,141 @@
+"""
+Throughput of concurrent requests to the client list and detail, with a new
+database connection per request, with pooled connections, and with pooled
+connections preparing their repeated statements.
+
+Run with: python manage.py test benchmarks.bench_pool -p "bench_*.py"
+Set BENCH_CONCURRENCY to change the number of concurrent requests,
+BENCH_REQUESTS the total number of requests, and DB_POOL_SIZE the size of
+the pool.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import User, UserRole
+from benchmarks.bench_asgi import wsgi_request
+from clients.models import Client, ClientStatus
+from contracts.models import Contract, ContractStatus
+from EpicEvents_CRM.postgresql_pool.base import DatabaseWrapper
+
+CONCURRENCY = int(os.environ.get("BENCH_CONCURRENCY", 32))
+REQUESTS = int(os.environ.get("BENCH_REQUESTS", 640))
+POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+ROWS = 1000
+
+DATABASE_SETTINGS = {
+    "no pool": {
+        "ENGINE": "django.db.backends.postgresql",
+        "OPTIONS": {},
+    },
+    "pool": {
+        "ENGINE": "EpicEvents_CRM.postgresql_pool",
+        "OPTIONS": {"pool": {"min_size": 2, "max_size": POOL_SIZE}},
+    },
+    "pool, prepared": {
+        "ENGINE": "EpicEvents_CRM.postgresql_pool",
+        "OPTIONS": {
+            "pool": {"min_size": 2, "max_size": POOL_SIZE},
+            "server_side_binding": True,
+            "prepare_threshold": 5,
+        },
+    },
+}
+
+
+@override_settings(RESPONSE_CACHE_ALIAS=None)
+class PoolBenchmark(TransactionTestCase):
+    # Restore the roles and statuses of the data migrations for later tests
+    serialized_rollback = True
+
+    def setUp(self):
+        user = User.objects.create_user(
+            username="bench_sales",
+            password="bench_password",
+            role=UserRole.objects.get(role=UserRole.SALES_TEAM),
+        )
+        self.authorization = f"Bearer {AccessToken.for_user(user)}"
+        clients = Client.objects.bulk_create(
+            Client(
+                company_name=f"Company {index}",
+                sales_contact=user,
+                first_name="First",
+                last_name="Last",
+                email=f"contact{index}@company.com",
+                status=ClientStatus.objects.get(status=ClientStatus.EXISTING),
+            )
+            for index in range(ROWS)
+        )
+        Contract.objects.bulk_create(
+            Contract(
+                client=client,
+                sales_contact=user,
+                status=ContractStatus.objects.get(status=ContractStatus.SIGNED),
+                amount=1000,
+            )
+            for client in clients[:10]
+        )
+        self.paths = ["/api/clients/", f"/api/clients/{clients[0].pk}/"]
+
+        # The connections of the request threads are made from these settings
+        default_settings = connections.settings["default"]
+        self.addCleanup(connections.settings.__setitem__, "default", default_settings)
+
+    def run_wsgi(self, path):
+        application = WSGIHandler()
+        with ThreadPoolExecutor(CONCURRENCY) as executor:
+            statuses = list(
+                executor.map(
+                    lambda _: wsgi_request(application, path, self.authorization),
+                    range(REQUESTS),
+                )
+            )
+        self.assertEqual(set(statuses), {200})
+
+    def time_run(self, database_settings, path):
+        connections.settings["default"] = {
+            **connections.settings["default"],
+            **database_settings,
+        }
+        # Opened again with these settings
+        DatabaseWrapper(connections.settings["default"]).close_pool()
+        # Warm up, e.g. build the detail document and open the pool
+        self.run_wsgi(path)
+        pool = DatabaseWrapper._connection_pools.get("default")
+        if pool is not None:
+            pool.pop_stats()
+        start = time.perf_counter()
+        self.run_wsgi(path)
+        throughput = REQUESTS / (time.perf_counter() - start)
+
+        wait = ""
+        if pool is not None:
+            stats = pool.pop_stats()
+            wait = f"{stats.get('requests_wait_ms', 0) / stats['requests_num']:.1f} ms"
+        return throughput, wait
+
+    def test_pool_throughput(self):
+        print(
+            f"\n{CONCURRENCY} concurrent requests, {REQUESTS} requests, "
+            f"pool of {POOL_SIZE} connections (requests/s, average wait)"
+        )
+        print(
+            f"{'endpoint':<20}" + "".join(f"{name:>22}" for name in DATABASE_SETTINGS)
+        )
+        for path in self.paths:
+            results = [
+                self.time_run(database_settings, path)
+                for database_settings in DATABASE_SETTINGS.values()
+            ]
+            print(
+                f"{path:<20}"
+                + "".join(
+                    f"{f'{throughput:.0f} {wait}':>22}" for throughput, wait in results
+                )
+            )
@@ -0,0 +1,104 @@
+"""
+Bytes read from Postgres for the event list, with or without column projection
+of the event and of the joined rows.
+
+Run with: python manage.py test benchmarks.bench_projection -p "bench_*.py"
+Set BENCH_ROWS to change the number of seeded events, and BENCH_NOTES_SIZE
+the length of their notes.
+"""
+
+import hashlib
+import os
+import statistics
+import time
+from unittest import mock
+
+from django.db import connection
+
+from contracts.models import Contract
+from EpicEvents_CRM.query_plans import apply_query_plan, get_related_columns
+from events.models import Event
+from events.serializers import EventListSerializer
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 20_000))
+NOTES_SIZE = int(os.environ.get("BENCH_NOTES_SIZE", 4000))
+REPEAT = 5
+
+
+def make_notes(index):
+    # Hashes, so that Postgres cannot compress the notes away
+    digests = []
+    while len(digests) * 64 < NOTES_SIZE:
+        digests.append(hashlib.sha256(f"{index}-{len(digests)}".encode()).hexdigest())
+    return "".join(digests)[:NOTES_SIZE]
+
+
+class ProjectionBenchmark(ProjectAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        contracts = Contract.objects.bulk_create(
+            (
+                Contract(
+                    client=cls.test_client_1,
+                    sales_contact=cls.test_client_1.sales_contact,
+                    status=cls.test_status_signed,
+                    amount=index,
+                )
+                for index in range(ROWS)
+            ),
+            batch_size=5000,
+        )
+        Event.objects.bulk_create(
+            (
+                Event(
+                    contract=contract,
+                    sales_contact=contract.sales_contact,
+                    support_contact=cls.test_support_team_member,
+                    status=cls.test_status_created,
+                    attendees=index,
+                    notes=make_notes(index),
+                )
+                for index, contract in enumerate(contracts)
+            ),
+            batch_size=1000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def measure(self, queryset):
+        # Length of every value of the result, as sent by the server
+        sql, params = queryset.query.sql_with_params()
+        durations = []
+        for _ in range(REPEAT):
+            with connection.cursor() as cursor:
+                start = time.perf_counter()
+                cursor.execute(sql, params)
+                durations.append(time.perf_counter() - start)
+                result = cursor.cursor.pgresult
+                size = sum(
+                    len(result.get_value(row, column) or b"")
+                    for row in range(result.ntuples)
+                    for column in range(result.nfields)
+                )
+        return size, statistics.median(durations) * 1000
+
+    def test_bytes_transferred(self):
+        print(f"\n{Event.objects.count()} events with {NOTES_SIZE} characters of notes")
+        print(f"{'event list':<15}{'columns':>10}{'bytes':>16}{'query':>14}")
+        for label, only, joined in (
+            ("all columns", False, True),
+            ("event columns", True, False),
+            ("projected", True, True),
+        ):
+            with mock.patch(
+                "EpicEvents_CRM.query_plans.get_related_columns",
+                get_related_columns if joined else lambda *args: [],
+            ):
+                queryset = apply_query_plan(
+                    Event.objects.all(), EventListSerializer, only=only
+                )
+            columns = len(queryset.query.get_compiler("default").get_select()[0])
+            size, duration = self.measure(queryset)
+            print(f"{label:<15}{columns:>10}{size:>16,}{duration:>11.1f} ms")
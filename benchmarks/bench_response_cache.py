@@ -0,0 +1,81 @@
+"""
+Latency of /api/clients/ and /api/contracts/ with and without the response cache.
+
+Run with: python manage.py test benchmarks.bench_response_cache -p "bench_*.py"
+Set BENCH_ROWS to change the number of seeded clients and contracts.
+"""
+
+import os
+import statistics
+import time
+
+from django.core.cache import caches
+from django.test import override_settings
+
+from clients.models import Client
+from contracts.models import Contract
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 10_000))
+REPEAT = 50
+
+
+class ResponseCacheBenchmark(ProjectAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        clients = Client.objects.bulk_create(
+            (
+                Client(
+                    company_name=f"Company {index}",
+                    sales_contact=cls.test_sales_team_member,
+                    first_name="First",
+                    last_name="Last",
+                    email=f"contact{index}@company.com",
+                    status=cls.test_status_existing,
+                )
+                for index in range(ROWS)
+            ),
+            batch_size=5000,
+        )
+        Contract.objects.bulk_create(
+            (
+                Contract(
+                    client=client,
+                    sales_contact=client.sales_contact,
+                    status=cls.test_status_signed,
+                    amount=1000,
+                )
+                for client in clients
+            ),
+            batch_size=5000,
+        )
+
+    def time_request(self, url):
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            response = self.client.get(url)
+            durations.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+        return statistics.median(durations) * 1000
+
+    def test_response_cache_latency(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        urls = [
+            str(self.url_client_list),
+            self.url_client_list + "?search=Company 12",
+            str(self.url_contract_list),
+        ]
+        print(f"\n{ROWS} clients and contracts (median of {REPEAT})")
+        print(f"{'list':<35}{'uncached':>14}{'cached':>14}")
+        for url in urls:
+            uncached = self.time_request(url)
+            with override_settings(RESPONSE_CACHE_ALIAS="responses"):
+                caches["responses"].clear()
+                cached = self.time_request(url)
+            print(f"{url:<35}{uncached:>11.1f} ms{cached:>11.1f} ms")
+        for route_name, counter in ListCacheMixin.cache_counters.items():
+            hit_rate = counter["hits"] / (counter["hits"] + counter["misses"])
+            print(f"{route_name:<35}{hit_rate:>14.0%} hits")
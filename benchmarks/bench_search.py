@@ -0,0 +1,94 @@
+"""
+Latency of searches with TrigramSearchFilter against DRF's SearchFilter.
+
+Run with: python manage.py test benchmarks.bench_search -p "bench_*.py"
+Set BENCH_ROWS to change the number of seeded clients (e.g. 1000000).
+"""
+
+import os
+import statistics
+import time
+from unittest import mock
+
+from django.db import connection
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters
+
+from clients.models import Client
+from clients.views import ClientListCreateAPIView
+from contracts.models import Contract
+from contracts.views import ContractListCreateAPIView
+from EpicEvents_CRM.search import TrigramSearchFilter
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 200_000))
+REPEAT = 5
+
+
+class SearchBenchmark(ProjectAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        clients = Client.objects.bulk_create(
+            (
+                Client(
+                    company_name=f"Company {index}",
+                    sales_contact=cls.test_sales_team_member,
+                    first_name=f"First{index}",
+                    last_name="Last",
+                    email=f"contact{index}@company.com",
+                    status=cls.test_status_existing,
+                )
+                for index in range(ROWS)
+            ),
+            batch_size=5000,
+        )
+        Contract.objects.bulk_create(
+            (
+                Contract(
+                    client=client,
+                    sales_contact=client.sales_contact,
+                    status=cls.test_status_signed,
+                    amount=index,
+                )
+                for index, client in enumerate(clients)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            # What autovacuum would do, as VACUUM cannot run in a transaction
+            for field_name in ["company_name", "first_name", "last_name", "email"]:
+                cursor.execute(
+                    "SELECT gin_clean_pending_list(%s::regclass)",
+                    [f"client_{field_name}_trgm_idx"],
+                )
+            cursor.execute("ANALYZE")
+
+    def time_request(self, url):
+        durations = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            response = self.client.get(url)
+            durations.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, 200)
+        return statistics.median(durations) * 1000
+
+    def test_search_latency(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        searches = [
+            (ClientListCreateAPIView, self.url_client_list, "contact123457@"),
+            (ClientListCreateAPIView, self.url_client_list, "First98765"),
+            (ContractListCreateAPIView, self.url_contract_list, "contact123457@"),
+            (ContractListCreateAPIView, self.url_contract_list, "12345"),
+        ]
+        print(f"\n{ROWS} clients and contracts (median of {REPEAT})")
+        print(f"{'search':<45}{'SearchFilter':>14}{'trigram':>14}")
+        for view, url, term in searches:
+            url = f"{url}?search={term}"
+            timings = []
+            for search_filter in (filters.SearchFilter, TrigramSearchFilter):
+                with mock.patch.object(
+                    view, "filter_backends", [DjangoFilterBackend, search_filter]
+                ):
+                    timings.append(self.time_request(url))
+            print(f"{url:<45}{timings[0]:>11.1f} ms{timings[1]:>11.1f} ms")
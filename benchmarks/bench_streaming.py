@@ -0,0 +1,69 @@
+"""
+Peak Python heap of a full client list, streamed or built in memory.
+
+Run with: python manage.py test benchmarks.bench_streaming -p "bench_*.py"
+Set BENCH_ROWS to change the number of seeded clients (e.g. 1000000).
+"""
+
+import os
+import tracemalloc
+
+from rest_framework.renderers import JSONRenderer
+
+from clients.models import Client
+from clients.serializers import ClientListSerializer
+from EpicEvents_CRM.query_plans import apply_query_plan
+from tests.test_setup import ProjectAPITestCase
+
+ROWS = int(os.environ.get("BENCH_ROWS", 100_000))
+SMALL_ROWS = 1000
+
+
+class StreamingBenchmark(ProjectAPITestCase):
+    def seed(self, count):
+        Client.objects.bulk_create(
+            (
+                Client(
+                    company_name=f"Company {index}",
+                    sales_contact=self.test_sales_team_member,
+                    first_name="First",
+                    last_name="Last",
+                    email=f"contact{index}@company.com",
+                    status=self.test_status_existing,
+                )
+                for index in range(count)
+            ),
+            batch_size=5000,
+        )
+
+    def measure_streamed(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        tracemalloc.start()
+        response = self.client.get(self.url_client_list + "?stream=true")
+        size = sum(len(chunk) for chunk in response.streaming_content)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size, peak
+
+    def measure_in_memory(self):
+        # What ListCreateAPIView.list does without pagination
+        tracemalloc.start()
+        queryset = apply_query_plan(Client.objects.all(), ClientListSerializer)
+        data = ClientListSerializer(queryset, many=True).data
+        size = len(JSONRenderer().render(data))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size, peak
+
+    def test_peak_memory(self):
+        print(f"\n{'clients':>10}{'bytes':>14}{'streamed':>14}{'in memory':>14}")
+        seeded = 0
+        for count in (SMALL_ROWS, ROWS):
+            self.seed(count - seeded)
+            seeded = count
+            size, streamed_peak = self.measure_streamed()
+            _, in_memory_peak = self.measure_in_memory()
+            print(
+                f"{count:>10}{size:>14}"
+                f"{streamed_peak / 2**20:>11.1f} MB{in_memory_peak / 2**20:>11.1f} MB"
+            )
@@ -0,0 +1,94 @@
+"""
+Latency of the token refresh with many revoked refresh tokens, a day after
+the last refresh, when the user cache no longer has the user: checking the
+revocations by querying the table or through the Bloom filter, and the
+user's token version by reading the user or from the shared token states.
+
+Run with: python manage.py test benchmarks.bench_token_refresh -p "bench_*.py"
+Set BENCH_REVOKED to change the number of revoked tokens.
+"""
+
+import os
+import statistics
+import time
+from datetime import timedelta
+from unittest import mock
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from authentication.managers import CachedUserManager, RevokedTokenManager
+from authentication.models import RevokedToken, User
+from tests.test_setup import ProjectAPITestCase
+
+REVOKED = int(os.environ.get("BENCH_REVOKED", 10000))
+REPEAT = 200
+
+
+def legacy_is_revoked(self, jti):
+    return self.filter(jti=jti).exists()
+
+
+def legacy_get_token_state(self, pk):
+    user = self.get_cached(pk)
+    return user.token_version, user.is_active
+
+
+@override_settings(TOKEN_STATE_CACHE_ALIAS="default")
+class TokenRefreshBenchmark(ProjectAPITestCase):
+    def setUp(self):
+        caches["default"].clear()
+        expires_at = timezone.now() + timedelta(days=1)
+        RevokedToken.objects.bulk_create(
+            RevokedToken(jti=uuid4().hex, expires_at=expires_at) for _ in range(REVOKED)
+        )
+        RevokedToken.objects.clear_cache()
+        User.objects.clear_cache()
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "sales_tester", "password": "s@l3s_73573r"},
+        )
+        self.refresh_token = response.json()["refresh"]
+
+    def measure(self):
+        url = reverse("token_refresh")
+        data = {"refresh": self.refresh_token}
+        # Warm up the Bloom filter and the token state
+        self.client.post(url, data)
+        timings = []
+        for _ in range(REPEAT):
+            User.objects.clear_cache()
+            start = time.perf_counter()
+            response = self.client.post(url, data)
+            timings.append(time.perf_counter() - start)
+        self.assertEqual(response.status_code, 200)
+        User.objects.clear_cache()
+        with CaptureQueriesContext(connection) as context:
+            self.client.post(url, data)
+        return statistics.median(timings) * 1000, len(context.captured_queries)
+
+    def test_token_refresh_latency(self):
+        results = []
+        for label, is_revoked, get_token_state in (
+            ("querying both", legacy_is_revoked, legacy_get_token_state),
+            ("Bloom filter", RevokedTokenManager.is_revoked, legacy_get_token_state),
+            (
+                "+ token states",
+                RevokedTokenManager.is_revoked,
+                CachedUserManager.get_token_state,
+            ),
+        ):
+            with mock.patch.object(
+                RevokedTokenManager, "is_revoked", is_revoked
+            ), mock.patch.object(CachedUserManager, "get_token_state", get_token_state):
+                results.append((label, *self.measure()))
+
+        print(f"\nToken refresh with {REVOKED} revoked tokens and a cold user cache")
+        print(f"{'':<20}{'median (ms)':>12}{'queries':>10}")
+        for label, latency, queries in results:
+            print(f"{label:<20}{latency:>12.2f}{queries:>10}")
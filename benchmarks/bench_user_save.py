@@ -0,0 +1,61 @@
+"""
+Throughput of a bulk role change saving each user, with and without hashing
+the password again on every save.
+
+Run with: python manage.py test benchmarks.bench_user_save -p "bench_*.py"
+Set BENCH_USERS to change the number of users.
+"""
+
+import os
+import time
+from unittest import mock
+
+from django.contrib.auth.models import AbstractUser
+
+from authentication.models import User, UserRole
+from tests.test_setup import ProjectAPITestCase
+
+USERS = int(os.environ.get("BENCH_USERS", 20))
+
+
+def legacy_save(self, *args, **kwargs):
+    is_manager = self.has_role(UserRole.MANAGEMENT)
+    self.is_staff = is_manager
+    self.is_superuser = is_manager
+    self.set_password(self.password)
+    AbstractUser.save(self, *args, **kwargs)
+
+
+class UserSaveBenchmark(ProjectAPITestCase):
+    def setUp(self):
+        role = UserRole.objects.get(role=UserRole.SALES_TEAM)
+        self.users = User.objects.bulk_create(
+            User(username=f"bench_user_{index}", role=role, password="!")
+            for index in range(USERS)
+        )
+        password = self.test_sales_team_member.password
+        User.objects.filter(pk__in=[user.pk for user in self.users]).update(
+            password=password
+        )
+
+    def change_roles(self):
+        # As a bulk action of the admin, which saves each user
+        roles = [
+            UserRole.objects.get_by_code(UserRole.SUPPORT_TEAM),
+            UserRole.objects.get_by_code(UserRole.SALES_TEAM),
+        ]
+        start = time.perf_counter()
+        for role in roles:
+            for user in User.objects.filter(pk__in=[user.pk for user in self.users]):
+                user.role = role
+                user.save()
+        return len(roles) * USERS / (time.perf_counter() - start)
+
+    def test_user_save_throughput(self):
+        with mock.patch.object(User, "save", legacy_save):
+            legacy_throughput = self.change_roles()
+        throughput = self.change_roles()
+
+        print(f"\nRole changes of {USERS} users (saves/s)")
+        print(f"{'rehashing on save':<24}{legacy_throughput:>10.1f}")
+        print(f"{'hashing raw passwords':<24}{throughput:>10.1f}")
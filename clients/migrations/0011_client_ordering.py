@@ -0,0 +1,16 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0010_alter_clientstatus_options"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="client",
+            options={"ordering": ["id"]},
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0011_client_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="client",
+            options={"ordering": ["date_created", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=models.Index(fields=["date_created", "id"], name="client_keyset_idx"),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:53
+
+from django.contrib.postgres.operations import TrigramExtension
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0012_client_keyset_index"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("company_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="client_company_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("first_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="client_first_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("last_name"),
+                    name="gin_trgm_ops",
+                ),
+                name="client_last_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("email"), name="gin_trgm_ops"
+                ),
+                name="client_email_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("clients", "0013_client_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="client",
+            index=models.Index(
+                fields=["sales_contact", "id"], name="client_sales_contact_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="client",
+            name="sales_contact",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="clients",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0014_client_scope_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClientDocument",
+            fields=[
+                ("etag", models.CharField(max_length=64)),
+                ("base_url", models.CharField(max_length=200)),
+                ("content", models.TextField()),
+                (
+                    "client",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="clients.client",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0015_detail_documents"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClientImportKey",
+            fields=[
+                ("source", models.CharField(max_length=50)),
+                ("key", models.CharField(max_length=100)),
+                (
+                    "client",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="clients.client",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="clientimportkey",
+            constraint=models.UniqueConstraint(
+                fields=("source", "key"), name="clients_clientimportkey_unique"
+            ),
+        ),
+    ]
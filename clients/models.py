@@ -1,6 +1,13 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 
+from EpicEvents_CRM.documents import DetailDocument
+from EpicEvents_CRM.imports import ImportKey
+from EpicEvents_CRM.lookups import LookupManager
+from EpicEvents_CRM.tracking import DateUpdatedMixin
+
 
 class ClientStatus(models.Model):
     class Meta:
@@ -17,15 +24,40 @@ class ClientStatus(models.Model):
         choices=STATUS_CHOICES, max_length=3, unique=True, default="PRO"
     )
 
+    objects = LookupManager("status")
+
     def __str__(self):
         return dict(self.STATUS_CHOICES)[str(self.status)]
 
 
-class Client(models.Model):
+class Client(DateUpdatedMixin, models.Model):
+    class Meta:
+        ordering = ["date_created", "id"]
+        indexes = [
+            # Keyset used by the list endpoints' cursor pagination
+            models.Index(fields=["date_created", "id"], name="client_keyset_idx"),
+            # Covers the sales contact's scope on events
+            models.Index(
+                fields=["sales_contact", "id"], name="client_sales_contact_idx"
+            ),
+            # Trigram indexes serving the case-insensitive search
+            *[
+                GinIndex(
+                    OpClass(Upper(field_name), name="gin_trgm_ops"),
+                    name=f"client_{field_name}_trgm_idx",
+                )
+                for field_name in ["company_name", "first_name", "last_name", "email"]
+            ],
+        ]
+
     company_name = models.CharField(max_length=250)
     status = models.ForeignKey(ClientStatus, on_delete=models.PROTECT, null=True)
     sales_contact = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="clients"
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="clients",
+        # Indexed by client_sales_contact_idx
+        db_index=False,
     )
     first_name = models.CharField(max_length=25)
     last_name = models.CharField(max_length=25)
@@ -35,5 +67,26 @@ class Client(models.Model):
     date_created = models.DateTimeField(auto_now_add=True, editable=False)
     date_updated = models.DateTimeField(null=True)
 
+    # Copied to or shown by contracts and events, see contracts.signals and
+    # events.signals
+    tracked_fields = ["sales_contact_id", "company_name"]
+
+    # Read by __str__() and the representations nesting the row
+    str_fields = ["company_name"]
+
     def __str__(self):
         return self.company_name
+
+
+class ClientDocument(DetailDocument):
+    # Kept up to date by clients.signals
+    client = models.OneToOneField(
+        Client, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+
+
+class ClientImportKey(ImportKey):
+    # Written by the import_data command
+    client = models.OneToOneField(
+        Client, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
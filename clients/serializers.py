@@ -2,6 +2,14 @@ from django.core.exceptions import ObjectDoesNotExist
 
 from rest_framework import serializers
 from clients.models import Client, ClientStatus
+from EpicEvents_CRM.bulk import PreloadedPrimaryKeyRelatedField
+from EpicEvents_CRM.pagination import KeysetCursorPagination
+
+
+class ContractsAndEventsPagination(KeysetCursorPagination):
+    # Cursor of the contracts nested in a client detail
+    cursor_query_param = "contracts_cursor"
+    page_size_query_param = "contracts_page_size"
 
 
 class ClientListSerializer(serializers.ModelSerializer):
@@ -11,9 +19,33 @@ class ClientListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Client
         fields = ["id", "company_name", "status", "sales_contact"]
+        select_related = ["status", "sales_contact__role"]
+
+
+class ClientExportSerializer(serializers.ModelSerializer):
+    status = serializers.StringRelatedField()
+    sales_contact = serializers.StringRelatedField()
+
+    class Meta:
+        model = Client
+        fields = [
+            "id",
+            "company_name",
+            "status",
+            "sales_contact",
+            "first_name",
+            "last_name",
+            "email",
+            "phone_number",
+            "mobile_number",
+            "date_created",
+            "date_updated",
+        ]
+        select_related = ["status", "sales_contact__role"]
 
 
 class ClientCreateSerializer(serializers.ModelSerializer):
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
     status_name = serializers.StringRelatedField(source="status")
 
     class Meta:
@@ -53,6 +85,7 @@ class ClientDetailSerializer(serializers.ModelSerializer):
             "date_updated",
             "contracts_and_events",
         ]
+        select_related = ["status", "sales_contact__role"]
 
     def get_sales_contact(self, obj):
         try:
@@ -65,8 +98,12 @@ class ClientDetailSerializer(serializers.ModelSerializer):
             return None
 
     def get_contracts_and_events(self, obj):
+        # One page of contracts, read with their event in a single query
+        paginator = ContractsAndEventsPagination()
+        contracts = obj.contracts.select_related("status", "event__status")
+        page = paginator.paginate_queryset(contracts, self.context["request"])
         contracts_and_events = []
-        for contract in obj.contracts.all():
+        for contract in page:
             contract_and_event = {
                 "contract_id": contract.pk,
                 "contract_status": str(contract.status),
@@ -80,7 +117,11 @@ class ClientDetailSerializer(serializers.ModelSerializer):
             except ObjectDoesNotExist:
                 pass
             contracts_and_events.append(contract_and_event)
-        return contracts_and_events
+        return {
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+            "results": contracts_and_events,
+        }
 
 
 class ClientStatusSerializer(serializers.ModelSerializer):
@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.models import User
+from clients.models import Client, ClientDocument, ClientStatus
+from contracts.models import Contract, ContractStatus
+from events.models import Event, EventStatus
+from EpicEvents_CRM.documents import delete_documents
+from EpicEvents_CRM.response_cache import UNRENDERED_FIELDS
+from EpicEvents_CRM.tracking import touch
+
+
+@receiver(post_save, sender=Contract)
+@receiver(post_delete, sender=Contract)
+def touch_clients_from_contract(sender, instance, **kwargs):
+    # The validators of a client change with the rows it shows
+    touch(Client.objects.filter(pk__in=instance.get_loaded_values("client_id")))
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def touch_clients_from_event(sender, instance, **kwargs):
+    touch(
+        Client.objects.filter(contracts__in=instance.get_loaded_values("contract_id"))
+    )
+
+
+@receiver(post_save, sender=User)
+def touch_clients_from_user(sender, instance, update_fields, **kwargs):
+    if not update_fields or not set(update_fields) <= UNRENDERED_FIELDS:
+        touch(Client.objects.filter(sales_contact=instance))
+
+
+@receiver(post_save, sender=ClientStatus)
+@receiver(post_save, sender=ContractStatus)
+@receiver(post_save, sender=EventStatus)
+def delete_client_documents_from_status(sender, instance, **kwargs):
+    # A renamed status does not change the validators of the rows showing it
+    delete_documents(ClientDocument.objects.all())
@@ -1,22 +1,34 @@
 from django.core.exceptions import ObjectDoesNotExist
 
+import json
+import operator
+from functools import reduce
 from unittest import mock
 
+from django.db import connection
+from django.test import override_settings
+
+from clients.models import Client
+from clients.views import ClientListCreateAPIView
+from contracts.models import Contract
+from EpicEvents_CRM.search import TrigramSearchFilter
 from tests.test_setup import ProjectAPITestCase
 from tests.mocks import mock_perform_update, TEST_UPDATE_TIME
 
 
 class ClientAPITestCase(ProjectAPITestCase):
     def get_client_list_data(self, clients):
-        return [
-            {
-                "id": client.pk,
-                "company_name": client.company_name,
-                "status": str(client.status),
-                "sales_contact": str(client.sales_contact),
-            }
-            for client in clients
-        ]
+        return self.get_page(
+            [
+                {
+                    "id": client.pk,
+                    "company_name": client.company_name,
+                    "status": str(client.status),
+                    "sales_contact": str(client.sales_contact),
+                }
+                for client in clients
+            ]
+        )
 
     def get_client_detail_data(self, client):
         return {
@@ -53,7 +65,7 @@ class ClientAPITestCase(ProjectAPITestCase):
             except ObjectDoesNotExist:
                 pass
             contracts_and_events.append(contract_and_event)
-        return contracts_and_events
+        return self.get_page(contracts_and_events)
 
 
 class TestClient(ClientAPITestCase):
@@ -62,7 +74,7 @@ class TestClient(ClientAPITestCase):
             # Unauthenticated user
             (None, 401, {"detail": "Authentication credentials were not provided."}),
             # Support User with no event assigned
-            (self.test_support_team_member_3, 200, []),
+            (self.test_support_team_member_3, 200, self.get_client_list_data([])),
             # Support User with client's event assigned
             (
                 self.test_support_team_member,
@@ -157,7 +169,7 @@ class TestClient(ClientAPITestCase):
             # Searching for phone number
             (
                 "?search=5554567859",
-                [],
+                self.get_client_list_data([]),
             ),
         ]
         for query_parameter_test, expected_json in test_client_list_search_params:
@@ -173,6 +185,77 @@ class TestClient(ClientAPITestCase):
                 self.assertEqual(response.status_code, 200)
                 self.assertEqual(response.json(), expected_json)
 
+    def test_client_list_pagination(self):
+        self.create_clients_with_contracts_and_events(5)
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        expected_clients = list(Client.objects.filter(company_name__startswith="Comp"))
+
+        # Walk the pages forward, keeping the search parameter
+        pages = []
+        url = self.url_client_list + "?search=Company&page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json())
+            url = response.json()["next"]
+
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 1])
+        self.assertEqual(
+            [client for page in pages for client in page["results"]],
+            self.get_client_list_data(expected_clients)["results"],
+        )
+
+        # Walk back from the last page
+        response = self.client.get(pages[-1]["previous"])
+        self.assertEqual(response.json()["results"], pages[1]["results"])
+
+    def test_client_list_stream(self):
+        self.create_clients_with_contracts_and_events(5)
+        test_client_list_stream_params = [
+            (
+                "?stream=true",
+                self.get_client_list_data(Client.objects.all())["results"],
+            ),
+            (
+                "?stream=true&search=Company",
+                self.get_client_list_data(
+                    Client.objects.filter(company_name__startswith="Company")
+                )["results"],
+            ),
+            ("?stream=true&search=Unknown", []),
+        ]
+        for query_parameter_test, expected_json in test_client_list_stream_params:
+            with self.subTest(
+                query_parameter_test=query_parameter_test,
+                expected_json=expected_json,
+            ):
+                self.client.force_authenticate(user=self.test_sales_team_member)
+                response = self.client.get(self.url_client_list + query_parameter_test)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.streaming)
+                content = b"".join(response.streaming_content)
+                self.assertEqual(json.loads(content), expected_json)
+
+    def test_client_list_query_count(self):
+        self.assertListQueriesDoNotGrow(
+            self.url_client_list,
+            [self.test_sales_team_member, self.test_support_team_member],
+        )
+
+    def test_client_list_search_uses_trigram_indexes(self):
+        search_fields = ClientListCreateAPIView.search_fields
+        conditions = TrigramSearchFilter().get_conditions(
+            Client, search_fields, "Apple"
+        )
+        queryset = Client.objects.filter(reduce(operator.or_, conditions)).order_by()
+        with connection.cursor() as cursor:
+            # The test tables are too small for the planner to prefer indexes
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        for field_name in search_fields:
+            self.assertIn(f"client_{field_name}_trgm_idx", plan)
+
     def test_client_create(self):
         test_client_create_params = [
             # Unauthenticated user
@@ -267,6 +350,52 @@ class TestClient(ClientAPITestCase):
                 self.assertEqual(response.status_code, expected_status_code)
                 self.assertEqual(response.json(), expected_json)
 
+    def test_client_detail_contracts_pagination(self):
+        for amount in range(1000, 6000, 1000):
+            Contract.objects.create(
+                client=self.test_client_1,
+                status=self.test_status_signed,
+                amount=amount,
+            )
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        expected_contracts_and_events = self.get_contracts_and_events_from_client(
+            self.test_client_1
+        )["results"]
+
+        # Walk the contracts' pages forward
+        pages = []
+        url = self.url_client_detail + "?contracts_page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json()["contracts_and_events"])
+            url = pages[-1]["next"]
+
+        self.assertEqual([len(page["results"]) for page in pages], [2, 2, 2])
+        self.assertEqual(
+            [contract for page in pages for contract in page["results"]],
+            expected_contracts_and_events,
+        )
+
+        # Walk back from the last page
+        response = self.client.get(pages[-1]["previous"])
+        self.assertEqual(response.json()["contracts_and_events"], pages[1])
+
+    @override_settings(DETAIL_DOCUMENTS=False)
+    def test_client_detail_query_count(self):
+        # Warm the role and status lookups before counting
+        self.count_queries(self.test_sales_team_member, self.url_client_detail)
+        expected_count = self.count_queries(
+            self.test_sales_team_member, self.url_client_detail
+        )
+        Contract.objects.bulk_create(
+            Contract(client=self.test_client_1, amount=1000) for _ in range(200)
+        )
+        self.assertEqual(
+            self.count_queries(self.test_sales_team_member, self.url_client_detail),
+            expected_count,
+        )
+
     @mock.patch("clients.views.ClientDetailAPIView.perform_update", mock_perform_update)
     def test_client_update(self):
         test_client_update_params = [
@@ -333,3 +462,15 @@ class TestClient(ClientAPITestCase):
 
                 self.assertEqual(response.status_code, expected_status_code)
                 self.assertEqual(response.json(), expected_json)
+
+    def test_client_sales_contact_propagates(self):
+        self.test_client_1.sales_contact = self.test_sales_team_member_2
+        self.test_client_1.save()
+
+        contracts = self.test_client_1.contracts.select_related("event")
+        self.assertTrue(contracts)
+        for contract in contracts:
+            self.assertEqual(contract.sales_contact, self.test_sales_team_member_2)
+            self.assertEqual(
+                contract.event.sales_contact, self.test_sales_team_member_2
+            )
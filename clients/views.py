@@ -1,58 +1,147 @@
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
-from rest_framework import generics, permissions, filters
+from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
 
 from clients import serializers, models
 from clients.permissions import IsContactOrReadOnly
 
-from authentication.models import UserRole
+from authentication.models import User, UserRole
+from contracts.models import Contract
+from events.models import Event, SupportAccess
+from EpicEvents_CRM.async_views import (
+    AsyncListMixin,
+    AsyncListModelMixin,
+    AsyncRetrieveMixin,
+    AsyncRetrieveModelMixin,
+)
+from EpicEvents_CRM.bulk import BulkCreateMixin, BulkUpdateMixin
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.documents import DocumentDetailMixin
+from EpicEvents_CRM.export import ExportMixin
+from EpicEvents_CRM.pagination import KeysetCursorPagination
+from EpicEvents_CRM.query_plans import QueryPlanMixin
+from EpicEvents_CRM.replicas import ReplicaReadMixin
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from EpicEvents_CRM.search import TrigramSearchFilter
+from EpicEvents_CRM.streaming import StreamingListMixin
+from EpicEvents_CRM.tracking import touch
 
 
 class ClientQuerysetMixin:
     def get_queryset(self):
         # Sales Team may access all clients
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM):
+        if self.request.user.has_role(UserRole.SALES_TEAM):
             return models.Client.objects.all()
         # Support Team may only access clients related to their events
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SUPPORT_TEAM):
+        if self.request.user.has_role(UserRole.SUPPORT_TEAM):
+            # Semi-join, so that a client is listed once whatever its events
             return models.Client.objects.filter(
-                contracts__event__support_contact=self.request.user
+                Exists(
+                    SupportAccess.objects.filter(
+                        user=self.request.user, client=OuterRef("pk")
+                    )
+                )
             )
 
 
-class ClientListCreateAPIView(ClientQuerysetMixin, generics.ListCreateAPIView):
+class ClientListCreateAPIView(
+    ReplicaReadMixin,
+    StreamingListMixin,
+    ListCacheMixin,
+    BulkCreateMixin,
+    QueryPlanMixin,
+    ClientQuerysetMixin,
+    AsyncListModelMixin,
+    generics.ListCreateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = ["company_name", "first_name", "last_name", "email"]
     search_fields = ["company_name", "first_name", "last_name", "email"]
+    # Rows rendered by the list, or deciding which clients a user sees
+    cache_dependencies = [models.Client, models.ClientStatus, User, SupportAccess]
+    # Sales Team members all see every client
+    cache_shared_roles = [UserRole.SALES_TEAM]
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return serializers.ClientCreateSerializer
         return serializers.ClientListSerializer
 
-    def perform_create(self, serializer):
+    def prepare_create(self, validated_data):
         # Give a default status to client upon creation
         try:
-            if serializer.validated_data["status"] is None:
+            if validated_data["status"] is None:
                 raise KeyError
         except KeyError:
-            serializer.validated_data["status"] = models.ClientStatus.objects.get(
-                status=models.ClientStatus.PROSPECT
+            validated_data["status"] = models.ClientStatus.objects.get_by_code(
+                models.ClientStatus.PROSPECT
             )
-        serializer.save(sales_contact=self.request.user)
+        validated_data["sales_contact"] = self.request.user
 
 
-class ClientDetailAPIView(ClientQuerysetMixin, generics.RetrieveUpdateAPIView):
+class ClientExportAPIView(ExportMixin, ClientListCreateAPIView):
+    http_method_names = ["get", "head", "options"]
+    export_filename = "clients"
+
+    def get_serializer_class(self):
+        return serializers.ClientExportSerializer
+
+
+class ClientDetailAPIView(
+    ReplicaReadMixin,
+    ConditionalDetailMixin,
+    DocumentDetailMixin,
+    QueryPlanMixin,
+    ClientQuerysetMixin,
+    AsyncRetrieveModelMixin,
+    generics.RetrieveUpdateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
     serializer_class = serializers.ClientDetailSerializer
     lookup_field = "pk"
+    document_model = models.ClientDocument
 
     def perform_update(self, serializer):
         serializer.save(date_updated=timezone.now())
 
 
-class ClientStatusListAPIView(generics.ListAPIView):
+class AsyncClientListCreateAPIView(AsyncListMixin, ClientListCreateAPIView):
+    pass
+
+
+class AsyncClientDetailAPIView(AsyncRetrieveMixin, ClientDetailAPIView):
+    # The contracts page is read by the serializer
+    serializer_reads_rows = True
+
+
+class ClientBulkUpdateAPIView(
+    ReplicaReadMixin, BulkUpdateMixin, ClientQuerysetMixin, generics.GenericAPIView
+):
+    permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
+    serializer_class = serializers.ClientDetailSerializer
+    bulk_filter_fields = ["status"]
+    bulk_update_fields = [
+        "company_name",
+        "status",
+        "first_name",
+        "last_name",
+        "email",
+        "phone_number",
+        "mobile_number",
+    ]
+
+    def perform_bulk_update(self, ids, values):
+        super().perform_bulk_update(ids, values)
+        # What the signals do for each client
+        if "company_name" in values:
+            touch(Contract.objects.filter(client__in=ids))
+            touch(Event.objects.filter(contract__client__in=ids))
+
+
+class ClientStatusListAPIView(QueryPlanMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
     serializer_class = serializers.ClientStatusSerializer
     queryset = models.ClientStatus.objects.all()
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0008_alter_contractstatus_options"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="contract",
+            options={"ordering": ["id"]},
+        ),
+    ]
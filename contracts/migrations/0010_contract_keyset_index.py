@@ -0,0 +1,22 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0009_contract_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="contract",
+            options={"ordering": ["date_created", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(
+                fields=["date_created", "id"], name="contract_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0010_contract_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(fields=["amount"], name="contract_amount_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(fields=["payment_due"], name="contract_payment_due_idx"),
+        ),
+    ]
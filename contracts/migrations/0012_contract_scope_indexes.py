@@ -0,0 +1,32 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0014_client_scope_indexes"),
+        ("contracts", "0011_contract_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(fields=["client", "id"], name="contract_client_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(fields=["id", "client"], name="contract_id_client_idx"),
+        ),
+        migrations.AlterField(
+            model_name="contract",
+            name="client",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="contracts",
+                to="clients.client",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 10000
+
+
+def copy_clients_sales_contact(apps, schema_editor):
+    # Copy each client's sales contact to its contracts, one batch at a time,
+    # so that no long transaction locks the whole table
+    Client = apps.get_model("clients", "Client")
+    Contract = apps.get_model("contracts", "Contract")
+
+    last_id = Contract.objects.aggregate(models.Max("id"))["id__max"] or 0
+    for start in range(0, last_id + 1, BATCH_SIZE):
+        Contract.objects.filter(id__gte=start, id__lt=start + BATCH_SIZE).update(
+            sales_contact=models.Subquery(
+                Client.objects.filter(id=models.OuterRef("client")).values(
+                    "sales_contact"
+                )[:1]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contracts", "0012_contract_scope_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contract",
+            name="sales_contact",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sales_contracts",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(copy_clients_sales_contact, migrations.RunPython.noop),
+    ]
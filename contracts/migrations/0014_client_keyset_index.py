@@ -0,0 +1,23 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0013_contract_sales_contact"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contract",
+            index=models.Index(
+                fields=["client", "date_created", "id"],
+                name="contract_client_keyset_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="contract",
+            name="contract_client_idx",
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0014_client_keyset_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContractDocument",
+            fields=[
+                ("etag", models.CharField(max_length=64)),
+                ("base_url", models.CharField(max_length=200)),
+                ("content", models.TextField()),
+                (
+                    "contract",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="contracts.contract",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
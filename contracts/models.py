@@ -1,4 +1,10 @@
+from django.conf import settings
 from django.db import models
+
+from EpicEvents_CRM.documents import DetailDocument
+from EpicEvents_CRM.imports import ImportKey
+from EpicEvents_CRM.lookups import LookupManager
+from EpicEvents_CRM.tracking import DateUpdatedMixin
 from clients.models import Client
 
 
@@ -17,13 +23,44 @@ class ContractStatus(models.Model):
     ]
     status = models.CharField(choices=STATUS_CHOICES, max_length=3, unique=True)
 
+    objects = LookupManager("status")
+
     def __str__(self):
         return dict(self.STATUS_CHOICES)[str(self.status)]
 
 
-class Contract(models.Model):
+class Contract(DateUpdatedMixin, models.Model):
+    class Meta:
+        ordering = ["date_created", "id"]
+        indexes = [
+            # Keyset used by the list endpoints' cursor pagination
+            models.Index(fields=["date_created", "id"], name="contract_keyset_idx"),
+            # Keyset of a client's contracts, paginated in the client detail
+            models.Index(
+                fields=["client", "date_created", "id"],
+                name="contract_client_keyset_idx",
+            ),
+            # Covers the role scopes going from a contract to its client
+            models.Index(fields=["id", "client"], name="contract_id_client_idx"),
+            # Typed search on numbers and dates
+            models.Index(fields=["amount"], name="contract_amount_idx"),
+            models.Index(fields=["payment_due"], name="contract_payment_due_idx"),
+        ]
+
     client = models.ForeignKey(
-        Client, on_delete=models.CASCADE, related_name="contracts"
+        Client,
+        on_delete=models.CASCADE,
+        related_name="contracts",
+        # Indexed by contract_client_keyset_idx
+        db_index=False,
+    )
+    # Copy of the client's sales contact, kept in sync by contracts.signals
+    sales_contact = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="sales_contracts",
+        null=True,
+        editable=False,
     )
     status = models.ForeignKey(ContractStatus, on_delete=models.PROTECT, null=True)
     amount = models.DecimalField(decimal_places=2, max_digits=16)
@@ -31,5 +68,42 @@ class Contract(models.Model):
     date_created = models.DateTimeField(auto_now_add=True, editable=False)
     date_updated = models.DateTimeField(null=True)
 
+    # Copied to events and to the support access by events.signals, and
+    # client_id read by save()
+    tracked_fields = ["client_id", "sales_contact_id"]
+
+    # Read by __str__() and the representations nesting the row
+    str_fields = ["client", "amount"]
+
+    def save(self, *args, **kwargs):
+        # Copy the sales contact of a new or moved contract's client
+        if self.has_changed("client_id"):
+            if Contract.client.is_cached(self):
+                self.sales_contact_id = self.client.sales_contact_id
+            else:
+                self.sales_contact_id = (
+                    Client.objects.filter(pk=self.client_id)
+                    .values_list("sales_contact_id", flat=True)
+                    .get()
+                )
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "sales_contact"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.client}, {'{:.2f}'.format(self.amount)}"
+
+
+class ContractDocument(DetailDocument):
+    # Kept up to date by contracts.signals
+    contract = models.OneToOneField(
+        Contract, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+
+
+class ContractImportKey(ImportKey):
+    # Written by the import_data command
+    contract = models.OneToOneField(
+        Contract, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
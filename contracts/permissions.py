@@ -7,9 +7,9 @@ class IsContactOrReadOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM)
+        return request.user.has_role(UserRole.SALES_TEAM)
 
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user == obj.client.sales_contact
+        return obj.sales_contact_id == request.user.pk
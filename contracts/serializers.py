@@ -2,19 +2,42 @@ from django.core.exceptions import ObjectDoesNotExist
 
 from rest_framework import serializers
 from contracts.models import Contract, ContractStatus
+from EpicEvents_CRM.bulk import PreloadedPrimaryKeyRelatedField
 
 
 class ContractListSerializer(serializers.ModelSerializer):
     client = serializers.StringRelatedField()
     status = serializers.StringRelatedField()
-    sales_contact = serializers.StringRelatedField(source="client.sales_contact")
+    sales_contact = serializers.StringRelatedField()
 
     class Meta:
         model = Contract
         fields = ["id", "client", "status", "sales_contact"]
+        select_related = ["client", "sales_contact__role", "status"]
+
+
+class ContractExportSerializer(serializers.ModelSerializer):
+    client = serializers.CharField(source="client.company_name")
+    status = serializers.StringRelatedField()
+    sales_contact = serializers.StringRelatedField()
+
+    class Meta:
+        model = Contract
+        fields = [
+            "id",
+            "client",
+            "status",
+            "amount",
+            "payment_due",
+            "sales_contact",
+            "date_created",
+            "date_updated",
+        ]
+        select_related = ["client", "status", "sales_contact__role"]
 
 
 class ContractCreateSerializer(serializers.ModelSerializer):
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
     client_company_name = serializers.StringRelatedField(source="client")
     status_name = serializers.StringRelatedField(source="status")
 
@@ -29,6 +52,7 @@ class ContractCreateSerializer(serializers.ModelSerializer):
             "amount",
             "payment_due",
         ]
+        select_related = ["client", "status"]
 
 
 class ContractDetailSerializer(serializers.ModelSerializer):
@@ -52,13 +76,14 @@ class ContractDetailSerializer(serializers.ModelSerializer):
             "date_updated",
             "event",
         ]
+        select_related = ["client", "sales_contact__role", "status", "event"]
 
     def get_sales_contact(self, obj):
         try:
             return {
-                "id": obj.client.sales_contact.pk,
-                "full_name": obj.client.sales_contact.get_full_name(),
-                "role": obj.client.sales_contact.role.get_role_display(),
+                "id": obj.sales_contact.pk,
+                "full_name": obj.sales_contact.get_full_name(),
+                "role": obj.sales_contact.role.get_role_display(),
             }
         except AttributeError:
             return None
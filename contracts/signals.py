@@ -0,0 +1,44 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from authentication.models import User
+from clients.models import Client
+from contracts.models import Contract, ContractDocument, ContractStatus
+from events.models import Event
+from EpicEvents_CRM.documents import delete_documents
+from EpicEvents_CRM.response_cache import UNRENDERED_FIELDS
+from EpicEvents_CRM.tracking import touch
+
+
+@receiver(post_save, sender=Client)
+def update_contracts_sales_contact(sender, instance, created, **kwargs):
+    # Keep the contracts' copy of the sales contact in sync with their client
+    if not created and instance.has_changed("sales_contact_id"):
+        Contract.objects.filter(client=instance).exclude(
+            sales_contact=instance.sales_contact_id
+        ).update(sales_contact=instance.sales_contact_id, date_updated=timezone.now())
+
+
+@receiver(post_save, sender=Client)
+def touch_contracts_from_client(sender, instance, created, **kwargs):
+    # The validators of a contract change with the rows it shows
+    if not created and instance.has_changed("company_name"):
+        touch(Contract.objects.filter(client=instance))
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def touch_contracts_from_event(sender, instance, **kwargs):
+    touch(Contract.objects.filter(pk__in=instance.get_loaded_values("contract_id")))
+
+
+@receiver(post_save, sender=User)
+def touch_contracts_from_user(sender, instance, update_fields, **kwargs):
+    if not update_fields or not set(update_fields) <= UNRENDERED_FIELDS:
+        touch(Contract.objects.filter(sales_contact=instance))
+
+
+@receiver(post_save, sender=ContractStatus)
+def delete_contract_documents_from_status(sender, instance, **kwargs):
+    delete_documents(ContractDocument.objects.all())
@@ -1,21 +1,29 @@
 from django.core.exceptions import ObjectDoesNotExist
 from unittest import mock
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from contracts.models import Contract
+from events.models import Event
+
 from tests.test_setup import ProjectAPITestCase
 from tests.mocks import mock_perform_update, TEST_UPDATE_TIME
 
 
 class ContractAPITestCase(ProjectAPITestCase):
     def get_contract_list_data(self, contracts):
-        return [
-            {
-                "id": contract.pk,
-                "client": str(contract.client),
-                "status": str(contract.status),
-                "sales_contact": str(contract.client.sales_contact),
-            }
-            for contract in contracts
-        ]
+        return self.get_page(
+            [
+                {
+                    "id": contract.pk,
+                    "client": str(contract.client),
+                    "status": str(contract.status),
+                    "sales_contact": str(contract.client.sales_contact),
+                }
+                for contract in contracts
+            ]
+        )
 
     def get_event(self, contract):
         try:
@@ -50,7 +58,7 @@ class TestContract(ContractAPITestCase):
             # Unauthenticated user
             (None, 401, {"detail": "Authentication credentials were not provided."}),
             # Support User with no events assigned
-            (self.test_support_team_member_3, 200, []),
+            (self.test_support_team_member_3, 200, self.get_contract_list_data([])),
             # Support User with events assigned
             (
                 self.test_support_team_member,
@@ -165,7 +173,7 @@ class TestContract(ContractAPITestCase):
             # Searching for phone number
             (
                 "?search=5554567859",
-                [],
+                self.get_contract_list_data([]),
             ),
             # Searching for payment due date
             (
@@ -177,6 +185,26 @@ class TestContract(ContractAPITestCase):
                 "?search=30000",
                 self.get_contract_list_data([self.test_contract_3]),
             ),
+            # Searching for amount with decimals
+            (
+                "?search=30000.00",
+                self.get_contract_list_data([self.test_contract_3]),
+            ),
+            # Searching for part of an amount
+            (
+                "?search=3000",
+                self.get_contract_list_data([]),
+            ),
+            # Searching for an invalid date
+            (
+                "?search=2023-12-32",
+                self.get_contract_list_data([]),
+            ),
+            # Searching for a name and an amount
+            (
+                "?search=Bill 30000",
+                self.get_contract_list_data([self.test_contract_3]),
+            ),
         ]
         for query_parameter_test, expected_json in test_contract_list_search_params:
             with self.subTest(
@@ -191,6 +219,12 @@ class TestContract(ContractAPITestCase):
                 self.assertEqual(response.status_code, 200)
                 self.assertEqual(response.json(), expected_json)
 
+    def test_contract_list_query_count(self):
+        self.assertListQueriesDoNotGrow(
+            self.url_contract_list,
+            [self.test_sales_team_member, self.test_support_team_member],
+        )
+
     def test_contract_create(self):
         test_contract_create_params = [
             # Unauthenticated user
@@ -361,3 +395,27 @@ class TestContract(ContractAPITestCase):
                 )
                 # self.assertEqual(response.status_code, expected_status_code)
                 self.assertEqual(response.json(), expected_json)
+
+    def test_contract_sales_contact_follows_client(self):
+        contract = Contract.objects.get(pk=self.test_contract_1.pk)
+        contract.amount = 11000
+        with CaptureQueriesContext(connection) as context:
+            contract.save()
+        # The client is only read when the contract moves
+        self.assertFalse(
+            [
+                query
+                for query in context.captured_queries
+                if query["sql"].startswith("SELECT")
+                and 'FROM "clients_client"' in query["sql"]
+            ]
+        )
+
+        contract.client_id = self.test_client_2.pk
+        contract.save(update_fields=["client"])
+        contract.refresh_from_db()
+        self.assertEqual(contract.sales_contact, self.test_sales_team_member_2)
+        self.assertEqual(
+            Event.objects.get(contract=contract).sales_contact,
+            self.test_sales_team_member_2,
+        )
@@ -1,29 +1,63 @@
 from django.core.exceptions import PermissionDenied
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
-from rest_framework import generics, permissions, filters
+from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
 
 from contracts import serializers, models
 from contracts.permissions import IsContactOrReadOnly
 
-from authentication.models import UserRole
+from authentication.models import User, UserRole
+from clients.models import Client
+from events.models import Event, SupportAccess
+from EpicEvents_CRM.async_views import (
+    AsyncListMixin,
+    AsyncListModelMixin,
+    AsyncRetrieveMixin,
+    AsyncRetrieveModelMixin,
+)
+from EpicEvents_CRM.bulk import BulkCreateMixin, BulkUpdateMixin
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.documents import DocumentDetailMixin
+from EpicEvents_CRM.export import ExportMixin
+from EpicEvents_CRM.pagination import KeysetCursorPagination
+from EpicEvents_CRM.query_plans import QueryPlanMixin
+from EpicEvents_CRM.replicas import ReplicaReadMixin
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from EpicEvents_CRM.search import TrigramSearchFilter
+from EpicEvents_CRM.streaming import StreamingListMixin
+from EpicEvents_CRM.tracking import touch
 
 
 class ContractQuerysetMixin:
     def get_queryset(self):
         # Sales Team may access all contracts
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM):
+        if self.request.user.has_role(UserRole.SALES_TEAM):
             return models.Contract.objects.all()
         # Support Team may only access contracts related to their events
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SUPPORT_TEAM):
+        if self.request.user.has_role(UserRole.SUPPORT_TEAM):
             return models.Contract.objects.filter(
-                event__support_contact=self.request.user
+                Exists(
+                    SupportAccess.objects.filter(
+                        user=self.request.user, contract=OuterRef("pk")
+                    )
+                )
             )
 
 
-class ContractListCreateAPIView(ContractQuerysetMixin, generics.ListCreateAPIView):
+class ContractListCreateAPIView(
+    ReplicaReadMixin,
+    StreamingListMixin,
+    ListCacheMixin,
+    BulkCreateMixin,
+    QueryPlanMixin,
+    ContractQuerysetMixin,
+    AsyncListModelMixin,
+    generics.ListCreateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = [
         "client__company_name",
         "client__first_name",
@@ -40,40 +74,99 @@ class ContractListCreateAPIView(ContractQuerysetMixin, generics.ListCreateAPIVie
         "payment_due",
         "amount",
     ]
+    # Rows rendered by the list, or deciding which contracts a user sees
+    cache_dependencies = [
+        models.Contract,
+        models.ContractStatus,
+        Client,
+        User,
+        SupportAccess,
+    ]
+    # Sales Team members all see every contract
+    cache_shared_roles = [UserRole.SALES_TEAM]
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return serializers.ContractCreateSerializer
         return serializers.ContractListSerializer
 
-    def perform_create(self, serializer):
+    def prepare_create(self, validated_data):
         # Check that the user trying to create the contract is the client's sales contact
-        sales_contact = serializer.validated_data["client"].sales_contact
-        if sales_contact == self.request.user:
+        sales_contact_id = validated_data["client"].sales_contact_id
+        if sales_contact_id == self.request.user.pk:
             # Give a default status to contract upon creation
             try:
-                if serializer.validated_data["status"] is None:
+                if validated_data["status"] is None:
                     raise KeyError
             except KeyError:
-                serializer.validated_data["status"] = models.ContractStatus.objects.get(
-                    status=models.ContractStatus.UNSIGNED
+                validated_data["status"] = models.ContractStatus.objects.get_by_code(
+                    models.ContractStatus.UNSIGNED
                 )
-            serializer.save()
         else:
             # Deny permission to create contract if user is not the client's sales_contact
             raise PermissionDenied
 
+    def perform_bulk_create(self, instances):
+        # What Contract.save() and the signals do for each contract
+        for contract in instances:
+            contract.sales_contact_id = contract.client.sales_contact_id
+        super().perform_bulk_create(instances)
+        touch(
+            Client.objects.filter(pk__in={contract.client_id for contract in instances})
+        )
+
+
+class ContractExportAPIView(ExportMixin, ContractListCreateAPIView):
+    http_method_names = ["get", "head", "options"]
+    export_filename = "contracts"
 
-class ContractDetailAPIView(ContractQuerysetMixin, generics.RetrieveUpdateAPIView):
+    def get_serializer_class(self):
+        return serializers.ContractExportSerializer
+
+
+class ContractDetailAPIView(
+    ReplicaReadMixin,
+    ConditionalDetailMixin,
+    DocumentDetailMixin,
+    QueryPlanMixin,
+    ContractQuerysetMixin,
+    AsyncRetrieveModelMixin,
+    generics.RetrieveUpdateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
     serializer_class = serializers.ContractDetailSerializer
     lookup_field = "pk"
+    document_model = models.ContractDocument
 
     def perform_update(self, serializer):
         serializer.save(date_updated=timezone.now())
 
 
-class ContractStatusListAPIView(generics.ListAPIView):
+class AsyncContractListCreateAPIView(AsyncListMixin, ContractListCreateAPIView):
+    pass
+
+
+class AsyncContractDetailAPIView(AsyncRetrieveMixin, ContractDetailAPIView):
+    pass
+
+
+class ContractBulkUpdateAPIView(
+    ReplicaReadMixin, BulkUpdateMixin, ContractQuerysetMixin, generics.GenericAPIView
+):
+    permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
+    serializer_class = serializers.ContractDetailSerializer
+    bulk_filter_fields = ["status", "client"]
+    # Not the client, copied to the contract's event and support access
+    bulk_update_fields = ["status", "amount", "payment_due"]
+
+    def perform_bulk_update(self, ids, values):
+        super().perform_bulk_update(ids, values)
+        # What the signals do for each contract
+        touch(Client.objects.filter(contracts__in=ids))
+        touch(Event.objects.filter(contract__in=ids))
+
+
+class ContractStatusListAPIView(QueryPlanMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsContactOrReadOnly]
     serializer_class = serializers.ContractStatusSerializer
     queryset = models.ContractStatus.objects.all()
@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+
+from clients.views import ClientDetailAPIView
+from contracts.views import ContractDetailAPIView
+from events.views import EventDetailAPIView
+from EpicEvents_CRM.conditional import read_validators
+from EpicEvents_CRM.documents import build_document_request, render_document
+from EpicEvents_CRM.query_plans import apply_query_plan
+
+DETAIL_VIEWS = [
+    (ClientDetailAPIView, "client-detail"),
+    (ContractDetailAPIView, "contract-detail"),
+    (EventDetailAPIView, "event-detail"),
+]
+
+
+class Command(BaseCommand):
+    help = "Check that the detail documents match the objects they render."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the inconsistent and outdated documents, to be built "
+            "again on their next request.",
+        )
+
+    def handle(self, *args, **options):
+        inconsistent_count = 0
+        for view_class, url_name in DETAIL_VIEWS:
+            document_model = view_class.document_model
+            inconsistent, outdated = self.check_documents(view_class, url_name)
+            self.stdout.write(
+                f"{document_model._meta.verbose_name_plural}: "
+                f"{len(inconsistent)} inconsistent, {len(outdated)} outdated"
+            )
+            if options["delete"]:
+                document_model.objects.filter(pk__in=inconsistent + outdated).delete()
+            else:
+                inconsistent_count += len(inconsistent)
+
+        if inconsistent_count:
+            raise CommandError(
+                f"{inconsistent_count} documents do not match their object. "
+                f"Run detail_documents --delete to build them again."
+            )
+        self.stdout.write(self.style.SUCCESS("Detail documents are consistent."))
+
+    def check_documents(self, view_class, url_name):
+        # Documents served with a wrong content, and documents of an
+        # older version of their object, which are no longer served
+        inconsistent, outdated = [], []
+        serializer_class = view_class.serializer_class
+        model = serializer_class.Meta.model
+        queryset = apply_query_plan(model.objects.all(), serializer_class)
+        for document in view_class.document_model.objects.iterator():
+            etag, _ = read_validators(model.objects.filter(pk=document.pk))
+            if etag != document.etag:
+                outdated.append(document.pk)
+                continue
+            request = build_document_request(
+                document.base_url, reverse(url_name, kwargs={"pk": document.pk})
+            )
+            serializer = serializer_class(
+                queryset.get(pk=document.pk), context={"request": request}
+            )
+            if render_document(serializer.data) != document.content:
+                inconsistent.append(document.pk)
+        return inconsistent, outdated
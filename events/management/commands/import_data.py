@@ -0,0 +1,227 @@
+import time
+from itertools import islice
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand
+
+from authentication.models import User, UserRole
+from clients.models import Client, ClientImportKey, ClientStatus
+from contracts.models import Contract, ContractImportKey, ContractStatus
+from events.models import Event, EventStatus, SupportAccess
+from EpicEvents_CRM.imports import STAGING_TABLE, Importer, Reference, read_records
+from EpicEvents_CRM.response_cache import bump_generations
+
+BATCH_SIZE = 10000
+
+
+class UserImporter(Importer):
+    model = User
+    fields = [
+        "username",
+        "password",
+        "first_name",
+        "last_name",
+        "email",
+        "phone_number",
+        "mobile_number",
+    ]
+    references = [Reference("role", UserRole, "role")]
+    # Users are matched with the existing ones by username
+    natural_key = "username"
+    extra_columns = {
+        # What User.save() does
+        "is_staff": f"s.role_value = '{UserRole.MANAGEMENT}'",
+        "is_superuser": f"s.role_value = '{UserRole.MANAGEMENT}'",
+        "is_active": "true",
+        "date_joined": "now()",
+        "date_created": "now()",
+        "token_version": "0",
+    }
+    changed_models = [User]
+
+    def clean_record(self, record):
+        # Passwords are imported hashed, as hashing them would take hours
+        password = record.get("password")
+        record = {**record, "password": password or make_password(None)}
+        values, errors = super().clean_record(record)
+        if password:
+            try:
+                identify_hasher(password)
+            except ValueError:
+                errors["password"] = ["Not a password hash."]
+        return values, errors
+
+
+class ClientImporter(Importer):
+    model = Client
+    key_model = ClientImportKey
+    fields = [
+        "company_name",
+        "first_name",
+        "last_name",
+        "email",
+        "phone_number",
+        "mobile_number",
+    ]
+    references = [
+        Reference(
+            "status",
+            ClientStatus,
+            "status",
+            required=False,
+            default=ClientStatus.PROSPECT,
+        ),
+        Reference("sales_contact", User, "username"),
+    ]
+    extra_columns = {"date_created": "now()"}
+    changed_models = [Client]
+
+
+class ContractImporter(Importer):
+    model = Contract
+    key_model = ContractImportKey
+    fields = ["amount", "payment_due"]
+    references = [
+        Reference("client", ClientImportKey, "key", "client", by_source=True),
+        Reference(
+            "status",
+            ContractStatus,
+            "status",
+            required=False,
+            default=ContractStatus.UNSIGNED,
+        ),
+    ]
+    extra_columns = {
+        # What Contract.save() does
+        "sales_contact_id": (
+            "(SELECT sales_contact_id FROM clients_client WHERE id = s.client_id)"
+        ),
+        "date_created": "now()",
+    }
+    changed_models = [Contract]
+
+    def after_merge(self, cursor):
+        # What the signals do for each contract
+        cursor.execute(
+            "UPDATE clients_client SET date_updated = now() "
+            f"WHERE id IN (SELECT client_id FROM {STAGING_TABLE})"
+        )
+
+
+class EventImporter(Importer):
+    model = Event
+    fields = ["attendees", "event_date", "notes"]
+    references = [
+        Reference("contract", ContractImportKey, "key", "contract", by_source=True),
+        Reference("support_contact", User, "username", required=False),
+        Reference(
+            "status", EventStatus, "status", required=False, default=EventStatus.CREATED
+        ),
+    ]
+    # A contract has one event at most
+    natural_key = "contract_id"
+    extra_columns = {
+        # What Event.save() does
+        "sales_contact_id": (
+            "(SELECT sales_contact_id FROM contracts_contract "
+            "WHERE id = s.contract_id)"
+        ),
+        "date_created": "now()",
+    }
+    changed_models = [Event, SupportAccess]
+
+    def after_merge(self, cursor):
+        # What the signals do for each event
+        cursor.execute(
+            "INSERT INTO events_supportaccess (event_id, user_id, client_id, "
+            "contract_id) SELECT s.id, s.support_contact_id, c.client_id, c.id "
+            f"FROM {STAGING_TABLE} s JOIN contracts_contract c ON c.id = s.contract_id "
+            "WHERE s.support_contact_id IS NOT NULL"
+        )
+        cursor.execute(
+            "UPDATE contracts_contract SET date_updated = now() "
+            f"WHERE id IN (SELECT contract_id FROM {STAGING_TABLE})"
+        )
+        cursor.execute(
+            "UPDATE clients_client SET date_updated = now() WHERE id IN ("
+            "SELECT client_id FROM contracts_contract "
+            f"WHERE id IN (SELECT contract_id FROM {STAGING_TABLE}))"
+        )
+
+
+IMPORTERS = {
+    "users": UserImporter,
+    "clients": ClientImporter,
+    "contracts": ContractImporter,
+    "events": EventImporter,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import users, clients, contracts or events from a CSV or NDJSON file. "
+        "Run it again after a failure to import the remaining rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=IMPORTERS)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--source",
+            required=True,
+            help="Name of the system the file comes from, whose keys the "
+            "clients and contracts are known by.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["csv", "ndjson"],
+            help="Format of the file, given by its extension by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        importer = IMPORTERS[options["resource"]](options["source"])
+        path = options["path"]
+        file_format = options["format"] or (
+            "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+        )
+        records = read_records(path, file_format)
+
+        start = time.monotonic()
+        read = imported = skipped = rejected = 0
+        last_line = 0
+        try:
+            while batch := list(islice(records, options["batch_size"])):
+                errors, batch_imported, batch_skipped = importer.import_batch(batch)
+                for line, field_errors in sorted(errors.items()):
+                    for field_name, messages in field_errors.items():
+                        self.stderr.write(
+                            f"Line {line}: {field_name}: {' '.join(messages)}"
+                        )
+                read += len(batch)
+                imported += batch_imported
+                skipped += batch_skipped
+                rejected += len(errors)
+                last_line = batch[-1][0]
+                rate = read / max(time.monotonic() - start, 1e-6)
+                self.stdout.write(
+                    f"{read} rows read, {imported} imported, {skipped} already "
+                    f"imported, {rejected} rejected ({rate:.0f} rows/s)"
+                )
+        except Exception:
+            self.stderr.write(
+                f"Import stopped after line {last_line}. Run the command again "
+                "to import the remaining rows."
+            )
+            raise
+        finally:
+            # The signals caching list responses are not sent by COPY
+            if imported:
+                bump_generations(*importer.changed_models)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} {options['resource']} in "
+                f"{time.monotonic() - start:.1f}s."
+            )
+        )
@@ -0,0 +1,60 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from events.models import SupportAccess
+from EpicEvents_CRM.response_cache import bump_generations
+
+BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = "Rebuild the support access table from the events, or verify it."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Compare the table with the events without changing it.",
+        )
+
+    def handle(self, *args, **options):
+        if options["verify"]:
+            self.verify()
+        else:
+            self.rebuild()
+
+    def verify(self):
+        expected = SupportAccess.expected()
+        stored = SupportAccess.objects.values_list(
+            "event", "user", "client", "contract"
+        )
+        missing = expected.difference(stored).count()
+        stale = stored.difference(expected).count()
+        if missing or stale:
+            raise CommandError(
+                f"Support access is out of date: {missing} missing "
+                f"and {stale} stale rows. Run support_access to rebuild it."
+            )
+        self.stdout.write(self.style.SUCCESS("Support access is up to date."))
+
+    @transaction.atomic
+    def rebuild(self):
+        SupportAccess.objects.all().delete()
+        rows = SupportAccess.expected().iterator(chunk_size=BATCH_SIZE)
+        count = 0
+        while batch := list(islice(rows, BATCH_SIZE)):
+            SupportAccess.objects.bulk_create(
+                SupportAccess(
+                    event_id=event_id,
+                    user_id=user_id,
+                    client_id=client_id,
+                    contract_id=contract_id,
+                )
+                for event_id, user_id, client_id, contract_id in batch
+            )
+            count += len(batch)
+        # The signals caching list responses are not sent by bulk operations
+        bump_generations(SupportAccess)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} support access rows."))
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_event_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="event",
+            options={"ordering": ["date_created", "id"]},
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["date_created", "id"], name="event_keyset_idx"),
+        ),
+    ]
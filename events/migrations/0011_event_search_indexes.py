@@ -0,0 +1,16 @@
+# Generated by Django 4.2.5 on 2026-10-18 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_event_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["event_date"], name="event_event_date_idx"),
+        ),
+    ]
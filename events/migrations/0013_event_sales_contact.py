@@ -0,0 +1,49 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:02
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 10000
+
+
+def copy_contracts_sales_contact(apps, schema_editor):
+    # Copy each contract's sales contact to its event, one batch at a time,
+    # so that no long transaction locks the whole table
+    Contract = apps.get_model("contracts", "Contract")
+    Event = apps.get_model("events", "Event")
+
+    last_id = Event.objects.aggregate(models.Max("id"))["id__max"] or 0
+    for start in range(0, last_id + 1, BATCH_SIZE):
+        Event.objects.filter(id__gte=start, id__lt=start + BATCH_SIZE).update(
+            sales_contact=models.Subquery(
+                Contract.objects.filter(id=models.OuterRef("contract")).values(
+                    "sales_contact"
+                )[:1]
+            )
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contracts", "0013_contract_sales_contact"),
+        ("events", "0012_event_scope_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="sales_contact",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sales_events",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(copy_contracts_sales_contact, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 4.2.5 on 2026-10-18 19:07
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_support_access(apps, schema_editor):
+    # Same rows as the support_access management command rebuilds
+    Event = apps.get_model("events", "Event")
+    SupportAccess = apps.get_model("events", "SupportAccess")
+
+    rows = Event.objects.filter(support_contact__isnull=False).values_list(
+        "id", "support_contact", "contract__client", "contract"
+    )
+    SupportAccess.objects.bulk_create(
+        (
+            SupportAccess(
+                event_id=event_id,
+                user_id=user_id,
+                client_id=client_id,
+                contract_id=contract_id,
+            )
+            for event_id, user_id, client_id, contract_id in rows.iterator()
+        ),
+        batch_size=10000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contracts", "0013_contract_sales_contact"),
+        ("clients", "0014_client_scope_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("events", "0013_event_sales_contact"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SupportAccess",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="events.event",
+                    ),
+                ),
+                (
+                    "client",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="clients.client",
+                    ),
+                ),
+                (
+                    "contract",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="contracts.contract",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "support access",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "client"], name="supportaccess_client_idx"
+                    ),
+                    models.Index(
+                        fields=["user", "contract"], name="supportaccess_contract_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(fill_support_access, migrations.RunPython.noop),
+    ]
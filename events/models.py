@@ -1,6 +1,10 @@
 from django.db import models
 from django.conf import settings
 
+from EpicEvents_CRM.documents import DetailDocument
+from EpicEvents_CRM.lookups import LookupManager
+from EpicEvents_CRM.tracking import DateUpdatedMixin
+
 from clients.models import Client
 from contracts.models import Contract
 
@@ -20,11 +24,26 @@ class EventStatus(models.Model):
     ]
     status = models.CharField(choices=STATUS_CHOICES, max_length=3, unique=True)
 
+    objects = LookupManager("status")
+
     def __str__(self):
         return dict(self.STATUS_CHOICES)[str(self.status)]
 
 
-class Event(models.Model):
+class Event(DateUpdatedMixin, models.Model):
+    class Meta:
+        ordering = ["date_created", "id"]
+        indexes = [
+            # Keyset used by the list endpoints' cursor pagination
+            models.Index(fields=["date_created", "id"], name="event_keyset_idx"),
+            # Covers the support contact's scope on events
+            models.Index(
+                fields=["support_contact", "contract"], name="event_support_contact_idx"
+            ),
+            # Typed search on dates
+            models.Index(fields=["event_date"], name="event_event_date_idx"),
+        ]
+
     contract = models.OneToOneField(
         Contract, on_delete=models.CASCADE, related_name="event"
     )
@@ -33,6 +52,16 @@ class Event(models.Model):
         on_delete=models.PROTECT,
         related_name="events",
         null=True,
+        # Indexed by event_support_contact_idx
+        db_index=False,
+    )
+    # Copy of the contract's sales contact, kept in sync by events.signals
+    sales_contact = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="sales_events",
+        null=True,
+        editable=False,
     )
     status = models.ForeignKey(EventStatus, on_delete=models.PROTECT, null=True)
     attendees = models.IntegerField(null=True, blank=True)
@@ -41,5 +70,79 @@ class Event(models.Model):
     date_created = models.DateTimeField(auto_now_add=True, editable=False)
     date_updated = models.DateTimeField(null=True)
 
+    # Copied to the support access by events.signals, and contract_id read
+    # by save()
+    tracked_fields = ["contract_id", "support_contact_id"]
+
+    # Read by __str__() and the representations nesting the row
+    str_fields = ["event_date", "attendees"]
+
+    def save(self, *args, **kwargs):
+        # Copy the sales contact of a new or moved event's contract
+        if self.has_changed("contract_id"):
+            if Event.contract.is_cached(self):
+                self.sales_contact_id = self.contract.sales_contact_id
+            else:
+                self.sales_contact_id = (
+                    Contract.objects.filter(pk=self.contract_id)
+                    .values_list("sales_contact_id", flat=True)
+                    .get()
+                )
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "sales_contact"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.event_date}, {self.attendees} attendees"
+
+
+class SupportAccess(models.Model):
+    """
+    Client, contract and event a support contact is assigned to, one row per
+    event with a support contact, maintained by events.signals.
+    """
+
+    class Meta:
+        verbose_name_plural = "support access"
+        indexes = [
+            models.Index(fields=["user", "client"], name="supportaccess_client_idx"),
+            models.Index(
+                fields=["user", "contract"], name="supportaccess_contract_idx"
+            ),
+        ]
+
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        # Indexed by supportaccess_client_idx
+        db_index=False,
+    )
+    # Deleted along with their event, which the client and contract cascade to
+    client = models.ForeignKey(
+        Client, on_delete=models.DO_NOTHING, related_name="+", db_index=False
+    )
+    contract = models.ForeignKey(
+        Contract, on_delete=models.DO_NOTHING, related_name="+", db_index=False
+    )
+
+    @classmethod
+    def expected(cls):
+        # The access derived from the events, as it should be stored
+        return Event.objects.filter(support_contact__isnull=False).values_list(
+            "id", "support_contact", "contract__client", "contract"
+        )
+
+    def __str__(self):
+        return f"{self.user} on {self.event_id}"
+
+
+class EventDocument(DetailDocument):
+    # Kept up to date by events.signals
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
@@ -8,13 +8,21 @@ class HasEventPermissions(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         elif request.method == "POST":
-            return request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM)
+            return request.user.has_role(UserRole.SALES_TEAM)
         elif request.method == "PUT":
-            return request.user.role == UserRole.objects.get(role=UserRole.SUPPORT_TEAM)
+            return request.user.has_role(UserRole.SUPPORT_TEAM)
         return False
         # return request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM)
 
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        return request.user == obj.support_contact
+        return obj.support_contact_id == request.user.pk
+
+
+class HasEventBulkUpdatePermissions(HasEventPermissions):
+    # The bulk updates are PATCH requests, which the detail view refuses
+    def has_permission(self, request, view):
+        if request.method == "PATCH":
+            return request.user.has_role(UserRole.SUPPORT_TEAM)
+        return super().has_permission(request, view)
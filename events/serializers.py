@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from events.models import Event, EventStatus
+from EpicEvents_CRM.bulk import PreloadedPrimaryKeyRelatedField
 
 
 class EventListSerializer(serializers.ModelSerializer):
@@ -15,9 +16,33 @@ class EventListSerializer(serializers.ModelSerializer):
             "status",
             "support_contact",
         ]
+        select_related = ["contract__client", "status", "support_contact__role"]
+
+
+class EventExportSerializer(serializers.ModelSerializer):
+    client = serializers.CharField(source="contract.client.company_name")
+    status = serializers.StringRelatedField()
+    support_contact = serializers.StringRelatedField()
+
+    class Meta:
+        model = Event
+        fields = [
+            "id",
+            "contract",
+            "client",
+            "status",
+            "support_contact",
+            "attendees",
+            "event_date",
+            "notes",
+            "date_created",
+            "date_updated",
+        ]
+        select_related = ["contract__client", "status", "support_contact__role"]
 
 
 class EventCreateSerializer(serializers.ModelSerializer):
+    serializer_related_field = PreloadedPrimaryKeyRelatedField
     contract_name = serializers.StringRelatedField(source="contract")
     status_name = serializers.StringRelatedField(source="status")
 
@@ -33,6 +58,7 @@ class EventCreateSerializer(serializers.ModelSerializer):
             "event_date",
             "notes",
         ]
+        select_related = ["contract__client", "status"]
 
 
 class EventDetailSerializer(serializers.ModelSerializer):
@@ -54,6 +80,7 @@ class EventDetailSerializer(serializers.ModelSerializer):
             "date_created",
             "date_updated",
         ]
+        select_related = ["contract__client", "status", "support_contact__role"]
         read_only_fields = [
             "contract",
             "client",
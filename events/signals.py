@@ -0,0 +1,82 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from authentication.models import User
+from clients.models import Client
+from contracts.models import Contract
+from events.models import Event, EventDocument, EventStatus, SupportAccess
+from EpicEvents_CRM.documents import delete_documents
+from EpicEvents_CRM.response_cache import UNRENDERED_FIELDS, bump_generations
+from EpicEvents_CRM.tracking import touch
+
+
+@receiver(post_save, sender=Client)
+def update_events_sales_contact_from_client(sender, instance, created, **kwargs):
+    # Keep the events' copy of the sales contact in sync with their client
+    if not created and instance.has_changed("sales_contact_id"):
+        Event.objects.filter(contract__client=instance).exclude(
+            sales_contact=instance.sales_contact_id
+        ).update(sales_contact=instance.sales_contact_id)
+
+
+@receiver(post_save, sender=Contract)
+def update_event_sales_contact_from_contract(sender, instance, created, **kwargs):
+    # Saving a contract copies its client's sales contact, which may have changed
+    if not created and instance.has_changed("sales_contact_id"):
+        Event.objects.filter(contract=instance).exclude(
+            sales_contact=instance.sales_contact_id
+        ).update(sales_contact=instance.sales_contact_id)
+
+
+@receiver(post_save, sender=Event)
+def update_support_access_from_event(sender, instance, created, **kwargs):
+    if not (
+        created
+        or instance.has_changed("support_contact_id")
+        or instance.has_changed("contract_id")
+    ):
+        return
+    if instance.support_contact_id is None:
+        if not created:
+            SupportAccess.objects.filter(event=instance).delete()
+        return
+    SupportAccess(
+        event=instance,
+        user_id=instance.support_contact_id,
+        client_id=instance.contract.client_id,
+        contract_id=instance.contract_id,
+    ).save(force_insert=created)
+
+
+@receiver(post_save, sender=Contract)
+def update_support_access_from_contract(sender, instance, created, **kwargs):
+    # A contract may be moved to another client
+    if not created and instance.has_changed("client_id"):
+        SupportAccess.objects.filter(contract=instance).update(
+            client=instance.client_id
+        )
+        bump_generations(SupportAccess)
+
+
+@receiver(post_save, sender=Client)
+def touch_events_from_client(sender, instance, created, **kwargs):
+    # The validators of an event change with the rows it shows
+    if not created and instance.has_changed("company_name"):
+        touch(Event.objects.filter(contract__client=instance))
+
+
+@receiver(post_save, sender=Contract)
+def touch_event_from_contract(sender, instance, created, **kwargs):
+    if not created:
+        touch(Event.objects.filter(contract=instance))
+
+
+@receiver(post_save, sender=User)
+def touch_events_from_user(sender, instance, update_fields, **kwargs):
+    if not update_fields or not set(update_fields) <= UNRENDERED_FIELDS:
+        touch(Event.objects.filter(support_contact=instance))
+
+
+@receiver(post_save, sender=EventStatus)
+def delete_event_documents_from_status(sender, instance, **kwargs):
+    delete_documents(EventDocument.objects.all())
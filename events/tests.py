@@ -1,22 +1,30 @@
 import datetime
 import pytz
+from io import StringIO
 from unittest import mock
 
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from events.models import SupportAccess
+
 from tests.test_setup import ProjectAPITestCase
 from tests.mocks import mock_perform_update, TEST_UPDATE_TIME
 
 
 class EventAPITestCase(ProjectAPITestCase):
     def get_event_list_data(self, events):
-        return [
-            {
-                "id": event.pk,
-                "contract": str(event.contract),
-                "status": str(event.status),
-                "support_contact": str(event.support_contact),
-            }
-            for event in events
-        ]
+        return self.get_page(
+            [
+                {
+                    "id": event.pk,
+                    "contract": str(event.contract),
+                    "status": str(event.status),
+                    "support_contact": str(event.support_contact),
+                }
+                for event in events
+            ]
+        )
 
     def get_event_detail_data(self, event):
         return {
@@ -39,7 +47,7 @@ class TestEvent(EventAPITestCase):
             # Unauthenticated user
             (None, 401, {"detail": "Authentication credentials were not provided."}),
             # Authorized Sales user not assigned to clients with events
-            (self.test_sales_team_member_3, 200, []),
+            (self.test_sales_team_member_3, 200, self.get_event_list_data([])),
             # Authorized Sales user assigned to clients with events
             # Sales users are able to see their clients' events
             (
@@ -146,18 +154,23 @@ class TestEvent(EventAPITestCase):
             # Searching for phone number
             (
                 "?search=5554567859",
-                [],
+                self.get_event_list_data([]),
             ),
             # Searching for event date
             (
                 "?search=2024-12-25",
                 self.get_event_list_data([self.test_event_1]),
             ),
+            # Searching for event date and time
+            (
+                "?search=2024-12-25T00:00:00.000001Z",
+                self.get_event_list_data([self.test_event_1]),
+            ),
             # Searching for note
             # does not filter at all
             (
                 "?search=Christmas party!",
-                [],
+                self.get_event_list_data([]),
             ),
         ]
         for query_parameter_test, expected_json in test_event_list_search_params:
@@ -173,6 +186,12 @@ class TestEvent(EventAPITestCase):
                 self.assertEqual(response.status_code, 200)
                 self.assertEqual(response.json(), expected_json)
 
+    def test_event_list_query_count(self):
+        self.assertListQueriesDoNotGrow(
+            self.url_event_list,
+            [self.test_sales_team_member, self.test_support_team_member],
+        )
+
     def test_event_create(self):
         test_event_create_params = [
             # Unauthenticated user
@@ -356,3 +375,51 @@ class TestEvent(EventAPITestCase):
                 )
                 self.assertEqual(response.status_code, expected_status_code)
                 self.assertEqual(response.json(), expected_json)
+
+    def test_event_partial_update(self):
+        # Events are only updated in full, or in bulk
+        self.client.force_authenticate(user=self.test_support_team_member)
+        response = self.client.patch(self.url_event_detail, data={"attendees": 10})
+        self.assertEqual(response.status_code, 403)
+        self.test_event_1.refresh_from_db()
+        self.assertEqual(self.test_event_1.attendees, 500)
+
+    def assertSupportAccessUpToDate(self):
+        self.assertEqual(
+            set(
+                SupportAccess.objects.values_list("event", "user", "client", "contract")
+            ),
+            set(SupportAccess.expected()),
+        )
+
+    def test_support_access(self):
+        self.assertSupportAccessUpToDate()
+
+        # Reassigned event
+        self.test_event_1.support_contact = self.test_support_team_member_2
+        self.test_event_1.save()
+        self.assertSupportAccessUpToDate()
+
+        # Contract moved to another client
+        self.test_contract_2.client = self.test_client_1
+        self.test_contract_2.save()
+        self.assertSupportAccessUpToDate()
+
+        # Unassigned event
+        self.test_event_2.support_contact = None
+        self.test_event_2.save()
+        self.assertSupportAccessUpToDate()
+
+    def test_support_access_command(self):
+        call_command("support_access", "--verify", stdout=StringIO())
+
+        SupportAccess.objects.filter(event=self.test_event_1).delete()
+        SupportAccess.objects.filter(event=self.test_event_2).update(
+            user=self.test_support_team_member
+        )
+        with self.assertRaisesMessage(CommandError, "2 missing and 1 stale rows"):
+            call_command("support_access", "--verify", stdout=StringIO())
+
+        call_command("support_access", stdout=StringIO())
+        self.assertSupportAccessUpToDate()
+        call_command("support_access", "--verify", stdout=StringIO())
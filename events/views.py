@@ -1,30 +1,58 @@
 from django.core.exceptions import PermissionDenied
 from django.utils import timezone
-from rest_framework import generics, permissions, filters
+from rest_framework import generics, permissions
 from django_filters.rest_framework import DjangoFilterBackend
 
 from events import serializers, models
+from events.models import SupportAccess
 
-from events.permissions import HasEventPermissions
+from events.permissions import HasEventBulkUpdatePermissions, HasEventPermissions
 
-from authentication.models import UserRole
+from authentication.models import User, UserRole
+from clients.models import Client
+from contracts.models import Contract
+from EpicEvents_CRM.async_views import (
+    AsyncListMixin,
+    AsyncListModelMixin,
+    AsyncRetrieveMixin,
+    AsyncRetrieveModelMixin,
+)
+from EpicEvents_CRM.bulk import BulkCreateMixin, BulkUpdateMixin
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.documents import DocumentDetailMixin
+from EpicEvents_CRM.export import ExportMixin
+from EpicEvents_CRM.pagination import KeysetCursorPagination
+from EpicEvents_CRM.query_plans import QueryPlanMixin
+from EpicEvents_CRM.replicas import ReplicaReadMixin
+from EpicEvents_CRM.response_cache import ListCacheMixin, bump_generations
+from EpicEvents_CRM.search import TrigramSearchFilter
+from EpicEvents_CRM.streaming import StreamingListMixin
+from EpicEvents_CRM.tracking import touch
 
 
 class EventQuerysetMixin:
     def get_queryset(self):
         # Support Team may access all events
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SUPPORT_TEAM):
+        if self.request.user.has_role(UserRole.SUPPORT_TEAM):
             return models.Event.objects.all()
         # Sales Team may only access events related to their clients
-        if self.request.user.role == UserRole.objects.get(role=UserRole.SALES_TEAM):
-            return models.Event.objects.filter(
-                contract__client__sales_contact=self.request.user
-            )
+        if self.request.user.has_role(UserRole.SALES_TEAM):
+            return models.Event.objects.filter(sales_contact=self.request.user)
 
 
-class EventListCreateAPIView(EventQuerysetMixin, generics.ListCreateAPIView):
+class EventListCreateAPIView(
+    ReplicaReadMixin,
+    StreamingListMixin,
+    ListCacheMixin,
+    BulkCreateMixin,
+    QueryPlanMixin,
+    EventQuerysetMixin,
+    AsyncListModelMixin,
+    generics.ListCreateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, HasEventPermissions]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
+    pagination_class = KeysetCursorPagination
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter]
     filterset_fields = [
         "contract__client__company_name",
         "contract__client__first_name",
@@ -38,40 +66,108 @@ class EventListCreateAPIView(EventQuerysetMixin, generics.ListCreateAPIView):
         "contract__client__email",
         "event_date",
     ]
+    # Rows rendered by the list, or deciding which events a user sees
+    cache_dependencies = [models.Event, models.EventStatus, Contract, Client, User]
+    # Support Team members all see every event
+    cache_shared_roles = [UserRole.SUPPORT_TEAM]
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return serializers.EventCreateSerializer
         return serializers.EventListSerializer
 
-    def perform_create(self, serializer):
+    def prepare_create(self, validated_data):
         # Check that the user trying to create the event is the client's sales contact
-        sales_contact = serializer.validated_data["contract"].client.sales_contact
-        if sales_contact == self.request.user:
+        sales_contact_id = validated_data["contract"].sales_contact_id
+        if sales_contact_id == self.request.user.pk:
             # Give a default status to event upon creation
             try:
-                if serializer.validated_data["status"] is None:
+                if validated_data["status"] is None:
                     raise KeyError
             except KeyError:
-                serializer.validated_data["status"] = models.EventStatus.objects.get(
-                    status=models.EventStatus.CREATED
+                validated_data["status"] = models.EventStatus.objects.get_by_code(
+                    models.EventStatus.CREATED
                 )
-            serializer.save()
         else:
             # Deny permission to create event if user is not the client's sales_contact
             raise PermissionDenied
 
+    def perform_bulk_create(self, instances):
+        # What Event.save() and the signals do for each event
+        for event in instances:
+            event.sales_contact_id = event.contract.sales_contact_id
+        super().perform_bulk_create(instances)
+        contract_ids = {event.contract_id for event in instances}
+        touch(Contract.objects.filter(pk__in=contract_ids))
+        touch(Client.objects.filter(contracts__in=contract_ids))
+        support_access = [
+            SupportAccess(
+                event=event,
+                user_id=event.support_contact_id,
+                client_id=event.contract.client_id,
+                contract_id=event.contract_id,
+            )
+            for event in instances
+            if event.support_contact_id is not None
+        ]
+        if support_access:
+            SupportAccess.objects.bulk_create(
+                support_access, batch_size=self.bulk_batch_size
+            )
+            bump_generations(SupportAccess)
+
+
+class EventExportAPIView(ExportMixin, EventListCreateAPIView):
+    http_method_names = ["get", "head", "options"]
+    export_filename = "events"
+
+    def get_serializer_class(self):
+        return serializers.EventExportSerializer
+
 
-class EventDetailAPIView(EventQuerysetMixin, generics.RetrieveUpdateAPIView):
+class EventDetailAPIView(
+    ReplicaReadMixin,
+    ConditionalDetailMixin,
+    DocumentDetailMixin,
+    QueryPlanMixin,
+    EventQuerysetMixin,
+    AsyncRetrieveModelMixin,
+    generics.RetrieveUpdateAPIView,
+):
     permission_classes = [permissions.IsAuthenticated, HasEventPermissions]
     serializer_class = serializers.EventDetailSerializer
     lookup_field = "pk"
+    document_model = models.EventDocument
 
     def perform_update(self, serializer):
         serializer.save(date_updated=timezone.now())
 
 
-class EventStatusListAPIView(generics.ListAPIView):
+class AsyncEventListCreateAPIView(AsyncListMixin, EventListCreateAPIView):
+    pass
+
+
+class AsyncEventDetailAPIView(AsyncRetrieveMixin, EventDetailAPIView):
+    pass
+
+
+class EventBulkUpdateAPIView(
+    ReplicaReadMixin, BulkUpdateMixin, EventQuerysetMixin, generics.GenericAPIView
+):
+    permission_classes = [permissions.IsAuthenticated, HasEventBulkUpdatePermissions]
+    serializer_class = serializers.EventDetailSerializer
+    bulk_owner_field = "support_contact"
+    bulk_filter_fields = ["status", "contract"]
+    bulk_update_fields = ["status", "attendees", "event_date", "notes"]
+
+    def perform_bulk_update(self, ids, values):
+        super().perform_bulk_update(ids, values)
+        # What the signals do for each event
+        touch(Contract.objects.filter(event__in=ids))
+        touch(Client.objects.filter(contracts__event__in=ids))
+
+
+class EventStatusListAPIView(QueryPlanMixin, generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated, HasEventPermissions]
     serializer_class = serializers.EventStatusSerializer
     queryset = models.EventStatus.objects.all()
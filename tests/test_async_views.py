@@ -0,0 +1,192 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import close_old_connections
+from django.http import StreamingHttpResponse
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import User, UserRole
+from clients.models import Client, ClientDocument
+from EpicEvents_CRM.asgi import application
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestAsyncViews(ProjectAPITestCase):
+    def get_headers(self, user):
+        return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+    def get(self, user, url, asynchronous=True, **extra):
+        urlconf = settings.ASGI_URLCONF if asynchronous else settings.ROOT_URLCONF
+        with override_settings(ROOT_URLCONF=urlconf):
+            response = self.client.get(url, **self.get_headers(user), **extra)
+            self.assertEqual(
+                asyncio.iscoroutinefunction(response.resolver_match.func), asynchronous
+            )
+        return response
+
+    def test_async_views(self):
+        self.create_clients_with_contracts_and_events(3)
+        test_async_views_params = [
+            (self.test_sales_team_member, self.url_client_list),
+            (self.test_sales_team_member, self.url_client_detail),
+            (self.test_sales_team_member, self.url_contract_list),
+            (self.test_sales_team_member, self.url_contract_detail),
+            (self.test_support_team_member, self.url_event_list),
+            (self.test_support_team_member, self.url_event_detail),
+            # Scoped lists
+            (self.test_support_team_member, self.url_client_list),
+            (self.test_sales_team_member, self.url_event_list),
+        ]
+        for user, url in test_async_views_params:
+            with self.subTest(user=user, url=url):
+                expected_response = self.get(user, url, asynchronous=False)
+                response = self.get(user, url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), expected_response.json())
+                self.assertEqual(
+                    response.headers.get("ETag"), expected_response.headers.get("ETag")
+                )
+
+    def test_async_list_pages(self):
+        self.create_clients_with_contracts_and_events(3)
+        data = {"page_size": 2, "search": "Company"}
+        expected_page = self.get(
+            self.test_sales_team_member, self.url_client_list, False, data=data
+        ).json()
+        page = self.get(self.test_sales_team_member, self.url_client_list, data=data)
+        self.assertEqual(page.json(), expected_page)
+
+        response = self.get(self.test_sales_team_member, page.json()["next"])
+        self.assertEqual(
+            response.json(),
+            self.get(self.test_sales_team_member, expected_page["next"], False).json(),
+        )
+        self.assertIsNotNone(response.json()["previous"])
+
+    def test_async_detail_documents(self):
+        response = self.get(self.test_sales_team_member, self.url_client_detail)
+        self.assertEqual(ClientDocument.objects.count(), 1)
+        # Served from the document, for a cached user
+        with self.assertNumQueries(2):
+            document_response = self.get(
+                self.test_sales_team_member, self.url_client_detail
+            )
+        self.assertEqual(document_response.json(), response.json())
+
+        response = self.get(
+            self.test_sales_team_member,
+            self.url_client_detail,
+            HTTP_IF_NONE_MATCH=response.headers["ETag"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_async_role_claim_with_cold_lookups(self):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "sales_tester", "password": "s@l3s_73573r"},
+        )
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {response.json()['access']}"}
+        # As in a fresh worker, or after a role was changed by another one
+        UserRole.objects.clear_cache()
+        User.objects.clear_cache()
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            response = self.client.get(self.url_client_list, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_async_views_permissions(self):
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            response = self.client.get(self.url_event_list)
+            self.assertEqual(response.status_code, 401)
+
+            response = self.client.get(
+                self.url_client_detail,
+                **self.get_headers(self.test_support_team_member_3),
+            )
+            self.assertEqual(response.status_code, 404)
+
+            # Forced authentication, run in a thread
+            self.client.force_authenticate(user=self.test_support_team_member)
+            response = self.client.put(self.url_event_detail, {"attendees": 10})
+            self.assertEqual(response.status_code, 200)
+
+            self.client.force_authenticate(user=self.test_sales_team_member_2)
+            response = self.client.post(
+                self.url_client_list,
+                {
+                    "company_name": "Async",
+                    "first_name": "First",
+                    "last_name": "Last",
+                    "email": "async@company.com",
+                },
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(
+                Client.objects.get(company_name="Async").sales_contact,
+                self.test_sales_team_member_2,
+            )
+
+            response = self.client.delete(self.url_client_detail)
+            self.assertEqual(response.status_code, 405)
+
+    async def test_async_views_concurrent_requests(self):
+        headers = {
+            "Authorization": f"Bearer {AccessToken.for_user(self.test_support_team_member)}"
+        }
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            responses = await asyncio.gather(
+                *[
+                    self.async_client.get(url, headers=headers)
+                    for url in [self.url_event_list, self.url_event_detail] * 5
+                ]
+            )
+        self.assertEqual([response.status_code for response in responses], [200] * 10)
+        self.assertEqual(
+            {response.json()["id"] for response in responses[1::2]},
+            {self.test_event_1.pk},
+        )
+
+    async def test_async_stream(self):
+        headers = {
+            "Authorization": f"Bearer {AccessToken.for_user(self.test_sales_team_member)}"
+        }
+        expected_response = await self.async_client.get(
+            self.url_client_list, {"stream": "true"}, headers=headers
+        )
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            response = await self.async_client.get(
+                self.url_client_list, {"stream": "true"}, headers=headers
+            )
+        # Sent as the rows are read, and not read in full first
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        expected_content = await sync_to_async(b"".join)(
+            expected_response.streaming_content
+        )
+        self.assertEqual(content, expected_content)
+
+    async def test_asgi_handler_streams_sync_responses(self):
+        read = []
+
+        def read_rows():
+            for row in ["a", "b", "c"]:
+                read.append(row)
+                yield row
+
+        sent = []
+
+        async def send(message):
+            if message.get("body"):
+                sent.append((message["body"], len(read)))
+
+        # As the test client, keep the connection of the test's transaction
+        request_finished.disconnect(close_old_connections)
+        try:
+            await application.send_response(StreamingHttpResponse(read_rows()), send)
+        finally:
+            request_finished.connect(close_old_connections)
+        self.assertEqual(sent, [(b"a", 1), (b"b", 2), (b"c", 3)])
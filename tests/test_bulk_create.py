@@ -0,0 +1,245 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from clients.models import Client
+from contracts.models import Contract
+from events.models import Event
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestBulkCreate(ProjectAPITestCase):
+    def post(self, user, url, data):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, data=data, format="json")
+        return response, len(context.captured_queries)
+
+    def get_clients_data(self, count):
+        return [
+            {
+                "company_name": f"Lead {index}",
+                "first_name": "First",
+                "last_name": "Last",
+                "email": f"lead{index}@company.com",
+            }
+            for index in range(count)
+        ]
+
+    def test_bulk_create_clients(self):
+        response, _ = self.post(
+            self.test_sales_team_member,
+            self.url_client_list,
+            self.get_clients_data(2)
+            + [
+                {
+                    "company_name": "Lead 2",
+                    "status": self.test_status_existing.pk,
+                    "first_name": "First",
+                    "last_name": "Last",
+                    "email": "lead2@company.com",
+                }
+            ],
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [(item["company_name"], item["status_name"]) for item in response.json()],
+            [
+                ("Lead 0", "Prospective Client"),
+                ("Lead 1", "Prospective Client"),
+                ("Lead 2", "Existing Client"),
+            ],
+        )
+        clients = Client.objects.filter(company_name__startswith="Lead")
+        self.assertEqual(
+            [client.pk for client in clients],
+            [item["id"] for item in response.json()],
+        )
+        self.assertEqual(
+            {client.sales_contact for client in clients},
+            {self.test_sales_team_member},
+        )
+
+    def test_bulk_create_query_count(self):
+        # Warm the role and status lookups before counting
+        self.post(self.test_sales_team_member, self.url_client_list, [])
+
+        _, expected_count = self.post(
+            self.test_sales_team_member,
+            self.url_client_list,
+            self.get_clients_data(2),
+        )
+        Client.objects.filter(company_name__startswith="Lead").delete()
+        response, count = self.post(
+            self.test_sales_team_member,
+            self.url_client_list,
+            self.get_clients_data(50),
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(count, expected_count)
+
+        contracts = Contract.objects.bulk_create(
+            Contract(
+                client=self.test_client_1,
+                sales_contact=self.test_sales_team_member,
+                amount=index,
+            )
+            for index in range(50)
+        )
+        events_data = [{"contract": contract.pk} for contract in contracts]
+        _, expected_count = self.post(
+            self.test_sales_team_member, self.url_event_list, events_data[:2]
+        )
+        response, count = self.post(
+            self.test_sales_team_member, self.url_event_list, events_data[2:]
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(count, expected_count)
+
+    def test_bulk_create_invalid_items(self):
+        data = self.get_clients_data(3)
+        del data[1]["email"]
+        data[2]["status"] = 999
+
+        response, _ = self.post(self.test_sales_team_member, self.url_client_list, data)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {"email": ["This field is required."]},
+                {"status": ['Invalid pk "999" - object does not exist.']},
+            ],
+        )
+        self.assertFalse(Client.objects.filter(company_name__startswith="Lead"))
+
+    def test_bulk_create_permissions(self):
+        test_bulk_create_permissions_params = [
+            # Client of another sales team member
+            (
+                self.url_contract_list,
+                [
+                    {"client": self.test_client_1.pk, "amount": 100},
+                    {"client": self.test_client_2.pk, "amount": 200},
+                ],
+                Contract,
+            ),
+            # Contract of another sales team member's client
+            (
+                self.url_event_list,
+                [{"contract": self.test_contract_3.pk}],
+                Event,
+            ),
+        ]
+        for url, data, model in test_bulk_create_permissions_params:
+            with self.subTest(url=url):
+                count = model.objects.count()
+                response, _ = self.post(self.test_sales_team_member, url, data)
+                self.assertEqual(response.status_code, 403)
+                self.assertEqual(model.objects.count(), count)
+
+        response, _ = self.post(
+            self.test_support_team_member,
+            self.url_client_list,
+            self.get_clients_data(2),
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_bulk_create_contracts_and_events(self):
+        # Builds the detail documents
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        self.client.get(self.url_client_detail)
+        response, _ = self.post(
+            self.test_sales_team_member,
+            self.url_contract_list,
+            [
+                {"client": self.test_client_1.pk, "amount": 100},
+                {"client": self.test_client_1.pk, "amount": 200},
+            ],
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [
+                (item["client_company_name"], item["status_name"])
+                for item in response.json()
+            ],
+            [(self.test_client_1.company_name, "Not Signed")] * 2,
+        )
+        contracts = Contract.objects.filter(
+            pk__in=[item["id"] for item in response.json()]
+        )
+        self.assertEqual(
+            {contract.sales_contact for contract in contracts},
+            {self.test_sales_team_member},
+        )
+        # The client detail shows its contracts
+        response = self.client.get(self.url_client_detail)
+        self.assertEqual(len(response.json()["contracts_and_events"]["results"]), 3)
+
+        url_contract_detail = reverse("contract-detail", kwargs={"pk": contracts[0].pk})
+        self.client.get(url_contract_detail)
+        response, _ = self.post(
+            self.test_sales_team_member,
+            self.url_event_list,
+            [{"contract": contract.pk, "attendees": 10} for contract in contracts],
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [item["contract_name"] for item in response.json()],
+            [str(contract) for contract in contracts],
+        )
+        events = Event.objects.filter(contract__in=contracts)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(
+            {event.sales_contact for event in events},
+            {self.test_sales_team_member},
+        )
+        response = self.client.get(url_contract_detail)
+        self.assertEqual(response.json()["event"]["attendees"], 10)
+
+    def test_bulk_create_unique_events(self):
+        contract = Contract.objects.create(client=self.test_client_1, amount=100)
+        response, _ = self.post(
+            self.test_sales_team_member,
+            self.url_event_list,
+            [
+                {"contract": contract.pk},
+                {"contract": self.test_contract_1.pk},
+                {"contract": contract.pk},
+            ],
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            [
+                {},
+                {"contract": ["event with this contract already exists."]},
+                {"contract": ["event with this contract already exists."]},
+            ],
+        )
+        self.assertFalse(Event.objects.filter(contract=contract).exists())
+
+    def test_bulk_create_empty(self):
+        response, _ = self.post(self.test_sales_team_member, self.url_client_list, [])
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(RESPONSE_CACHE_ALIAS="responses")
+    def test_bulk_create_invalidates_lists(self):
+        caches["responses"].clear()
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        self.client.get(self.url_client_list)
+
+        self.post(
+            self.test_sales_team_member,
+            self.url_client_list,
+            self.get_clients_data(2),
+        )
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        response = self.client.get(self.url_client_list)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.json()["results"]), 4)
@@ -0,0 +1,172 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from contracts.models import Contract
+from events.models import Event
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestBulkUpdate(ProjectAPITestCase):
+    url_client_bulk_update = reverse_lazy("client-bulk-update")
+    url_contract_bulk_update = reverse_lazy("contract-bulk-update")
+    url_event_bulk_update = reverse_lazy("event-bulk-update")
+
+    def patch(self, user, url, data):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(url, data=data, format="json")
+        return response, len(context.captured_queries)
+
+    def test_bulk_update_contracts_by_ids(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        self.client.get(self.url_contract_detail)
+        date_updated = self.test_contract_2.date_updated
+        response, _ = self.patch(
+            self.test_sales_team_member,
+            self.url_contract_bulk_update,
+            {
+                "ids": [self.test_contract_1.pk, self.test_contract_2.pk, 999],
+                "patch": {"status": self.test_status_signed.pk},
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "updated": [self.test_contract_1.pk],
+                "forbidden": [self.test_contract_2.pk],
+                "not_found": [999],
+            },
+        )
+        self.test_contract_1.refresh_from_db()
+        self.test_contract_2.refresh_from_db()
+        self.assertEqual(self.test_contract_1.status, self.test_status_signed)
+        self.assertIsNotNone(self.test_contract_1.date_updated)
+        self.assertEqual(self.test_contract_2.status, self.test_status_unsigned)
+        self.assertEqual(self.test_contract_2.date_updated, date_updated)
+
+        # The detail shows the change
+        response = self.client.get(self.url_contract_detail)
+        self.assertEqual(response.json()["status_name"], "Signed")
+
+    def test_bulk_update_events_by_filter(self):
+        self.create_clients_with_contracts_and_events(3)
+        self.create_clients_with_contracts_and_events(
+            2, support_contact=self.test_support_team_member_2
+        )
+        response, _ = self.patch(
+            self.test_support_team_member,
+            self.url_event_bulk_update,
+            {
+                "filter": {"status": self.test_status_in_process.pk},
+                "patch": {"status": self.test_status_ended.pk, "attendees": 50},
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        events = Event.objects.filter(
+            support_contact=self.test_support_team_member,
+            status=self.test_status_in_process,
+        )
+        self.assertFalse(events.exists())
+        ended = Event.objects.filter(status=self.test_status_ended)
+        self.assertEqual(
+            sorted(response.json()["updated"]), [event.pk for event in ended]
+        )
+        self.assertEqual(len(ended), 3)
+        self.assertEqual({event.attendees for event in ended}, {50})
+        self.assertEqual(
+            {event.support_contact for event in ended},
+            {self.test_support_team_member},
+        )
+
+    def test_bulk_update_query_count(self):
+        self.create_clients_with_contracts_and_events(50)
+        contracts = list(
+            Contract.objects.filter(sales_contact=self.test_sales_team_member)
+        )
+        data = {"patch": {"status": self.test_status_signed.pk}}
+        self.patch(
+            self.test_sales_team_member,
+            self.url_contract_bulk_update,
+            {"ids": [contracts[0].pk], **data},
+        )
+
+        _, expected_count = self.patch(
+            self.test_sales_team_member,
+            self.url_contract_bulk_update,
+            {"ids": [contract.pk for contract in contracts[:2]], **data},
+        )
+        response, count = self.patch(
+            self.test_sales_team_member,
+            self.url_contract_bulk_update,
+            {"ids": [contract.pk for contract in contracts], **data},
+        )
+        self.assertEqual(len(response.json()["updated"]), len(contracts))
+        self.assertEqual(count, expected_count)
+
+    def test_bulk_update_invalid(self):
+        ids = [self.test_client_1.pk]
+        test_bulk_update_invalid_params = [
+            (
+                {"patch": {"status": self.test_status_existing.pk}},
+                {"non_field_errors": ["Give either ids or a filter."]},
+            ),
+            (
+                {"ids": ids, "patch": {"sales_contact": 1}},
+                {"patch": ["Cannot be updated in bulk: sales_contact."]},
+            ),
+            (
+                {"ids": ids, "patch": {"email": "not an email"}},
+                {"patch": {"email": ["Enter a valid email address."]}},
+            ),
+            (
+                {"filter": {"company_name": "Google"}, "patch": {"email": "a@b.co"}},
+                {"filter": ["Unknown filter: company_name."]},
+            ),
+        ]
+        for data, expected_errors in test_bulk_update_invalid_params:
+            with self.subTest(data=data):
+                response, _ = self.patch(
+                    self.test_sales_team_member, self.url_client_bulk_update, data
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), expected_errors)
+
+    def test_bulk_update_permissions(self):
+        test_bulk_update_permissions_params = [
+            (
+                self.test_support_team_member,
+                self.url_client_bulk_update,
+                {"ids": [self.test_client_1.pk], "patch": {"company_name": "X"}},
+            ),
+            (
+                self.test_sales_team_member,
+                self.url_event_bulk_update,
+                {"ids": [self.test_event_1.pk], "patch": {"attendees": 1}},
+            ),
+        ]
+        for user, url, data in test_bulk_update_permissions_params:
+            with self.subTest(url=url):
+                response, _ = self.patch(user, url, data)
+                self.assertEqual(response.status_code, 403)
+
+        # Events of other support team members cannot be changed
+        response, _ = self.patch(
+            self.test_support_team_member,
+            self.url_event_bulk_update,
+            {
+                "ids": [self.test_event_1.pk, self.test_event_2.pk],
+                "patch": {"attendees": 1},
+            },
+        )
+        self.assertEqual(
+            response.json(),
+            {
+                "updated": [self.test_event_1.pk],
+                "forbidden": [self.test_event_2.pk],
+                "not_found": [],
+            },
+        )
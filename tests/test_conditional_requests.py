@@ -0,0 +1,151 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from authentication.models import User
+from contracts.models import Contract
+from events.models import Event
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestConditionalRequests(ProjectAPITestCase):
+    def get_details(self):
+        return [
+            # (user, url, PUT data)
+            (
+                self.test_sales_team_member,
+                self.url_client_detail,
+                {
+                    "company_name": "Apple",
+                    "first_name": "Tim",
+                    "last_name": "Cook",
+                    "email": "tim.cook@apple.com",
+                    "status": self.test_status_existing.pk,
+                },
+            ),
+            (
+                self.test_sales_team_member,
+                self.url_contract_detail,
+                {"client": self.test_client_1.pk, "amount": 15000},
+            ),
+            (
+                self.test_support_team_member,
+                self.url_event_detail,
+                {"contract": self.test_contract_1.pk, "attendees": 200},
+            ),
+        ]
+
+    def test_conditional_get(self):
+        for user, url, _ in self.get_details():
+            with self.subTest(url=url):
+                self.client.force_authenticate(user=user)
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag = response.headers["ETag"]
+                last_modified = response.headers["Last-Modified"]
+
+                # A single query, and no body
+                with CaptureQueriesContext(connection) as context:
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(len(context.captured_queries), 1)
+                self.assertEqual(response.content, b"")
+
+                response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+                self.assertEqual(response.status_code, 304)
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH='"0"')
+                self.assertEqual(response.status_code, 200)
+
+    def test_conditional_get_unknown_object(self):
+        self.client.force_authenticate(user=self.test_support_team_member_3)
+        response = self.client.get(self.url_client_detail, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 404)
+
+    def test_conditional_get_nested_change(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        etag = self.client.get(self.url_client_detail).headers["ETag"]
+
+        Contract.objects.create(client=self.test_client_1, amount=1000)
+
+        response = self.client.get(self.url_client_detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_conditional_get_changes_outside_api(self):
+        def rename_sales_contact():
+            user = User.objects.get(pk=self.test_sales_team_member.pk)
+            user.last_name = "Renamed"
+            user.save()
+
+        def change_client_status():
+            # As in the admin, which saves the whole row
+            self.test_client_1.status = self.test_status_existing
+            self.test_client_1.save()
+
+        def rename_client():
+            self.test_client_1.company_name += " Inc."
+            self.test_client_1.save()
+
+        def change_contract_amount():
+            self.test_contract_1.amount += 1000
+            self.test_contract_1.save()
+
+        def reassign_event():
+            self.test_event_1.support_contact = self.test_support_team_member_2
+            self.test_event_1.save()
+
+        def delete_event():
+            self.test_event_1.delete()
+
+        changes = [
+            (self.url_client_detail, rename_sales_contact),
+            (self.url_contract_detail, rename_sales_contact),
+            (self.url_client_detail, change_client_status),
+            (self.url_contract_detail, rename_client),
+            (self.url_event_detail, rename_client),
+            (self.url_client_detail, change_contract_amount),
+            (self.url_event_detail, change_contract_amount),
+            # The sales contact of the client sees the event
+            (self.url_event_detail, reassign_event),
+            (self.url_contract_detail, delete_event),
+        ]
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        for url, change in changes:
+            with self.subTest(url=url, change=change.__name__):
+                etag = self.client.get(url).headers["ETag"]
+                change()
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_login_keeps_validators(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        etag = self.client.get(self.url_client_detail).headers["ETag"]
+        self.client.force_authenticate(user=None)
+        self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "sales_tester", "password": "s@l3s_73573r"},
+        )
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        response = self.client.get(self.url_client_detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_conditional_put(self):
+        for user, url, data in self.get_details():
+            with self.subTest(url=url):
+                self.client.force_authenticate(user=user)
+                etag = self.client.get(url).headers["ETag"]
+
+                response = self.client.put(url, data=data, HTTP_IF_MATCH='"0"')
+                self.assertEqual(response.status_code, 412)
+
+                response = self.client.put(url, data=data, HTTP_IF_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                new_etag = response.headers["ETag"]
+                self.assertNotEqual(new_etag, etag)
+                self.assertEqual(self.client.get(url).headers["ETag"], new_etag)
+
+                # The previous version is now stale
+                response = self.client.put(url, data=data, HTTP_IF_MATCH=etag)
+                self.assertEqual(response.status_code, 412)
@@ -0,0 +1,105 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections
+from django.test import TestCase, override_settings
+
+from EpicEvents_CRM.postgresql_pool.base import DatabaseWrapper
+
+
+@override_settings(DB_POOL=True)
+class TestConnectionPool(TestCase):
+    def get_wrapper(self, **settings):
+        # Own pool, outside the transaction of the test
+        wrapper = DatabaseWrapper(
+            {
+                **connection.settings_dict,
+                "OPTIONS": {
+                    "pool": {"min_size": 1, "max_size": 1},
+                    "server_side_binding": True,
+                    "prepare_threshold": 5,
+                },
+                **settings,
+            },
+            alias="pool_test",
+        )
+        connections["pool_test"] = wrapper
+        self.addCleanup(connections.__delitem__, "pool_test")
+        self.addCleanup(wrapper.close_pool)
+        return wrapper
+
+    def get_backend_pid(self, wrapper):
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            return cursor.fetchone()[0]
+
+    def test_pool_reuses_connections(self):
+        wrapper = self.get_wrapper()
+        backend_pid = self.get_backend_pid(wrapper)
+        wrapper.close()
+
+        self.assertEqual(self.get_backend_pid(wrapper), backend_pid)
+        wrapper.close()
+        self.assertEqual(wrapper.get_pool_stats()["requests_num"], 2)
+
+    def test_pool_replaces_broken_connections(self):
+        wrapper = self.get_wrapper()
+        backend_pid = self.get_backend_pid(wrapper)
+        wrapper.close()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(%s)", [backend_pid])
+
+        # Checked before it is handed out
+        self.assertNotEqual(self.get_backend_pid(wrapper), backend_pid)
+
+    def test_pool_closes_connections_of_closed_pools(self):
+        wrapper = self.get_wrapper()
+        wrapper.ensure_connection()
+        pooled_connection = wrapper.connection
+        # Opened again, e.g. after its settings change
+        type(wrapper)._connection_pools.pop("pool_test").close()
+        other_wrapper = DatabaseWrapper(wrapper.settings_dict, "pool_test")
+        self.addCleanup(other_wrapper.close)
+        self.get_backend_pid(other_wrapper)
+
+        wrapper.close()
+        self.assertTrue(pooled_connection.closed)
+
+    def test_pool_rolls_back_open_transactions(self):
+        wrapper = self.get_wrapper()
+        wrapper.set_autocommit(False)
+        with wrapper.cursor() as cursor:
+            cursor.execute("CREATE TEMPORARY TABLE pool_test (id integer)")
+        with self.assertLogs("psycopg.pool", "WARNING"):
+            wrapper.close()
+
+        wrapper.ensure_connection()
+        self.assertTrue(wrapper.get_autocommit())
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('pool_test')")
+            self.assertIsNone(cursor.fetchone()[0])
+
+    def test_pool_prepares_repeated_statements(self):
+        wrapper = self.get_wrapper()
+        with wrapper.cursor() as cursor:
+            for user_id in range(6):
+                cursor.execute(
+                    "SELECT count(*) FROM authentication_user WHERE id = %s",
+                    [user_id],
+                )
+            cursor.execute(
+                "SELECT statement FROM pg_prepared_statements "
+                "WHERE statement LIKE '%%authentication_user%%'"
+            )
+            self.assertEqual(len(cursor.fetchall()), 1)
+
+    def test_pool_stats_are_logged(self):
+        wrapper = self.get_wrapper()
+        wrapper.pool_stats_interval = 0
+        with self.assertLogs("EpicEvents_CRM.postgresql_pool") as logs:
+            wrapper.ensure_connection()
+        self.assertIn("Connection pool pool_test: ", logs.output[0])
+        self.assertIn("1 requests, ", logs.output[0])
+
+    def test_pool_requires_conn_max_age_0(self):
+        wrapper = self.get_wrapper(CONN_MAX_AGE=60)
+        with self.assertRaises(ImproperlyConfigured):
+            wrapper.ensure_connection()
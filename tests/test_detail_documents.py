@@ -0,0 +1,117 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from clients.models import ClientDocument
+from contracts.models import ContractDocument
+from events.models import EventDocument
+from EpicEvents_CRM.documents import build_document_request
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestDetailDocuments(ProjectAPITestCase):
+    def get(self, user, url):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def get_details(self):
+        return [
+            # (user, url, document model)
+            (self.test_sales_team_member, self.url_client_detail, ClientDocument),
+            (self.test_sales_team_member, self.url_contract_detail, ContractDocument),
+            (self.test_support_team_member, self.url_event_detail, EventDocument),
+        ]
+
+    def test_detail_documents(self):
+        for user, url, document_model in self.get_details():
+            with self.subTest(url=url):
+                with override_settings(DETAIL_DOCUMENTS=False):
+                    expected_response, _ = self.get(user, url)
+                response, _ = self.get(user, url)
+                self.assertEqual(document_model.objects.count(), 1)
+
+                # Validators and document only
+                response, queries = self.get(user, url)
+                self.assertEqual(queries, 2)
+                self.assertEqual(response.json(), expected_response.json())
+                self.assertEqual(response.headers["ETag"], expected_response["ETag"])
+
+    def test_detail_documents_scope(self):
+        self.get(self.test_sales_team_member, self.url_client_detail)
+
+        self.client.force_authenticate(user=self.test_support_team_member_3)
+        response = self.client.get(self.url_client_detail)
+        self.assertEqual(response.status_code, 404)
+
+    def test_detail_documents_invalidation(self):
+        for user, url, document_model in self.get_details():
+            self.get(user, url)
+
+        # The objects showing the renamed user get a new ETag
+        self.test_sales_team_member.first_name = "Renamed"
+        self.test_sales_team_member.save()
+        for url in (self.url_client_detail, self.url_contract_detail):
+            response, _ = self.get(self.test_sales_team_member, url)
+            self.assertEqual(response.json()["sales_contact"]["full_name"], "Renamed ")
+        # Validators and document only
+        _, queries = self.get(self.test_support_team_member, self.url_event_detail)
+        self.assertEqual(queries, 2)
+
+        # Contract moved to another client
+        self.test_contract_1.client = self.test_client_2
+        self.test_contract_1.save()
+        response, _ = self.get(self.test_sales_team_member, self.url_client_detail)
+        self.assertEqual(response.json()["contracts_and_events"]["results"], [])
+        response, _ = self.get(self.test_sales_team_member, self.url_contract_detail)
+        self.assertEqual(response.json()["client_company_name"], "Microsoft")
+
+    def test_detail_documents_not_stored_from_replica(self):
+        # Its rows may be older than the stored document
+        with mock.patch(
+            "EpicEvents_CRM.documents.get_read_database", return_value="replica"
+        ):
+            for user, url, _ in self.get_details():
+                self.get(user, url)
+        self.assertFalse(ClientDocument.objects.exists())
+        self.assertFalse(ContractDocument.objects.exists())
+        self.assertFalse(EventDocument.objects.exists())
+
+    def test_build_document_request(self):
+        request = build_document_request("https://testserver/", "/api/clients/1/")
+        self.assertEqual(
+            request.build_absolute_uri(), "https://testserver/api/clients/1/"
+        )
+
+    def test_detail_documents_built_before_commit(self):
+        # Built by another request after the signals deleted the documents,
+        # from the rows before the commit, for an ETag the change keeps
+        with self.captureOnCommitCallbacks(execute=True):
+            self.test_status_existing.save()
+            for user, url, _ in self.get_details():
+                self.get(user, url)
+            self.assertTrue(ClientDocument.objects.exists())
+        self.assertFalse(ClientDocument.objects.exists())
+        self.assertEqual(ContractDocument.objects.count(), 1)
+        self.assertEqual(EventDocument.objects.count(), 1)
+
+    def test_detail_documents_command(self):
+        for user, url, _ in self.get_details():
+            self.get(user, url)
+        call_command("detail_documents", stdout=StringIO())
+
+        ClientDocument.objects.update(content="{}")
+        with self.assertRaisesMessage(CommandError, "1 documents do not match"):
+            call_command("detail_documents", stdout=StringIO())
+
+        call_command("detail_documents", "--delete", stdout=StringIO())
+        self.assertFalse(ClientDocument.objects.exists())
+        self.assertEqual(ContractDocument.objects.count(), 1)
+        call_command("detail_documents", stdout=StringIO())
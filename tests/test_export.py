@@ -0,0 +1,200 @@
+import csv
+import gzip
+import io
+import json
+
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse_lazy
+
+from clients.models import Client
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestExport(ProjectAPITestCase):
+    url_client_export = reverse_lazy("client-export")
+    url_contract_export = reverse_lazy("contract-export")
+    url_event_export = reverse_lazy("event-export")
+
+    def export(self, user, url, **extra):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200)
+        return response, b"".join(response.streaming_content)
+
+    def read_csv(self, content):
+        return list(csv.DictReader(io.StringIO(content.decode())))
+
+    def test_export_csv(self):
+        response, content = self.export(
+            self.test_sales_team_member, self.url_contract_export
+        )
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="contracts.csv"'
+        )
+        self.assertEqual(
+            content.decode().splitlines()[0],
+            "id,client,status,amount,payment_due,sales_contact,"
+            "date_created,date_updated",
+        )
+        rows = self.read_csv(content)
+        self.assertEqual(
+            [(row["id"], row["client"], row["status"], row["amount"]) for row in rows],
+            [
+                (
+                    str(contract.pk),
+                    contract.client.company_name,
+                    str(contract.status),
+                    f"{contract.amount:.2f}",
+                )
+                for contract in [
+                    self.test_contract_1,
+                    self.test_contract_2,
+                    self.test_contract_3,
+                ]
+            ],
+        )
+        self.assertEqual(rows[0]["payment_due"], "")
+
+    def test_export_ndjson(self):
+        for extra in [
+            {"data": {"format": "ndjson"}},
+            {"HTTP_ACCEPT": "application/x-ndjson"},
+        ]:
+            with self.subTest(extra=extra):
+                response, content = self.export(
+                    self.test_support_team_member, self.url_event_export, **extra
+                )
+                self.assertEqual(
+                    response["Content-Type"], "application/x-ndjson; charset=utf-8"
+                )
+                rows = [json.loads(line) for line in content.decode().splitlines()]
+                self.assertEqual(
+                    [(row["id"], row["client"]) for row in rows],
+                    [
+                        (self.test_event_1.pk, self.test_client_1.company_name),
+                        (self.test_event_2.pk, self.test_client_2.company_name),
+                    ],
+                )
+
+    def test_export_scopes_and_filters(self):
+        self.create_clients_with_contracts_and_events(
+            3, sales_contact=self.test_sales_team_member_3
+        )
+        test_export_params = [
+            # Only the events of the sales team member's clients
+            (self.test_sales_team_member, self.url_event_export, {}, 1),
+            # Only the clients of the support team member's events
+            (self.test_support_team_member_2, self.url_client_export, {}, 1),
+            (
+                self.test_sales_team_member,
+                self.url_client_export,
+                {"search": "Company"},
+                3,
+            ),
+            (
+                self.test_sales_team_member,
+                self.url_contract_export,
+                {"client__company_name": self.test_client_2.company_name},
+                2,
+            ),
+        ]
+        for user, url, params, expected_count in test_export_params:
+            with self.subTest(user=user, url=url, params=params):
+                _, content = self.export(user, url, data=params)
+                self.assertEqual(len(self.read_csv(content)), expected_count)
+
+    def test_export_fields(self):
+        _, content = self.export(
+            self.test_sales_team_member,
+            self.url_client_export,
+            data={"fields": "id,email"},
+        )
+        self.assertEqual(
+            self.read_csv(content),
+            [
+                {"id": str(client.pk), "email": client.email}
+                for client in [self.test_client_1, self.test_client_2]
+            ],
+        )
+
+    def test_export_formulas(self):
+        test_export_formulas_params = [
+            # (value, exported value)
+            (
+                '=HYPERLINK("https://example.com")',
+                '\'=HYPERLINK("https://example.com")',
+            ),
+            ("+1+1", "'+1+1"),
+            ("-1+1", "'-1+1"),
+            ("@SUM(A1:A2)", "'@SUM(A1:A2)"),
+            ("\t=1+1", "'\t=1+1"),
+            ("-1.50", "-1.50"),
+            ("Apple = Pear", "Apple = Pear"),
+        ]
+        for value, expected_value in test_export_formulas_params:
+            with self.subTest(value=value):
+                Client.objects.filter(pk=self.test_client_1.pk).update(
+                    company_name=value
+                )
+                _, content = self.export(
+                    self.test_sales_team_member,
+                    self.url_client_export,
+                    data={"fields": "company_name"},
+                )
+                self.assertEqual(
+                    self.read_csv(content)[0]["company_name"], expected_value
+                )
+
+    def test_export_gzip(self):
+        response, content = self.export(
+            self.test_sales_team_member,
+            self.url_client_export,
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(self.read_csv(gzip.decompress(content))), 2)
+
+    def test_export_query_count(self):
+        self.create_clients_with_contracts_and_events(20)
+        self.client.force_authenticate(user=self.test_support_team_member)
+        # Warm the role and status lookups before counting
+        b"".join(self.client.get(self.url_event_export).streaming_content)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_event_export)
+            content = b"".join(response.streaming_content)
+        self.assertEqual(len(self.read_csv(content)), 22)
+        selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if "SELECT" in query["sql"]
+        ]
+        self.assertEqual(len(selects), 1)
+
+    def test_export_not_atomic(self):
+        # The rows are sent after the view returns, outside any transaction
+        for url in [
+            self.url_client_export,
+            self.url_contract_export,
+            self.url_event_export,
+        ]:
+            with self.subTest(url=url):
+                self.assertEqual(
+                    resolve(url).func._non_atomic_requests, {DEFAULT_DB_ALIAS}
+                )
+
+    def test_export_errors(self):
+        response = self.client.get(self.url_contract_export)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        response = self.client.get(self.url_contract_export, {"fields": "secret"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": ["Unknown field: secret."]})
+
+        response = self.client.post(self.url_contract_export, {})
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,252 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+
+from authentication.models import User
+from clients.models import Client, ClientImportKey
+from contracts.models import Contract
+from events.management.commands.import_data import ContractImporter
+from events.models import Event, SupportAccess
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestImport(ProjectAPITestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write_csv(self, name, rows):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def write_ndjson(self, name, lines):
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as file:
+            for line in lines:
+                file.write((line if isinstance(line, str) else json.dumps(line)) + "\n")
+        return path
+
+    def import_file(self, resource, path, **options):
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command(
+            "import_data",
+            resource,
+            path,
+            source="agency",
+            stdout=stdout,
+            stderr=stderr,
+            **options,
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def get_contracts_lines(self, count):
+        return [
+            {"key": f"K{index}", "client": "C1", "amount": f"{index}000.50"}
+            for index in range(count)
+        ]
+
+    def import_users_and_clients(self):
+        self.import_file(
+            "users",
+            self.write_csv(
+                "users.csv",
+                [
+                    {
+                        "username": "agency_sales",
+                        "password": make_password("secret"),
+                        "first_name": "Sam",
+                        "last_name": "Sales",
+                        "email": "sam@agency.com",
+                        "role": "SAL",
+                    },
+                    {
+                        "username": "agency_support",
+                        "password": "",
+                        "first_name": "Sue",
+                        "last_name": "Support",
+                        "email": "sue@agency.com",
+                        "role": "SUP",
+                    },
+                    {
+                        "username": "agency_manager",
+                        "password": "",
+                        "first_name": "Max",
+                        "last_name": "Manager",
+                        "email": "max@agency.com",
+                        "role": "MAN",
+                    },
+                ],
+            ),
+        )
+        self.import_file(
+            "clients",
+            self.write_csv(
+                "clients.csv",
+                [
+                    {
+                        "key": f"C{index}",
+                        "company_name": f"Agency client {index}",
+                        "first_name": "First",
+                        "last_name": "Last",
+                        "email": f"client{index}@agency.com",
+                        "status": "EXI" if index else "",
+                        "sales_contact": "agency_sales",
+                    }
+                    for index in range(3)
+                ],
+            ),
+        )
+
+    def test_import(self):
+        self.import_users_and_clients()
+        stdout, _ = self.import_file(
+            "contracts",
+            self.write_ndjson("contracts.ndjson", self.get_contracts_lines(3)),
+        )
+        self.assertIn("3 rows read, 3 imported", stdout)
+        self.assertIn("rows/s", stdout)
+        stdout, stderr = self.import_file(
+            "events",
+            self.write_csv(
+                "events.csv",
+                [
+                    {
+                        "contract": "K0",
+                        "support_contact": "agency_support",
+                        "status": "PRO",
+                        "attendees": "150",
+                        "event_date": "2024-06-01T18:00:00Z",
+                        "notes": "Open bar",
+                    },
+                    {
+                        "contract": "K1",
+                        "support_contact": "",
+                        "status": "",
+                        "attendees": "",
+                        "event_date": "",
+                        "notes": "",
+                    },
+                ],
+            ),
+        )
+        self.assertEqual(stderr, "")
+
+        sales = User.objects.get(username="agency_sales")
+        self.assertTrue(sales.check_password("secret"))
+        self.assertFalse(sales.is_staff)
+        support = User.objects.get(username="agency_support")
+        self.assertFalse(support.has_usable_password())
+        self.assertTrue(User.objects.get(username="agency_manager").is_superuser)
+
+        clients = Client.objects.filter(company_name__startswith="Agency")
+        self.assertEqual(
+            [(str(client.status), client.sales_contact) for client in clients],
+            [
+                ("Prospective Client", sales),
+                ("Existing Client", sales),
+                ("Existing Client", sales),
+            ],
+        )
+        self.assertEqual(
+            list(
+                ClientImportKey.objects.filter(source="agency")
+                .order_by("key")
+                .values_list("key", "client")
+            ),
+            [(f"C{index}", client.pk) for index, client in enumerate(clients)],
+        )
+
+        contracts = Contract.objects.filter(client=clients[1])
+        self.assertEqual(
+            [(contract.amount, contract.sales_contact) for contract in contracts],
+            [(index * 1000 + 0.5, sales) for index in range(3)],
+        )
+        self.assertEqual(str(contracts[0].status), "Not Signed")
+
+        events = Event.objects.filter(contract__client=clients[1])
+        self.assertEqual(
+            [
+                (event.contract, event.support_contact, str(event.status))
+                for event in events
+            ],
+            [(contracts[0], support, "In Process"), (contracts[1], None, "Created")],
+        )
+        self.assertEqual(events[0].sales_contact, sales)
+        self.assertEqual(events[0].attendees, 150)
+        self.assertEqual(
+            list(SupportAccess.objects.filter(user=support).values_list("event")),
+            [(events[0].pk,)],
+        )
+
+    def test_import_errors(self):
+        self.import_users_and_clients()
+        clients_1 = Client.objects.get(company_name="Agency client 1")
+        lines = self.get_contracts_lines(2) + [
+            {"key": "K2", "client": "C404", "amount": "10"},
+            {"key": "K3", "client": "C1", "amount": "ten"},
+            {"key": "", "client": "C1", "amount": "10"},
+            "{not json",
+        ]
+        stdout, stderr = self.import_file(
+            "contracts", self.write_ndjson("contracts.ndjson", lines)
+        )
+
+        self.assertIn("6 rows read, 2 imported, 0 already imported, 4 rejected", stdout)
+        self.assertEqual(
+            stderr.splitlines(),
+            [
+                "Line 3: client: Unknown client: C404.",
+                "Line 4: amount: “ten” value must be a decimal number.",
+                "Line 5: key: This field is required.",
+                "Line 6: record: Not a JSON object.",
+            ],
+        )
+        self.assertEqual(
+            list(
+                Contract.objects.filter(client=clients_1).values_list(
+                    "amount", flat=True
+                )
+            ),
+            [0.5, 1000.5],
+        )
+
+    def test_import_resumes(self):
+        self.import_users_and_clients()
+        path = self.write_ndjson(
+            "contracts.ndjson",
+            # Repeated keys are imported once
+            self.get_contracts_lines(5) + self.get_contracts_lines(1),
+        )
+
+        with mock.patch.object(
+            ContractImporter, "after_merge", side_effect=[None, RuntimeError]
+        ):
+            with self.assertRaises(RuntimeError):
+                self.import_file("contracts", path, batch_size=2)
+        # The first batch was imported, the second rolled back
+        self.assertEqual(
+            Contract.objects.filter(client__company_name="Agency client 1").count(), 2
+        )
+
+        stdout, _ = self.import_file("contracts", path, batch_size=2)
+        self.assertIn("6 rows read, 3 imported, 3 already imported", stdout)
+        self.assertEqual(
+            sorted(
+                Contract.objects.filter(
+                    client__company_name="Agency client 1"
+                ).values_list("amount", flat=True)
+            ),
+            [index * 1000 + 0.5 for index in range(5)],
+        )
@@ -0,0 +1,41 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from rest_framework import generics
+
+from clients.views import ClientQuerysetMixin
+from EpicEvents_CRM.async_views import AsyncListModelMixin, AsyncRetrieveModelMixin
+from EpicEvents_CRM.conditional import ConditionalDetailMixin
+from EpicEvents_CRM.documents import DocumentDetailMixin
+from EpicEvents_CRM.export import ExportMixin
+from EpicEvents_CRM.query_plans import QueryPlanMixin
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from EpicEvents_CRM.streaming import StreamingListMixin
+
+
+class TestMixinOrder(SimpleTestCase):
+    def test_mixin_order(self):
+        test_mixin_order_params = [
+            # (bases, valid)
+            ((ConditionalDetailMixin, DocumentDetailMixin), True),
+            ((DocumentDetailMixin, ConditionalDetailMixin), False),
+            ((DocumentDetailMixin,), False),
+            ((ConditionalDetailMixin, AsyncRetrieveModelMixin), True),
+            ((AsyncRetrieveModelMixin, ConditionalDetailMixin), False),
+            ((StreamingListMixin, ListCacheMixin, AsyncListModelMixin), True),
+            ((ListCacheMixin, StreamingListMixin), False),
+            ((ListCacheMixin, AsyncListModelMixin), True),
+            ((AsyncListModelMixin, ListCacheMixin), False),
+            ((ExportMixin, StreamingListMixin), True),
+            ((StreamingListMixin, ExportMixin), False),
+            ((QueryPlanMixin, ClientQuerysetMixin), True),
+            ((ClientQuerysetMixin, QueryPlanMixin), False),
+        ]
+        for bases, valid in test_mixin_order_params:
+            names = [base.__name__ for base in bases]
+            with self.subTest(bases=names):
+                bases = (*bases, generics.GenericAPIView)
+                if valid:
+                    type("View", bases, {})
+                else:
+                    with self.assertRaises(ImproperlyConfigured):
+                        type("View", bases, {})
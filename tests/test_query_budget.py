@@ -0,0 +1,147 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from clients.models import ClientDocument
+from contracts.models import Contract, ContractDocument
+from events.models import EventDocument
+from tests.test_setup import ProjectAPITestCase
+
+
+class EndpointsMixin:
+    """Every endpoint of the API, also timed by benchmarks.bench_endpoints."""
+
+    def get_endpoints(self):
+        sales = self.test_sales_team_member
+        support = self.test_support_team_member
+        return [
+            # (user, method, url, data factory, query budget)
+            # Detail budgets are the ones of serving a stored document
+            (sales, "get", self.url_client_list, None, 1),
+            (support, "get", self.url_client_list, None, 1),
+            (sales, "post", self.url_client_list, self.get_client_data, 2),
+            (sales, "get", self.url_client_detail, None, 3),
+            (support, "get", self.url_client_detail, None, 3),
+            (sales, "put", self.url_client_detail, self.get_client_data, 6),
+            (sales, "get", self.url_client_status_list, None, 1),
+            (sales, "get", self.url_contract_list, None, 1),
+            (support, "get", self.url_contract_list, None, 1),
+            (sales, "post", self.url_contract_list, self.get_contract_data, 3),
+            (sales, "get", self.url_contract_detail, None, 2),
+            (support, "get", self.url_contract_detail, None, 2),
+            (sales, "put", self.url_contract_detail, self.get_contract_data, 7),
+            (sales, "get", self.url_contract_status_list, None, 1),
+            (sales, "get", self.url_event_list, None, 1),
+            (support, "get", self.url_event_list, None, 1),
+            (sales, "post", self.url_event_list, self.get_event_data, 6),
+            (sales, "get", self.url_event_detail, None, 2),
+            (support, "get", self.url_event_detail, None, 2),
+            (support, "put", self.url_event_detail, self.get_event_data, 6),
+            (support, "get", self.url_event_status_list, None, 1),
+        ]
+
+    def get_document_endpoints(self):
+        sales = self.test_sales_team_member
+        support = self.test_support_team_member
+        return [
+            # (user, url, document model, query budget of building the document)
+            (sales, self.url_client_detail, ClientDocument, 5),
+            (sales, self.url_contract_detail, ContractDocument, 4),
+            (support, self.url_event_detail, EventDocument, 4),
+        ]
+
+    def get_client_data(self):
+        return {
+            "company_name": "Apple",
+            "first_name": "Tim",
+            "last_name": "Cook",
+            "email": "tim.cook@apple.com",
+            "status": self.test_status_existing.pk,
+        }
+
+    def get_contract_data(self):
+        return {"client": self.test_client_1.pk, "amount": 15000}
+
+    def get_event_data(self):
+        # Each event needs a contract of its own
+        contract = Contract.objects.create(client=self.test_client_1, amount=1000)
+        return {"contract": contract.pk, "attendees": 200}
+
+    def seed(self, count):
+        # Rows visible to the main test users and rows hidden from them
+        self.create_clients_with_contracts_and_events(count)
+        self.create_clients_with_contracts_and_events(
+            count,
+            sales_contact=self.test_sales_team_member_2,
+            support_contact=self.test_support_team_member_2,
+        )
+
+
+class TestQueryBudget(EndpointsMixin, ProjectAPITestCase):
+    # Rows seeded for each role before the first measure, ten times more after
+    N = 5
+
+    def measure(self, user, method, url, data_factory):
+        data = data_factory() if data_factory else None
+        self.client.force_authenticate(user=user)
+        if method == "get":
+            # Builds the detail documents, measured by test_document_budget
+            self.client.get(url)
+        return self.measure_request(method, url, data)
+
+    def measure_building(self, user, url, document_model):
+        document_model.objects.all().delete()
+        self.client.force_authenticate(user=user)
+        return self.measure_request("get", url)
+
+    def measure_request(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data=data)
+        self.assertLess(response.status_code, 300, response.content)
+        return len(context.captured_queries)
+
+    def measure_all(self, endpoints):
+        return [
+            self.measure(user, method, url, data_factory)
+            for user, method, url, data_factory, budget in endpoints
+        ]
+
+    def measure_all_building(self, endpoints):
+        return [
+            self.measure_building(user, url, document_model)
+            for user, url, document_model, budget in endpoints
+        ]
+
+    def test_query_budget(self):
+        endpoints = self.get_endpoints()
+        self.assert_budgets(
+            [(user, method, url, budget) for user, method, url, _, budget in endpoints],
+            lambda: self.measure_all(endpoints),
+        )
+
+    def test_document_budget(self):
+        endpoints = self.get_document_endpoints()
+        self.assert_budgets(
+            [(user, "get", url, budget) for user, url, _, budget in endpoints],
+            lambda: self.measure_all_building(endpoints),
+        )
+
+    def assert_budgets(self, budgets, measure_all):
+        # Warm the role and status lookups, as a long-running worker would have
+        measure_all()
+
+        self.seed(self.N)
+        small_measures = measure_all()
+        self.seed(9 * self.N)
+        large_measures = measure_all()
+
+        for endpoint, small_count, large_count in zip(
+            budgets, small_measures, large_measures
+        ):
+            user, method, url, budget = endpoint
+            with self.subTest(user=user, method=method, url=url):
+                self.assertEqual(
+                    large_count,
+                    small_count,
+                    "The number of queries grows with the number of rows",
+                )
+                self.assertLessEqual(large_count, budget)
@@ -0,0 +1,129 @@
+import tempfile
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connection, connections
+from django.test import override_settings
+
+from clients.models import Client
+from clients.views import ClientListCreateAPIView
+from EpicEvents_CRM.replicas import (
+    get_read_database,
+    is_pinned_to_primary,
+    pin_key,
+    pin_to_primary,
+)
+from tests.test_setup import ProjectAPITestCase
+
+
+@override_settings(REPLICA_DATABASES=["replica"])
+class TestReplicas(ProjectAPITestCase):
+    def setUp(self):
+        # A second connection to the test database stands in for a replica
+        # lagging behind: it does not see the rows of the test's transaction
+        connections.settings["replica"] = {
+            **connection.settings_dict,
+            "ENGINE": "django.db.backends.postgresql",
+            "OPTIONS": {},
+        }
+        self.addCleanup(connections.settings.__delitem__, "replica")
+        self.addCleanup(connections.__delitem__, "replica")
+        self.addCleanup(lambda: connections["replica"].close())
+        self.addCleanup(
+            caches[settings.REPLICA_PIN_CACHE_ALIAS].delete_many,
+            [
+                pin_key(self.test_sales_team_member),
+                pin_key(self.test_sales_team_member_2),
+            ],
+        )
+        self.client.force_authenticate(user=self.test_sales_team_member)
+
+    def test_reads_go_to_replica(self):
+        test_reads_go_to_replica_params = [
+            (self.url_client_list, 200),
+            (self.url_client_list + "?search=Company", 200),
+            (self.url_client_detail, 404),
+            (self.url_contract_list, 200),
+            (self.url_event_list, 200),
+        ]
+        for url, status_code in test_reads_go_to_replica_params:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status_code)
+                if status_code == 200:
+                    self.assertEqual(response.json()["results"], [])
+        self.assertIsNone(get_read_database())
+
+        response = self.client.get("/api/clients/export/")
+        self.assertEqual(b"".join(response.streaming_content).count(b"\n"), 1)
+
+    def test_reads_your_writes(self):
+        response = self.client.post(
+            self.url_client_list,
+            {
+                "company_name": "Replica",
+                "first_name": "First",
+                "last_name": "Last",
+                "email": "replica@company.com",
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        client = Client.objects.get(company_name="Replica")
+
+        # Pinned to the primary database
+        response = self.client.get(self.url_client_list, {"company_name": "Replica"})
+        self.assertEqual(len(response.json()["results"]), 1)
+        response = self.client.patch(
+            f"/api/clients/{client.pk}/", {"first_name": "Second"}
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(f"/api/clients/{client.pk}/")
+        self.assertEqual(response.json()["first_name"], "Second")
+
+        # Other users, and the user once the window is over, read the replica
+        self.client.force_authenticate(user=self.test_sales_team_member_2)
+        response = self.client.get(self.url_client_list)
+        self.assertEqual(response.json()["results"], [])
+
+        caches[settings.REPLICA_PIN_CACHE_ALIAS].delete(
+            pin_key(self.test_sales_team_member)
+        )
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        response = self.client.get(self.url_client_list)
+        self.assertEqual(response.json()["results"], [])
+
+    def test_pins_are_not_culled(self):
+        pin_cache = settings.CACHES[settings.REPLICA_PIN_CACHE_ALIAS]
+        with tempfile.TemporaryDirectory() as location, override_settings(
+            CACHES={**settings.CACHES, "pins": {**pin_cache, "LOCATION": location}},
+            REPLICA_PIN_CACHE_ALIAS="pins",
+        ):
+            pin_to_primary(self.test_sales_team_member)
+            # More keys than a FileBasedCache keeps by default
+            caches["pins"].set_many({f"key:{index}": index for index in range(400)})
+            self.assertTrue(is_pinned_to_primary(self.test_sales_team_member))
+
+    def test_failed_writes_do_not_pin(self):
+        response = self.client.post(self.url_client_list, {"company_name": "Replica"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(self.url_client_list)
+        self.assertEqual(response.json()["results"], [])
+
+    def test_async_reads_go_to_replica(self):
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            response = self.client.get(self.url_client_list)
+            self.assertEqual(response.json()["results"], [])
+            response = self.client.get(self.url_client_detail)
+            self.assertEqual(response.status_code, 404)
+
+    def test_cached_replica_responses_expire(self):
+        view = ClientListCreateAPIView()
+        self.assertEqual(view.get_cache_timeout(), DEFAULT_TIMEOUT)
+        with mock.patch(
+            "EpicEvents_CRM.response_cache.get_read_database",
+            return_value="replica",
+        ):
+            self.assertEqual(view.get_cache_timeout(), settings.REPLICA_PIN_SECONDS)
@@ -0,0 +1,146 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from clients.models import Client
+from EpicEvents_CRM.response_cache import ListCacheMixin
+from tests.test_setup import ProjectAPITestCase
+
+
+@override_settings(RESPONSE_CACHE_ALIAS="responses")
+class TestResponseCache(ProjectAPITestCase):
+    def setUp(self):
+        caches["responses"].clear()
+
+    def get(self, user, url):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def create_client(self, company_name="Google"):
+        return Client.objects.create(
+            company_name=company_name,
+            sales_contact=self.test_sales_team_member,
+            first_name="Sundar",
+            last_name="Pichai",
+            email="sundar.pichai@google.com",
+            status=self.test_status_existing,
+        )
+
+    def test_response_cache_hit(self):
+        counters = ListCacheMixin.cache_counters
+        test_response_cache_hit_params = [
+            ("client-list", self.url_client_list),
+            ("contract-list", self.url_contract_list),
+            ("event-list", self.url_event_list),
+        ]
+        for route_name, url in test_response_cache_hit_params:
+            with self.subTest(url=url):
+                expected_counters = {
+                    name: counters[name].copy()
+                    for name, _ in test_response_cache_hit_params
+                }
+                expected_counters[route_name].update(hits=1, misses=1)
+                response, _ = self.get(self.test_sales_team_member, url)
+                self.assertEqual(response.headers["X-Cache"], "MISS")
+
+                cached_response, queries = self.get(self.test_sales_team_member, url)
+                self.assertEqual(cached_response.headers["X-Cache"], "HIT")
+                self.assertEqual(cached_response.json(), response.json())
+                self.assertEqual(queries, 0)
+                # Counted for this endpoint only
+                for name in expected_counters:
+                    self.assertEqual(counters[name], expected_counters[name])
+
+    def test_response_cache_parameters(self):
+        url = self.url_client_list + "?search=Apple&page_size=2"
+        self.get(self.test_sales_team_member, url)
+
+        # The same parameters, in another order or with an empty one
+        for url in [
+            self.url_client_list + "?page_size=2&search=Apple",
+            self.url_client_list + "?page_size=2&search=Apple&email=",
+        ]:
+            response, _ = self.get(self.test_sales_team_member, url)
+            self.assertEqual(response.headers["X-Cache"], "HIT")
+
+        response, _ = self.get(self.test_sales_team_member, url + "&first_name=Tim")
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+
+    def test_response_cache_scope(self):
+        # Every Sales Team member sees every client
+        self.get(self.test_sales_team_member, self.url_client_list)
+        response, _ = self.get(self.test_sales_team_member_2, self.url_client_list)
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+
+        # Support Team members only see the clients of their events
+        response, _ = self.get(self.test_support_team_member, self.url_client_list)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        response, _ = self.get(self.test_support_team_member_2, self.url_client_list)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertEqual(
+            [client["id"] for client in response.json()["results"]],
+            [self.test_client_2.pk],
+        )
+
+    def test_response_cache_invalidation(self):
+        test_response_cache_invalidation_params = [
+            # (change, list invalidated)
+            (lambda: self.create_client(), True),
+            (lambda: self.test_client_1.save(), True),
+            (lambda: self.test_sales_team_member.save(), True),
+            (
+                lambda: self.test_sales_team_member.save(update_fields=["last_login"]),
+                False,
+            ),
+            (lambda: self.test_event_1.save(), False),
+        ]
+        for change, invalidated in test_response_cache_invalidation_params:
+            with self.subTest(invalidated=invalidated):
+                self.get(self.test_sales_team_member, self.url_client_list)
+                change()
+                response, _ = self.get(
+                    self.test_sales_team_member, self.url_client_list
+                )
+                self.assertEqual(
+                    response.headers["X-Cache"], "MISS" if invalidated else "HIT"
+                )
+
+        response, _ = self.get(self.test_sales_team_member, self.url_client_list)
+        self.assertIn(
+            "Google", [client["company_name"] for client in response.json()["results"]]
+        )
+
+    def test_response_cache_invalidation_on_commit(self):
+        self.get(self.test_sales_team_member, self.url_client_list)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.create_client()
+        self.assertTrue(callbacks)
+
+        response, _ = self.get(self.test_sales_team_member, self.url_client_list)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+
+    @override_settings(
+        CACHES={
+            "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "responses": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "OPTIONS": {"MAX_ENTRIES": 2, "CULL_FREQUENCY": 2},
+            },
+        }
+    )
+    def test_response_cache_lru(self):
+        urls = [self.url_client_list + f"?page_size={size}" for size in (1, 2, 3)]
+        self.get(self.test_sales_team_member, urls[0])
+        self.get(self.test_sales_team_member, urls[1])
+        # The first response is now the most recently used
+        self.get(self.test_sales_team_member, urls[0])
+        self.get(self.test_sales_team_member, urls[2])
+
+        response, _ = self.get(self.test_sales_team_member, urls[0])
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+        response, _ = self.get(self.test_sales_team_member, urls[1])
+        self.assertEqual(response.headers["X-Cache"], "MISS")
@@ -0,0 +1,101 @@
+from io import StringIO
+from types import SimpleNamespace
+
+from django.core.management import call_command
+from django.db import connection
+
+from clients.models import Client
+from clients.views import ClientQuerysetMixin
+from contracts.models import Contract
+from contracts.views import ContractQuerysetMixin
+from events.models import Event
+from events.views import EventQuerysetMixin
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestRoleScopes(ProjectAPITestCase):
+    # Rows assigned to other users, so that the scoped rows are a small share
+    ROWS = 5000
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        clients = Client.objects.bulk_create(
+            Client(
+                company_name=f"Company {index}",
+                sales_contact=cls.test_sales_team_member_3,
+                first_name="First",
+                last_name="Last",
+                email=f"contact{index}@company.com",
+                status=cls.test_status_existing,
+            )
+            for index in range(cls.ROWS)
+        )
+        contracts = Contract.objects.bulk_create(
+            Contract(
+                client=client,
+                sales_contact=client.sales_contact,
+                status=cls.test_status_signed,
+                amount=1000,
+            )
+            for client in clients
+        )
+        Event.objects.bulk_create(
+            Event(
+                contract=contract,
+                sales_contact=contract.sales_contact,
+                support_contact=cls.test_support_team_member_3,
+                status=cls.test_status_created,
+            )
+            for contract in contracts
+        )
+        # A second contract with an event for the same client and support user
+        contract = Contract.objects.create(client=cls.test_client_1, amount=5000)
+        Event.objects.create(
+            contract=contract, support_contact=cls.test_support_team_member
+        )
+        # bulk_create does not send the signals maintaining the support access
+        call_command("support_access", stdout=StringIO())
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def get_scope(self, mixin_class, user):
+        mixin = mixin_class()
+        mixin.request = SimpleNamespace(user=user)
+        return mixin.get_queryset()
+
+    def test_role_scopes_use_indexes(self):
+        test_role_scopes_params = [
+            (
+                ClientQuerysetMixin,
+                self.test_support_team_member,
+                [self.test_client_1],
+                "supportaccess_client_idx",
+            ),
+            (
+                ContractQuerysetMixin,
+                self.test_support_team_member,
+                [self.test_contract_1, self.test_client_1.contracts.last()],
+                "supportaccess_contract_idx",
+            ),
+            (
+                EventQuerysetMixin,
+                self.test_sales_team_member,
+                [self.test_event_1, self.test_client_1.contracts.last().event],
+                "events_event_sales_contact_id",
+            ),
+        ]
+        for (
+            mixin_class,
+            user,
+            expected_items,
+            expected_index,
+        ) in test_role_scopes_params:
+            with self.subTest(mixin_class=mixin_class, user=user):
+                queryset = self.get_scope(mixin_class, user)
+
+                # Each item is listed once, whatever the number of related rows
+                self.assertEqual(list(queryset), expected_items)
+                plan = queryset.explain()
+                self.assertIn(expected_index, plan)
+                self.assertNotIn("Seq Scan", plan)
@@ -1,5 +1,8 @@
 import datetime
 import pytz
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse_lazy
 from rest_framework.test import APITestCase
 
@@ -9,6 +12,14 @@ from contracts.models import Contract, ContractStatus
 from events.models import Event, EventStatus
 
 
+# Responses are not cached, as the tests roll back their changes without
+# invalidating them. tests.test_response_cache enables the cache.
+# The replicas would not see the rows of the test's transaction. The token
+# states are not kept in the shared cache either, as for the responses.
+# tests.test_token_revocation enables them.
+@override_settings(
+    RESPONSE_CACHE_ALIAS=None, REPLICA_DATABASES=[], TOKEN_STATE_CACHE_ALIAS=None
+)
 class ProjectAPITestCase(APITestCase):
     @classmethod
     def setUpTestData(cls):
@@ -87,6 +98,7 @@ class ProjectAPITestCase(APITestCase):
         cls.url_client_detail = reverse_lazy(
             "client-detail", kwargs={"pk": cls.test_client_1.id}
         )
+        cls.url_client_status_list = reverse_lazy("client-status-list")
 
         # Define Contract Status
         cls.test_status_unsigned = ContractStatus.objects.get(
@@ -119,6 +131,7 @@ class ProjectAPITestCase(APITestCase):
         cls.url_contract_detail = reverse_lazy(
             "contract-detail", kwargs={"pk": cls.test_contract_1.id}
         )
+        cls.url_contract_status_list = reverse_lazy("contract-status-list")
 
         # Define Event Status
         cls.test_status_created = EventStatus.objects.get(status=EventStatus.CREATED)
@@ -143,11 +156,62 @@ class ProjectAPITestCase(APITestCase):
             status=cls.test_status_created,
         )
 
+        # The signals stamped the rows showing the contracts and events created
+        for instance in (
+            cls.test_client_1,
+            cls.test_client_2,
+            cls.test_contract_1,
+            cls.test_contract_2,
+        ):
+            instance.refresh_from_db(fields=["date_updated"])
+
         # Define Event Urls
         cls.url_event_list = reverse_lazy("event-list")
         cls.url_event_detail = reverse_lazy(
             "event-detail", kwargs={"pk": cls.test_event_1.id}
         )
+        cls.url_event_status_list = reverse_lazy("event-status-list")
+
+    def create_clients_with_contracts_and_events(
+        self, count, sales_contact=None, support_contact=None
+    ):
+        # Extra rows, assigned to the main test users by default
+        for index in range(count):
+            client = Client.objects.create(
+                company_name=f"Company {index}",
+                sales_contact=sales_contact or self.test_sales_team_member,
+                first_name="First",
+                last_name="Last",
+                email=f"contact{index}@company.com",
+                status=self.test_status_existing,
+            )
+            contract = Contract.objects.create(
+                client=client, status=self.test_status_signed, amount=1000
+            )
+            Event.objects.create(
+                contract=contract,
+                support_contact=support_contact or self.test_support_team_member,
+                status=self.test_status_in_process,
+            )
+
+    def count_queries(self, user, url):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assertListQueriesDoNotGrow(self, url, users):
+        # Warm the role and status lookups before counting
+        self.count_queries(users[0], url)
+        expected_counts = [self.count_queries(user, url) for user in users]
+        self.create_clients_with_contracts_and_events(10)
+        for user, expected_count in zip(users, expected_counts):
+            with self.subTest(user=user):
+                self.assertEqual(self.count_queries(user, url), expected_count)
+
+    def get_page(self, results, next_link=None, previous_link=None):
+        return {"next": next_link, "previous": previous_link, "results": results}
 
     def format_datetime(self, value):
         if value:
@@ -0,0 +1,115 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestSparseFields(ProjectAPITestCase):
+    def get(self, user, url):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def get_results(self, response):
+        data = response.json()
+        if isinstance(data, list):
+            return data
+        return data["results"] if "results" in data else [data]
+
+    def test_sparse_fields(self):
+        sales = self.test_sales_team_member
+        support = self.test_support_team_member
+        test_sparse_fields_params = [
+            # (user, url, fields)
+            (sales, self.url_client_list, ["id", "company_name"]),
+            (sales, self.url_client_detail, ["id", "email", "status_name"]),
+            (sales, self.url_client_status_list, ["status"]),
+            (sales, self.url_contract_list, ["id", "client"]),
+            (sales, self.url_contract_detail, ["amount", "event"]),
+            (support, self.url_event_list, ["id", "status"]),
+            (support, self.url_event_detail, ["id", "attendees", "contract"]),
+        ]
+        for user, url, fields in test_sparse_fields_params:
+            with self.subTest(url=url, fields=fields):
+                full_response, _ = self.get(user, url)
+                response, _ = self.get(user, f"{url}?fields={','.join(fields)}")
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    self.get_results(response),
+                    [
+                        {field_name: item[field_name] for field_name in fields}
+                        for item in self.get_results(full_response)
+                    ],
+                )
+
+    def test_sparse_fields_sql(self):
+        # Warm the role and status lookups before reading the queries
+        self.get(self.test_sales_team_member, self.url_client_list)
+
+        _, queries = self.get(
+            self.test_sales_team_member,
+            self.url_client_list + "?fields=id,company_name",
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("JOIN", queries[0])
+        self.assertNotIn('"email"', queries[0])
+
+        _, queries = self.get(
+            self.test_support_team_member, self.url_event_list + "?fields=id,status"
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertIn("events_eventstatus", queries[0])
+        self.assertNotIn("contracts_contract", queries[0])
+        self.assertNotIn('"notes"', queries[0])
+
+    def test_list_columns(self):
+        # Without ?fields=, lists still only read the columns they render
+        self.get(self.test_support_team_member, self.url_event_list)
+        _, queries = self.get(self.test_support_team_member, self.url_event_list)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"events_event"."contract_id"', queries[0])
+        self.assertNotIn('"notes"', queries[0])
+        self.assertNotIn('"attendees"', queries[0])
+
+        _, queries = self.get(self.test_support_team_member, self.url_event_detail)
+        self.assertIn('"notes"', queries[-1])
+
+    def test_joined_columns(self):
+        # The joined rows only read the columns rendered from them
+        test_joined_columns_params = [
+            (self.test_sales_team_member, self.url_contract_list),
+            (self.test_sales_team_member, self.url_contract_detail),
+            (self.test_support_team_member, self.url_event_list),
+            (self.test_support_team_member, self.url_event_detail),
+        ]
+        for user, url in test_joined_columns_params:
+            with self.subTest(url=url):
+                response, queries = self.get(user, url)
+                self.assertEqual(response.status_code, 200)
+                [query] = [
+                    query
+                    for query in queries
+                    if '"clients_client"."company_name"' in query
+                ]
+                self.assertNotIn('"clients_client"."email"', query)
+                self.assertIn('"authentication_user"."first_name"', query)
+                self.assertNotIn('"authentication_user"."password"', query)
+                self.assertNotIn('"authentication_user"."email"', query)
+
+    def test_sparse_fields_unknown(self):
+        response, _ = self.get(
+            self.test_sales_team_member, self.url_client_list + "?fields=id,secret"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": ["Unknown field: secret."]})
+
+    def test_sparse_fields_ignored_on_update(self):
+        self.client.force_authenticate(user=self.test_sales_team_member)
+        response = self.client.put(
+            self.url_contract_detail + "?fields=id",
+            data={"client": self.test_client_1.pk, "amount": 15000},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["amount"], "15000.00")
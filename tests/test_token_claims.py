@@ -0,0 +1,145 @@
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.authentication import JWTAuthentication
+from authentication.managers import CachedUserManager
+from authentication.models import User, UserRole
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestTokenClaims(ProjectAPITestCase):
+    def setUp(self):
+        User.objects.clear_cache()
+
+    def obtain_tokens(self, username="sales_tester"):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": username, "password": "s@l3s_73573r"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get(self, url, access):
+        return self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def refresh(self, refresh):
+        return self.client.post(reverse("token_refresh"), {"refresh": refresh})
+
+    def test_tokens_claim_role_and_version(self):
+        tokens = self.obtain_tokens()
+        access = AccessToken(tokens["access"])
+        self.assertEqual(access["role"], UserRole.SALES_TEAM)
+        self.assertEqual(access["token_version"], 0)
+
+        access = AccessToken(self.refresh(tokens["refresh"]).json()["access"])
+        self.assertEqual(access["role"], UserRole.SALES_TEAM)
+        self.assertEqual(access["token_version"], 0)
+
+    def test_claims_authenticate_without_reading_user(self):
+        access = self.obtain_tokens()["access"]
+        self.get(self.url_client_list, access)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get(self.url_client_list, access)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 2)
+        self.assertFalse(
+            [
+                query
+                for query in context.captured_queries
+                if query["sql"].startswith('SELECT "authentication_user"')
+            ]
+        )
+
+    def test_claims_user_reads_fields_from_cache(self):
+        access = AccessToken(self.obtain_tokens()["access"])
+        user = JWTAuthentication().get_user(access)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_role(UserRole.SALES_TEAM))
+            self.assertEqual(user.username, "sales_tester")
+            self.assertEqual(user.email, "test_sales@epic.com")
+        self.assertIsNot(JWTAuthentication().get_user(access), user)
+
+    def test_role_change_revokes_tokens(self):
+        tokens = self.obtain_tokens()
+        user = User.objects.get(username="sales_tester")
+        user.role = UserRole.objects.get(role=UserRole.SUPPORT_TEAM)
+        user.save()
+        self.assertEqual(user.token_version, 1)
+
+        self.assertEqual(
+            self.get(self.url_client_list, tokens["access"]).status_code, 401
+        )
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+        access = AccessToken(self.obtain_tokens()["access"])
+        self.assertEqual(access["role"], UserRole.SUPPORT_TEAM)
+        self.assertEqual(self.get(self.url_event_list, access).status_code, 200)
+
+    def test_revoke_tokens(self):
+        tokens = self.obtain_tokens()
+        legacy_access = AccessToken.for_user(self.test_sales_team_member)
+        self.assertEqual(self.get(self.url_client_list, legacy_access).status_code, 200)
+
+        with self.assertRaisesMessage(CommandError, "Unknown users: unknown."):
+            call_command("revoke_tokens", "sales_tester", "unknown", stdout=StringIO())
+        call_command("revoke_tokens", "sales_tester", stdout=StringIO())
+        self.assertEqual(
+            self.get(self.url_client_list, tokens["access"]).status_code, 401
+        )
+        self.assertEqual(self.get(self.url_client_list, legacy_access).status_code, 401)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+        # Unrelated changes do not revoke the tokens
+        tokens = self.obtain_tokens()
+        user = User.objects.get(username="sales_tester")
+        user.first_name = "Renamed"
+        user.save()
+        self.assertEqual(
+            self.get(self.url_client_list, tokens["access"]).status_code, 200
+        )
+
+    def test_deactivation_revokes_tokens(self):
+        tokens = self.obtain_tokens()
+        user = User.objects.get(username="sales_tester")
+        user.is_active = False
+        user.save()
+
+        self.assertEqual(
+            self.get(self.url_client_list, tokens["access"]).status_code, 401
+        )
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+    def test_user_cache(self):
+        pks = [self.test_sales_team_member.pk, self.test_support_team_member.pk]
+        with mock.patch.object(CachedUserManager, "cache_size", 1):
+            with self.assertNumQueries(3):
+                for pk in pks + pks[:1]:
+                    User.objects.get_cached(pk)
+            with self.assertNumQueries(0):
+                User.objects.get_cached(pks[0])
+
+        with mock.patch.object(CachedUserManager, "cache_timeout", -1):
+            with self.assertNumQueries(2):
+                User.objects.get_cached(pks[1])
+                User.objects.get_cached(pks[1])
+
+    async def test_async_claims(self):
+        tokens = await self.async_client.post(
+            reverse("token_obtain_pair"),
+            {"username": "support_tester", "password": "su990r7_73573r"},
+        )
+        headers = {"Authorization": f"Bearer {tokens.json()['access']}"}
+        with override_settings(ROOT_URLCONF=settings.ASGI_URLCONF):
+            response = await self.async_client.get(self.url_event_list, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        # Every event, for the Support Team
+        self.assertEqual(len(response.json()["results"]), 2)
@@ -0,0 +1,185 @@
+from datetime import timedelta
+from io import StringIO
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import F
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authentication.models import RevokedToken, User
+from EpicEvents_CRM.bloom import BloomFilter
+from tests.test_setup import ProjectAPITestCase
+
+
+class TestBloomFilter(SimpleTestCase):
+    def test_no_false_negatives(self):
+        bloom_filter = BloomFilter(1000, 0.01)
+        items = [str(uuid4()) for _ in range(1000)]
+        for item in items:
+            bloom_filter.add(item)
+        self.assertTrue(all(item in bloom_filter for item in items))
+
+        false_positives = sum(str(uuid4()) in bloom_filter for _ in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class TestTokenRevocation(ProjectAPITestCase):
+    def setUp(self):
+        User.objects.clear_cache()
+        RevokedToken.objects.clear_cache()
+
+    def obtain_tokens(self):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": "sales_tester", "password": "s@l3s_73573r"},
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def refresh(self, refresh):
+        return self.client.post(reverse("token_refresh"), {"refresh": refresh})
+
+    def revoke(self, refresh):
+        return self.client.post(reverse("token_revoke"), {"refresh": refresh})
+
+    def test_revoke(self):
+        tokens = self.obtain_tokens()
+        other_tokens = self.obtain_tokens()
+
+        self.assertEqual(self.revoke(tokens["refresh"]).status_code, 200)
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+        self.assertEqual(self.refresh(other_tokens["refresh"]).status_code, 200)
+        # Revoking twice is harmless
+        self.assertEqual(self.revoke(tokens["refresh"]).status_code, 200)
+        self.assertEqual(RevokedToken.objects.count(), 1)
+
+    def test_refresh_skips_table_when_not_revoked(self):
+        tokens = self.obtain_tokens()
+        self.revoke(self.obtain_tokens()["refresh"])
+        self.refresh(tokens["refresh"])
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.refresh(tokens["refresh"]).status_code, 200)
+        self.assertFalse(
+            [
+                query
+                for query in context.captured_queries
+                if "authentication_revokedtoken" in query["sql"]
+            ]
+        )
+
+    def test_revocation_by_other_worker(self):
+        tokens = self.obtain_tokens()
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 200)
+
+        # The filter of this worker lacks the tokens revoked by another one
+        # until the generation is bumped
+        jti = RefreshToken(tokens["refresh"])["jti"]
+        RevokedToken.objects.create(
+            jti=jti, expires_at=timezone.now() + timedelta(days=1)
+        )
+        self.assertFalse(RevokedToken.objects.is_revoked(jti))
+
+        RevokedToken.objects._bump_generation()
+        self.assertTrue(RevokedToken.objects.is_revoked(jti))
+        self.assertEqual(self.refresh(tokens["refresh"]).status_code, 401)
+
+    def test_expired_tokens_are_dropped(self):
+        RevokedToken.objects.create(
+            jti="expired", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertFalse(RevokedToken.objects.is_revoked("expired"))
+
+        RevokedToken.objects.revoke("revoked", timezone.now() + timedelta(days=1))
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["revoked"]
+        )
+        self.assertTrue(RevokedToken.objects.is_revoked("revoked"))
+
+
+@override_settings(TOKEN_STATE_CACHE_ALIAS="default")
+class TestTokenState(ProjectAPITestCase):
+    def setUp(self):
+        caches["default"].clear()
+        User.objects.clear_cache()
+        RevokedToken.objects.clear_cache()
+
+    def obtain_refresh_token(self, username="sales_tester"):
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": username, "password": "s@l3s_73573r"},
+        )
+        return response.json()["refresh"]
+
+    def refresh(self, refresh):
+        return self.client.post(reverse("token_refresh"), {"refresh": refresh})
+
+    def test_refresh_without_queries(self):
+        refresh = self.obtain_refresh_token()
+        self.assertEqual(self.refresh(refresh).status_code, 200)
+
+        # As a day later, when the user cache no longer has the user
+        User.objects.clear_cache()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.refresh(refresh).status_code, 200)
+
+    def test_committed_revocation(self):
+        refresh = self.obtain_refresh_token()
+        self.refresh(refresh)
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("revoke_tokens", "sales_tester", stdout=StringIO())
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.refresh(refresh).status_code, 401)
+        self.assertEqual(
+            User.objects.get_token_state(self.test_sales_team_member.pk), (1, True)
+        )
+
+    def test_rolled_back_revocation(self):
+        refresh = self.obtain_refresh_token()
+        self.refresh(refresh)
+        try:
+            with transaction.atomic():
+                call_command("revoke_tokens", "sales_tester", stdout=StringIO())
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(self.refresh(refresh).status_code, 200)
+        self.assertEqual(
+            User.objects.get_token_state(self.test_sales_team_member.pk), (0, True)
+        )
+
+    def test_deleted_user(self):
+        # Without clients, which protect their sales contact
+        refresh = self.obtain_refresh_token("sales_tester_3")
+        self.refresh(refresh)
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.test_sales_team_member_3.pk).delete()
+
+        self.assertEqual(self.refresh(refresh).status_code, 401)
+
+    def test_updated_in_bulk(self):
+        test_updated_in_bulk_params = [
+            ({"is_active": False}, {"is_active": True}),
+            ({"token_version": F("token_version") + 1}, {}),
+        ]
+        users = User.objects.filter(pk=self.test_sales_team_member.pk)
+        for values, restored_values in test_updated_in_bulk_params:
+            with self.subTest(values=values):
+                refresh = self.obtain_refresh_token()
+                self.refresh(refresh)
+                with self.captureOnCommitCallbacks(execute=True):
+                    users.update(**values)
+
+                with self.assertNumQueries(0):
+                    self.assertEqual(self.refresh(refresh).status_code, 401)
+                if restored_values:
+                    with self.captureOnCommitCallbacks(execute=True):
+                        users.update(**restored_values)